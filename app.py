@@ -1,162 +1,376 @@
 # Standard library imports
 import base64
+import datetime
+import gzip
+import hashlib
+import importlib
 import io
+import json
+import os
+import pickle
 import re
+import sys
+import tempfile
+import threading
+import time
 import warnings
-from datetime import datetime
-from io import StringIO
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial, wraps
+from importlib.util import find_spec
+from types import MappingProxyType
 
 # Third-party imports
 import dash
 import dash_bootstrap_components as dbc
+import flask
 import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from dash import dcc, html, Input, Output, State, dash_table
+from dash import dcc, html, Input, Output, State, ClientsideFunction, dash_table
+from plotly.io.json import to_json_plotly
 from plotly.subplots import make_subplots
-import statsmodels.api as sm
-from scipy.stats import gaussian_kde
-from sklearn.preprocessing import LabelEncoder
 
 # Suppress warnings
 warnings.filterwarnings("ignore")
 
 # We'll use lazy imports for heavier libraries to avoid circular imports and improve load time
-sklearn_modules = {}
-scipy_modules = {}
-statsmodels_modules = {}
-prophet_module = None
+_IMPORT_CACHE = {}
+
+def cached_import(module_path, item_name=None):
+    """Import a module (or one attribute of it) on first use and cache the result"""
+    key = (module_path, item_name)
+    obj = _IMPORT_CACHE.get(key)
+    if obj is not None:
+        return obj
+    module = sys.modules.get(module_path) or importlib.import_module(module_path)
+    obj = module if item_name is None else getattr(module, item_name)
+    _IMPORT_CACHE[key] = obj
+    return obj
+
+# Lookup tables for the lazy loaders: name -> (module path, attribute or None for the module itself)
+_SKLEARN = {
+    'LinearRegression': ('sklearn.linear_model', 'LinearRegression'),
+    'KNNImputer': ('sklearn.impute', 'KNNImputer'),
+    'OneHotEncoder': ('sklearn.preprocessing', 'OneHotEncoder'),
+    'base': ('sklearn', None),
+    'RandomForestClassifier': ('sklearn.ensemble', 'RandomForestClassifier'),
+    'StandardScaler': ('sklearn.preprocessing', 'StandardScaler'),
+    'train_test_split': ('sklearn.model_selection', 'train_test_split'),
+    'LabelEncoder': ('sklearn.preprocessing', 'LabelEncoder'),
+}
+
+_SCIPY = {
+    'chi2_contingency': ('scipy.stats', 'chi2_contingency'),
+    'ttest_ind': ('scipy.stats', 'ttest_ind'),
+    'f_oneway': ('scipy.stats', 'f_oneway'),
+    'pearsonr': ('scipy.stats', 'pearsonr'),
+    'spearmanr': ('scipy.stats', 'spearmanr'),
+    'probplot': ('scipy.stats', 'probplot'),
+    'gaussian_kde': ('scipy.stats', 'gaussian_kde'),
+    'stats': ('scipy.stats', None),
+}
+
+_STATSMODELS = {
+    'api': ('statsmodels.api', None),
+    'OLS': ('statsmodels.api', 'OLS'),
+    'seasonal_decompose': ('statsmodels.tsa.seasonal', 'seasonal_decompose'),
+    'ARIMA': ('statsmodels.tsa.arima.model', 'ARIMA'),
+    'lowess': ('statsmodels.nonparametric.smoothers_lowess', 'lowess'),
+}
+
+def _loaded(table):
+    """Return the already-imported entries of a lookup table"""
+    return {name: _IMPORT_CACHE[spec] for name, spec in table.items() if spec in _IMPORT_CACHE}
+
+# Heavy names that used to be imported eagerly at module level; resolved on first attribute access
+_LAZY = {
+    "sm": ("statsmodels.api", None),
+    "gaussian_kde": ("scipy.stats", "gaussian_kde"),
+    "LabelEncoder": ("sklearn.preprocessing", "LabelEncoder"),
+}
+
+def __getattr__(name):
+    """Module-level lazy attribute loader (PEP 562) for the heavy names listed in _LAZY"""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = cached_import(*_LAZY[name])
+    globals()[name] = value
+    return value
 
 def get_sklearn(module_name=None):
     """Lazy import for sklearn modules - imports only when a specific module is requested"""
-    global sklearn_modules
-
-    if module_name == 'LinearRegression' and 'LinearRegression' not in sklearn_modules:
-        from sklearn.linear_model import LinearRegression
-        sklearn_modules['LinearRegression'] = LinearRegression
-    elif module_name == 'KNNImputer' and 'KNNImputer' not in sklearn_modules:
-        from sklearn.impute import KNNImputer
-        sklearn_modules['KNNImputer'] = KNNImputer
-    elif module_name == 'OneHotEncoder' and 'OneHotEncoder' not in sklearn_modules:
-        from sklearn.preprocessing import OneHotEncoder
-        sklearn_modules['OneHotEncoder'] = OneHotEncoder
-    elif module_name == 'base' and 'base' not in sklearn_modules:
-        import sklearn
-        sklearn_modules['base'] = sklearn
-    elif module_name == 'RandomForestClassifier' and 'RandomForestClassifier' not in sklearn_modules:
-        from sklearn.ensemble import RandomForestClassifier
-        sklearn_modules['RandomForestClassifier'] = RandomForestClassifier
-    elif module_name == 'StandardScaler' and 'StandardScaler' not in sklearn_modules:
-        from sklearn.preprocessing import StandardScaler
-        sklearn_modules['StandardScaler'] = StandardScaler
-    elif module_name == 'train_test_split' and 'train_test_split' not in sklearn_modules:
-        from sklearn.model_selection import train_test_split
-        sklearn_modules['train_test_split'] = train_test_split
-
-    if module_name:
-        if module_name not in sklearn_modules:
-            return None
-        return sklearn_modules[module_name]
-    return sklearn_modules
+    if not module_name:
+        return _loaded(_SKLEARN)
+    spec = _SKLEARN.get(module_name)
+    return cached_import(*spec) if spec else None
 
 def get_scipy(module_name=None):
     """Lazy import for scipy modules"""
-    global scipy_modules
-
-    # Only import a specific module when requested
-    if module_name == 'chi2_contingency' and 'chi2_contingency' not in scipy_modules:
-        try:
-            # Import directly instead of through stats
-            from scipy.stats._stats_py import chi2_contingency
-            scipy_modules['chi2_contingency'] = chi2_contingency
-        except ImportError:
-            # Fallback method if the first approach doesn't work
-            import importlib
-            stats_module = importlib.import_module('scipy.stats')
-            scipy_modules['chi2_contingency'] = getattr(stats_module, 'chi2_contingency')
-
-    elif module_name == 'ttest_ind' and 'ttest_ind' not in scipy_modules:
-        from scipy.stats import ttest_ind
-        scipy_modules['ttest_ind'] = ttest_ind
-
-    elif module_name == 'f_oneway' and 'f_oneway' not in scipy_modules:
-        from scipy.stats import f_oneway
-        scipy_modules['f_oneway'] = f_oneway
-
-    elif module_name == 'pearsonr' and 'pearsonr' not in scipy_modules:
-        from scipy.stats import pearsonr
-        scipy_modules['pearsonr'] = pearsonr
-
-    elif module_name == 'spearmanr' and 'spearmanr' not in scipy_modules:
-        from scipy.stats import spearmanr
-        scipy_modules['spearmanr'] = spearmanr
-
-    elif module_name == 'probplot' and 'probplot' not in scipy_modules:
-        from scipy.stats import probplot
-        scipy_modules['probplot'] = probplot
-
-    elif module_name == 'gaussian_kde' and 'gaussian_kde' not in scipy_modules:
-        from scipy.stats import gaussian_kde
-        scipy_modules['gaussian_kde'] = gaussian_kde
-
-    elif module_name == 'stats' and 'stats' not in scipy_modules:
-        import scipy.stats
-        scipy_modules['stats'] = scipy.stats
-
-    if module_name:
-        if module_name not in scipy_modules:
-            return None
-        return scipy_modules[module_name]
-    return scipy_modules
+    if not module_name:
+        return _loaded(_SCIPY)
+    spec = _SCIPY.get(module_name)
+    return cached_import(*spec) if spec else None
 
 def get_statsmodels(module_name=None):
     """Lazy import for statsmodels modules - imports only when a specific module is requested"""
-    global statsmodels_modules
-
-    if module_name == 'api' and 'api' not in statsmodels_modules:
-        import statsmodels.api as sm
-        statsmodels_modules['api'] = sm
-    elif module_name == 'OLS' and 'OLS' not in statsmodels_modules:
-        from statsmodels.api import OLS
-        statsmodels_modules['OLS'] = OLS
-    elif module_name == 'seasonal_decompose' and 'seasonal_decompose' not in statsmodels_modules:
-        from statsmodels.tsa.seasonal import seasonal_decompose
-        statsmodels_modules['seasonal_decompose'] = seasonal_decompose
-    elif module_name == 'ARIMA' and 'ARIMA' not in statsmodels_modules:
-        from statsmodels.tsa.arima.model import ARIMA
-        statsmodels_modules['ARIMA'] = ARIMA
-
-    if module_name:
-        if module_name not in statsmodels_modules:
-            return None
-        return statsmodels_modules[module_name]
-    return statsmodels_modules
+    if not module_name:
+        return _loaded(_STATSMODELS)
+    spec = _STATSMODELS.get(module_name)
+    return cached_import(*spec) if spec else None
 
+@lru_cache(maxsize=1)
 def get_prophet():
-    """Lazy import for Prophet - only imports when needed and caches the result"""
-    global prophet_module
+    """Lazy import for Prophet - only imports when needed; the result (or None if missing) is cached"""
+    if find_spec("prophet") is None:
+        return None
+    try:
+        from prophet import Prophet # type: ignore
+    except ImportError:
+        return None
+    return Prophet
+
+@lru_cache(maxsize=1)
+def get_figure_resampler():
+    """Lazy import for plotly-resampler's FigureResampler - returns None when the package isn't installed"""
+    if find_spec("plotly_resampler") is None:
+        return None
+    from plotly_resampler import FigureResampler # type: ignore
+    return FigureResampler
 
-    if prophet_module is None:
+def read_csv_bytes(decoded, **kwargs):
+    """Parse uploaded CSV bytes - pyarrow's multithreaded reader when available, pandas' C parser otherwise"""
+    if find_spec("pyarrow") is not None:
         try:
-            # Only attempt to import if it hasn't been tried before
-            from prophet import Prophet # type: ignore
-            prophet_module = Prophet
-        except ImportError:
-            # If Prophet is not installed, cache the failure so we don't try again
-            prophet_module = False
+            df = pd.read_csv(io.BytesIO(decoded), engine="pyarrow", **kwargs)
+        except Exception:
+            # Unusable pyarrow build or input the Arrow reader rejects; fall through to the C parser
+            pass
+        else:
+            # Arrow infers ISO dates/times where the C parser keeps the text; such files take the C parser
+            # so the dtypes (and the conversion suggestions built on them) stay the same
+            if not any(is_arrow_temporal(df[column]) for column in df.columns):
+                return df
+    return pd.read_csv(io.BytesIO(decoded), encoding="utf-8", **kwargs)
+
+def is_arrow_temporal(series):
+    """Whether a column read by the pyarrow engine came out as dates, times or timestamps"""
+    if pd.api.types.is_datetime64_any_dtype(series) or pd.api.types.is_timedelta64_dtype(series):
+        return True
+    if series.dtype != object:
+        return False
+    first = series.first_valid_index()
+    return first is not None and isinstance(series[first], (datetime.date, datetime.time))
 
-    # Return the module or None if import failed
-    return prophet_module if prophet_module is not False else None
+def df_to_store(df):
+    """Serialize a DataFrame for a dcc.Store - Arrow IPC (base64) when pyarrow is installed, compact split JSON otherwise"""
+    if find_spec("pyarrow") is not None:
+        try:
+            pa = cached_import("pyarrow")
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            buffer = io.BytesIO()
+            with pa.ipc.new_stream(buffer, table.schema) as writer:
+                writer.write_table(table)
+            return {"format": "arrow", "rows": len(df), "data": base64.b64encode(buffer.getvalue()).decode("ascii")}
+        except Exception:
+            # Mixed-type object columns can't be converted to Arrow; use the JSON layout instead
+            pass
+    split = df.to_dict("split")
+    return {"format": "split", "columns": split["columns"], "data": split["data"]}
+
+def _arrow_table_from_store(payload, rows=None):
+    """Decode an Arrow store payload into a pyarrow Table, sliced to `rows` without copying"""
+    pa = cached_import("pyarrow")
+    table = pa.ipc.open_stream(io.BytesIO(base64.b64decode(payload["data"]))).read_all()
+    if rows is not None:
+        start, stop, _ = rows.indices(table.num_rows)
+        table = table.slice(start, max(stop - start, 0))
+    return table
+
+def df_from_store(payload, rows=None):
+    """Inverse of df_to_store; also accepts plain list-of-records payloads.
+    `rows` (a slice) limits which rows are converted, so previews don't build the full DataFrame"""
+    if isinstance(payload, dict) and payload.get("format") == "arrow":
+        return _arrow_table_from_store(payload, rows).to_pandas()
+    if isinstance(payload, dict) and payload.get("format") == "split":
+        data = payload["data"] if rows is None else payload["data"][rows]
+        return pd.DataFrame(data, columns=payload["columns"])
+    return pd.DataFrame(payload if rows is None else payload[rows])
+
+def records_from_store(payload, rows=None):
+    """DataTable records and column names for (a slice of) a store payload.
+    Arrow payloads go straight from the Arrow table to Python rows, skipping pandas"""
+    if isinstance(payload, dict) and payload.get("format") == "arrow":
+        table = _arrow_table_from_store(payload, rows)
+        return table.to_pylist(), table.column_names
+    df = df_from_store(payload, rows)
+    return df.to_dict("records"), list(df.columns)
+
+class LRUCache:
+    """Bounded least-recently-used mapping for the module-level result caches.
+    Callbacks run concurrently on Flask's threaded server, so every lookup and insert holds a lock"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def put(self, key, value):
+        """Store value under key, evicting the least recently used entry when full; returns value"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+# Marks a cache miss for caches whose values may legitimately be None
+_MISSING = object()
+
+# DataFrames rebuilt from store payloads, keyed by a hash of the payload
+_FRAME_CACHE = LRUCache(8)
+
+def store_digest(payload):
+    """Content hash of a store payload, or None when it can't be serialized cheaply"""
+    if isinstance(payload, dict) and payload.get("format") == "arrow":
+        serialized = payload["data"].encode("ascii")
+    elif find_spec("orjson") is not None:
+        orjson = cached_import("orjson")
+        try:
+            serialized = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            return None
+    else:
+        return None
+    return hashlib.blake2b(serialized, digest_size=16).hexdigest()
+
+def frame_from_store(payload):
+    """df_from_store(payload), reusing the frame built the last time the same payload came in.
+    Returns a copy, so callers are free to modify it"""
+    key = store_digest(payload)
+    if key is None:
+        return df_from_store(payload)
+
+    df = _FRAME_CACHE.get(key)
+    if df is None:
+        df = _FRAME_CACHE.put(key, df_from_store(payload))
+    return df.copy()
+
+def store_num_rows(payload):
+    """Row count of a df_to_store / records payload without building the DataFrame"""
+    if isinstance(payload, dict) and payload.get("format") == "arrow":
+        return payload["rows"]
+    if isinstance(payload, dict) and payload.get("format") == "split":
+        return len(payload["data"])
+    return len(payload)
+
+@lru_cache(maxsize=32)
+def table_columns(column_names):
+    """DataTable column definitions, built once per distinct tuple of column names"""
+    return [{"name": col, "id": col} for col in column_names]
+
+# One `{column} op value` clause of a DataTable filter_query; operators may carry an s/i (case) prefix
+FILTER_PATTERN = re.compile(
+    r"\s*\{(?P<column>.+?)\}\s+(?P<case>[si]?)(?P<operator>ge|le|lt|gt|ne|eq|contains|datestartswith|>=|<=|<|>|!=|=)\s+(?P<value>.*?)\s*$"
+)
+# Symbolic operators mapped to their pandas comparison method names
+FILTER_OPERATOR_ALIASES = {">=": "ge", "<=": "le", "<": "lt", ">": "gt", "!=": "ne", "=": "eq"}
+
+def split_filter_part(filter_part):
+    """Split one clause of a DataTable filter_query into (column, operator, value, case-insensitive flag).
+    Text operators (contains, datestartswith) keep the value as typed; comparisons get a float when it parses as one"""
+    match = FILTER_PATTERN.match(filter_part)
+    if match is None:
+        return None, None, None, False
+    operator = FILTER_OPERATOR_ALIASES.get(match["operator"], match["operator"])
+    value_part = match["value"]
+    quote = value_part[:1]
+    if quote in ("'", '"', "`") and len(value_part) > 1 and value_part.endswith(quote):
+        value = value_part[1:-1].replace("\\" + quote, quote)
+    elif operator in ("contains", "datestartswith"):
+        value = value_part
+    else:
+        try:
+            value = float(value_part)
+        except ValueError:
+            value = value_part
+    return match["column"], operator, value, match["case"] == "i"
+
+def filter_dataframe(df, filter_query):
+    """Apply a DataTable filter_query (custom filter_action) to a DataFrame"""
+    for filter_part in (filter_query or "").split(" && "):
+        col_name, operator, value, ignore_case = split_filter_part(filter_part)
+        if col_name not in df.columns:
+            continue
+        column = df[col_name]
+        if ignore_case and isinstance(value, str):
+            # "i"-prefixed operators (icontains, ieq, ...) compare lower-cased text
+            column = column.astype(str).str.lower()
+            value = value.lower()
+        if operator == "contains":
+            df = df.loc[column.astype(str).str.contains(value, regex=False)]
+        elif operator == "datestartswith":
+            df = df.loc[column.astype(str).str.startswith(value)]
+        else:
+            try:
+                df = df.loc[getattr(column, operator)(value)]
+            except TypeError:
+                # Values that can't be compared (text against a number) match nothing
+                df = df.iloc[0:0]
+    return df
+
+def page_records(df, page_current, page_size, sort_by=None, filter_query=None):
+    """Filter, sort and slice a DataFrame down to one DataTable page; returns (records, page_count)"""
+    df = filter_dataframe(df, filter_query)
+    if sort_by:
+        df = df.sort_values(
+            [sort["column_id"] for sort in sort_by],
+            ascending=[sort["direction"] == "asc" for sort in sort_by],
+        )
+    page_size = page_size or 10
+    page_count = max(-(-len(df) // page_size), 1)
+    start = (page_current or 0) * page_size
+    return df.iloc[start:start + page_size].to_dict("records"), page_count
+
+# Results of statistical tests, keyed by function, parameters and a content hash of the numeric inputs
+_STATS_CACHE = LRUCache(128)
+
+def cached_stat(func, *arrays, **params):
+    """Call a statistics function, reusing the result when it is called again with identical data and parameters"""
+    arrays = [np.asarray(array) for array in arrays]
+    if any(array.dtype == object for array in arrays):
+        # Object arrays can't be hashed by their buffer; compute directly
+        return func(*arrays, **params)
+
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        digest.update(f"{array.dtype}{array.shape}".encode())
+        digest.update(np.ascontiguousarray(array).tobytes())
+    key = (func.__module__, func.__qualname__, digest.hexdigest(), tuple(sorted(params.items())))
+
+    result = _STATS_CACHE.get(key, _MISSING)
+    if result is _MISSING:
+        result = _STATS_CACHE.put(key, func(*arrays, **params))
+    return result
 
 # Initialize the Dash app with a dark theme
 app = dash.Dash(
     __name__,
     external_stylesheets=[
-        dbc.themes.DARKLY,
-        "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/5.15.4/css/all.min.css"
+        dbc.themes.DARKLY
     ],
     serve_locally=True,
+    # gzip layout, callback and asset responses when flask-compress is installed
+    compress=find_spec("flask_compress") is not None,
     suppress_callback_exceptions=True,
     # assets_folder="assets",
     # include_assets_files=True,
@@ -165,7 +379,21 @@ app = dash.Dash(
 )
 app.title = "Data Analysis Dashboard"
 
-# Define custom index string with CSS animation keyframes
+# Dash serializes layouts and callback payloads through plotly's JSON layer; use orjson for it when installed
+if find_spec("orjson") is not None:
+    import orjson
+    import plotly.io as pio
+    from flask.json.provider import DefaultJSONProvider
+    pio.json.config.default_engine = "orjson"
+
+    class OrjsonProvider(DefaultJSONProvider):
+        """Flask JSON provider that parses request bodies (incoming callback payloads, store data included) with orjson"""
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.server.json = OrjsonProvider(app.server)
+
+# Define custom index string (styles and animation keyframes live in assets/dashboard.css)
 app.index_string = '''
 <!DOCTYPE html>
 <html>
@@ -174,576 +402,6 @@ app.index_string = '''
         <title>{%title%}</title>
         {%favicon%}
         {%css%}
-        <style>
-            :root {
-                --primary: #1abc9c;
-                --primary-hover: #16a085;
-                --primary-light: rgba(26, 188, 156, 0.2);
-                --primary-shadow: rgba(26, 188, 156, 0.4);
-                --dark-bg: #121212;
-                --card-bg: #1d2731;
-                --sidebar-bg: #0d1620;
-                --text-primary: #f5f5f5;
-                --text-secondary: #adb5bd;
-                --border-color: rgba(255, 255, 255, 0.1);
-                --card-radius: 12px;
-                --transition-speed: 0.2s;
-                --nav-hover-grad: linear-gradient(90deg, rgba(26, 188, 156, 0.15) 0%, rgba(26, 188, 156, 0.0) 100%);
-                --nav-active-color: #1abc9c;
-                --nav-button-bg: #101d2c;
-                --nav-button-hover-bg: rgba(26, 188, 156, 0.08);
-                --nav-active-bg: #15283f;
-                --active-indicator: #1abc9c;
-                --category-heading: #767f88;
-            }
-
-            body {
-                background-color: var(--dark-bg);
-                color: var(--text-primary);
-                font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
-            }
-
-            /* Override Bootstrap primary color */
-            .btn-primary {
-                background-color: var(--primary) !important;
-                border-color: var(--primary) !important;
-            }
-
-            .btn-primary:hover, .btn-primary:focus, .btn-primary:active {
-                background-color: var(--primary-hover) !important;
-                border-color: var(--primary-hover) !important;
-                transform: translateY(-1px);
-                box-shadow: 0 4px 8px rgba(0, 0, 0, 0.15);
-            }
-
-            /* FAQ Accordion Styling */
-            .faq-accordion-item .accordion-button {
-                color: var(--primary) !important;
-                font-weight: 500 !important;
-            }
-
-            .faq-accordion-item .accordion-button:not(.collapsed) {
-                background-color: var(--primary-light) !important;
-            }
-
-            .faq-accordion-item .accordion-button:focus {
-                box-shadow: 0 0 0 0.25rem var(--primary-shadow) !important;
-            }
-
-            /* Card styling */
-            .card {
-                background-color: var(--card-bg) !important;
-                border: 1px solid var(--border-color) !important;
-                border-radius: var(--card-radius) !important;
-                box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1) !important;
-                transition: transform var(--transition-speed), box-shadow var(--transition-speed) !important;
-                overflow: hidden !important;
-            }
-
-            .card:hover {
-                transform: translateY(-2px) !important;
-                box-shadow: 0 6px 12px rgba(0, 0, 0, 0.15) !important;
-            }
-
-            .card-header {
-                background-color: rgba(0, 0, 0, 0.2) !important;
-                border-bottom: 1px solid var(--border-color) !important;
-                font-weight: 600 !important;
-            }
-
-            /* Enhanced Nav styling */
-            .nav-button {
-                transition: all 0.3s cubic-bezier(0.175, 0.885, 0.32, 1.275) !important;
-                border-radius: 8px !important;
-                margin-bottom: 6px !important;
-                position: relative !important;
-                overflow: hidden !important;
-                padding: 12px 16px !important;
-                backdrop-filter: blur(5px) !important;
-                -webkit-backdrop-filter: blur(5px) !important;
-                background-color: var(--nav-button-bg) !important;
-                background-image: linear-gradient(to bottom, rgba(255, 255, 255, 0.03) 0%, rgba(0, 0, 0, 0.05) 100%) !important;
-                border-left: 3px solid transparent !important;
-                transform: translateZ(0) !important;
-                font-size: 14px !important;
-                letter-spacing: 0.3px !important;
-            }
-
-            .nav-button::before {
-                content: "" !important;
-                position: absolute !important;
-                top: 0 !important;
-                left: -100% !important;
-                width: 100% !important;
-                height: 100% !important;
-                background: linear-gradient(90deg,
-                    rgba(26, 188, 156, 0.0) 0%,
-                    rgba(26, 188, 156, 0.1) 50%,
-                    rgba(26, 188, 156, 0.0) 100%) !important;
-                transition: all 0.5s ease !important;
-                z-index: -1 !important;
-            }
-
-            .nav-button:hover {
-                background-color: var(--nav-button-hover-bg) !important;
-                color: var(--primary) !important;
-                transform: translateX(5px) !important;
-                box-shadow: 0 2px 8px rgba(26, 188, 156, 0.15) !important;
-            }
-
-            .nav-button:hover::before {
-                left: 100% !important;
-                transition: all 0.5s ease !important;
-            }
-
-            .nav-button.active {
-                background-color: var(--nav-active-bg) !important;
-                color: var(--nav-active-color) !important;
-                font-weight: 500 !important;
-                border-left: 3px solid var(--active-indicator) !important;
-                box-shadow: 0 2px 10px rgba(26, 188, 156, 0.2) !important;
-                animation: subtle-glow 2s infinite alternate !important;
-            }
-
-            .nav-button.active::after {
-                content: "" !important;
-                position: absolute !important;
-                top: 0 !important;
-                left: 0 !important;
-                width: 3px !important;
-                height: 100% !important;
-                background-color: var(--active-indicator) !important;
-                animation: border-pulse 2s infinite !important;
-            }
-
-            .nav-button.active::before {
-                animation: nav-hover-animation 3s ease infinite !important;
-                background: linear-gradient(90deg,
-                    rgba(26, 188, 156, 0.0) 0%,
-                    rgba(26, 188, 156, 0.15) 50%,
-                    rgba(26, 188, 156, 0.0) 100%) !important;
-                background-size: 200% 100% !important;
-                left: 0 !important;
-            }
-
-            @keyframes subtle-glow {
-                0% { box-shadow: 0 2px 10px rgba(26, 188, 156, 0.2); }
-                100% { box-shadow: 0 4px 15px rgba(26, 188, 156, 0.5); }
-            }
-
-            @keyframes slide-in {
-                0% { transform: translateX(-20px); opacity: 0; }
-                100% { transform: translateX(0); opacity: 1; }
-            }
-
-            @keyframes nav-hover-animation {
-                0% { background-position: 0% 50%; }
-                50% { background-position: 100% 50%; }
-                100% { background-position: 0% 50%; }
-            }
-
-            @keyframes icon-pulse {
-                0% { transform: scale(1); }
-                50% { transform: scale(1.2); }
-                100% { transform: scale(1); }
-            }
-
-            @keyframes border-glow {
-                0% { border-color: rgba(26, 188, 156, 0.6); }
-                50% { border-color: rgba(26, 188, 156, 1); }
-                100% { border-color: rgba(26, 188, 156, 0.6); }
-            }
-
-            .nav-button i {
-                transition: transform 0.3s cubic-bezier(0.68, -0.55, 0.265, 1.55) !important;
-                margin-right: 12px !important;
-                width: 20px !important;
-                text-align: center !important;
-                color: rgba(255, 255, 255, 0.8) !important;
-                text-shadow: 0 1px 2px rgba(0, 0, 0, 0.2) !important;
-            }
-
-            .nav-button:hover i {
-                transform: scale(1.2) !important;
-                color: var(--primary) !important;
-                animation: icon-pulse 1.5s infinite !important;
-                text-shadow: 0 0 8px rgba(26, 188, 156, 0.5) !important;
-            }
-
-            .nav-button.active i {
-                color: var(--primary) !important;
-                animation: icon-pulse 2s infinite !important;
-                text-shadow: 0 0 10px rgba(26, 188, 156, 0.6) !important;
-            }
-
-            @keyframes pulse-icon {
-                0% { transform: scale(1); }
-                50% { transform: scale(1.3); }
-                100% { transform: scale(1.2); }
-            }
-
-            /* Nav divider effect */
-            .nav-pills {
-                position: relative !important;
-            }
-
-            .nav-pills::after {
-                content: "";
-                position: absolute;
-                bottom: 0;
-                left: 10%;
-                width: 80%;
-                height: 1px;
-                background: linear-gradient(90deg, transparent, var(--border-color), transparent);
-            }
-
-            /* Custom components */
-            input[type="checkbox"]:checked,
-            .custom-control-input:checked ~ .custom-control-label::before {
-                background-color: var(--primary) !important;
-                border-color: var(--primary) !important;
-            }
-
-            /* Dropdowns */
-            .dropdown-menu {
-                background-color: var(--card-bg) !important;
-                border: 1px solid var(--border-color) !important;
-                box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2) !important;
-                border-radius: 8px !important;
-                overflow: hidden !important;
-            }
-
-            .dropdown-item:hover, .dropdown-item:focus {
-                background-color: var(--primary-light) !important;
-                color: var(--primary) !important;
-            }
-
-            /* Dash dropdown specific styling */
-            .Select-control, .Select--single > .Select-control .Select-value {
-                background-color: #16213e !important;
-                color: var(--text-primary) !important;
-                border: 1px solid rgba(255, 255, 255, 0.1) !important;
-                border-radius: 8px !important;
-                box-shadow: none !important;
-                height: 40px !important;
-                padding: 4px 8px !important;
-                display: flex !important;
-                align-items: center !important;
-            }
-
-            .Select-control:hover, .is-focused:not(.is-open) > .Select-control {
-                border-color: var(--primary) !important;
-                box-shadow: 0 0 0 1px var(--primary-shadow) !important;
-            }
-
-            .Select.is-focused > .Select-control {
-                background-color: var(--card-bg) !important;
-            }
-
-            .Select-menu-outer {
-                background-color: var(--card-bg) !important;
-                border: 1px solid var(--border-color) !important;
-                border-radius: 8px !important;
-                margin-top: 4px !important;
-                box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2) !important;
-                z-index: 9999 !important; /* Ensure high z-index for all dropdown menus */
-                position: absolute !important;
-                width: 100% !important;
-                max-height: 300px !important; /* Ensure enough height for options */
-            }
-
-            .Select-option {
-                background-color: var(--card-bg) !important;
-                color: var(--text-primary) !important;
-                padding: 10px 16px !important;
-                white-space: nowrap !important;
-                overflow: hidden !important;
-                text-overflow: ellipsis !important;
-                width: 100% !important;
-                box-sizing: border-box !important;
-            }
-
-            .Select-option.is-selected {
-                background-color: var(--primary-light) !important;
-                color: var(--primary) !important;
-            }
-
-            .Select-option:hover, .Select-option.is-focused {
-                background-color: var(--primary-light) !important;
-                color: var(--primary) !important;
-            }
-
-            .Select-value-label, .Select-value-label > span {
-                color: var(--text-primary) !important;
-                font-size: 14px !important;
-                font-weight: normal !important;
-                padding: 2px 0 !important;
-            }
-
-            .Select-value {
-                padding-left: 8px !important;
-                display: flex !important;
-                align-items: center !important;
-            }
-
-            .Select-placeholder {
-                color: var(--text-secondary) !important;
-            }
-
-            .Select-clear-zone {
-                color: var(--text-secondary) !important;
-            }
-
-            .Select-clear-zone:hover {
-                color: #e74c3c !important;
-            }
-
-            .Select-arrow {
-                border-color: var(--text-secondary) transparent transparent !important;
-                border-width: 5px 5px 2.5px !important;
-                margin-top: -2.5px !important;
-                opacity: 0.7 !important;
-            }
-
-            .Select.is-open > .Select-control .Select-arrow {
-                border-color: transparent transparent var(--primary) !important;
-                border-width: 2.5px 5px 5px !important;
-                margin-top: -2.5px !important;
-            }
-
-            /* VirtualizedSelect specific styles */
-            .VirtualizedSelectOption {
-                background-color: var(--card-bg) !important;
-                color: var(--text-primary) !important;
-            }
-
-            .VirtualizedSelectFocusedOption {
-                background-color: var(--primary-light) !important;
-                color: var(--primary) !important;
-            }
-
-            /* Table styling */
-            .table {
-                --bs-table-bg: transparent !important;
-                border-radius: 8px !important;
-                overflow: hidden !important;
-            }
-
-            .table thead th {
-                background-color: rgba(0, 0, 0, 0.2) !important;
-                color: var(--primary) !important;
-                font-weight: 600 !important;
-                text-transform: uppercase !important;
-                font-size: 0.8rem !important;
-                letter-spacing: 0.5px !important;
-            }
-
-            .table tbody tr:hover {
-                background-color: rgba(26, 188, 156, 0.05) !important;
-            }
-
-            /* Scrollbar styling */
-            ::-webkit-scrollbar {
-                width: 8px;
-                height: 8px;
-            }
-
-            ::-webkit-scrollbar-track {
-                background: rgba(0, 0, 0, 0.2);
-                border-radius: 10px;
-            }
-
-            ::-webkit-scrollbar-thumb {
-                background: rgba(255, 255, 255, 0.2);
-                border-radius: 10px;
-            }
-
-            ::-webkit-scrollbar-thumb:hover {
-                background: var(--primary);
-            }
-
-            @keyframes pulse {
-                0% {
-                    box-shadow: 0 0 0 0 var(--primary-shadow);
-                }
-                70% {
-                    box-shadow: 0 0 0 10px rgba(26, 188, 156, 0);
-                }
-                100% {
-                    box-shadow: 0 0 0 0 rgba(26, 188, 156, 0);
-                }
-            }
-
-            /* Form controls */
-            .form-control, .form-select {
-                background-color: rgba(0, 0, 0, 0.2) !important;
-                border: 1px solid var(--border-color) !important;
-                color: var(--text-primary) !important;
-                border-radius: 8px !important;
-            }
-
-            .form-control:focus, .form-select:focus {
-                border-color: var(--primary) !important;
-                box-shadow: 0 0 0 0.25rem var(--primary-shadow) !important;
-            }
-
-            /* Upload styling */
-            .upload-area {
-                border: 2px dashed var(--border-color) !important;
-                border-radius: 12px !important;
-                background-color: rgba(0, 0, 0, 0.2) !important;
-                transition: all var(--transition-speed) !important;
-            }
-
-            .upload-area:hover {
-                border-color: var(--primary) !important;
-                background-color: rgba(26, 188, 156, 0.05) !important;
-            }
-
-            /* Dash table styling */
-            .dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner table {
-                background-color: var(--card-bg) !important;
-            }
-
-            .dash-table-container .dash-spreadsheet-container .dash-spreadsheet-inner th {
-                background-color: rgba(0, 0, 0, 0.2) !important;
-                color: var(--primary) !important;
-            }
-
-            .dash-cell-value {
-                background-color: var(--card-bg) !important;
-                color: var(--text-primary) !important;
-            }
-
-            .dash-filter, .dash-spreadsheet input {
-                background-color: var(--card-bg) !important;
-                color: var(--text-primary) !important;
-                border: 1px solid var(--border-color) !important;
-            }
-
-            @keyframes title-glow {
-                0% { text-shadow: 0 0 5px rgba(26, 188, 156, 0.3); }
-                50% { text-shadow: 0 0 15px rgba(26, 188, 156, 0.6); }
-                100% { text-shadow: 0 0 5px rgba(26, 188, 156, 0.3); }
-            }
-
-            @keyframes gradient-text {
-                0% { background-position: 0% 50%; }
-                50% { background-position: 100% 50%; }
-                100% { background-position: 0% 50%; }
-            }
-
-            @keyframes fade-in {
-                0% { opacity: 0; transform: translateY(10px); }
-                100% { opacity: 1; transform: translateY(0); }
-            }
-
-            @keyframes slight-bounce {
-                0% { transform: translateY(0); }
-                50% { transform: translateY(-5px); }
-                100% { transform: translateY(0); }
-            }
-
-            @keyframes border-pulse {
-                0% { border-color: rgba(26, 188, 156, 0.7); }
-                50% { border-color: rgba(26, 188, 156, 1); }
-                100% { border-color: rgba(26, 188, 156, 0.7); }
-            }
-
-            /* Nav category styles */
-            .nav-category {
-                margin-bottom: 15px !important;
-                position: relative !important;
-            }
-
-            .nav-category-title {
-                font-size: 11px !important;
-                font-weight: 500 !important;
-                letter-spacing: 1px !important;
-                color: var(--category-heading) !important;
-                padding-left: 15px !important;
-                margin-bottom: 8px !important;
-                text-transform: uppercase !important;
-                position: relative !important;
-                display: flex !important;
-                align-items: center !important;
-            }
-
-            .nav-category-title::before {
-                content: "" !important;
-                height: 3px !important;
-                width: 3px !important;
-                border-radius: 50% !important;
-                background: var(--primary) !important;
-                display: inline-block !important;
-                margin-right: 8px !important;
-                box-shadow: 0 0 5px var(--primary) !important;
-            }
-
-            .nav-category .nav-pills {
-                padding-left: 8px !important;
-            }
-
-            @keyframes subtle-glow {
-                0% { box-shadow: 0 2px 10px rgba(26, 188, 156, 0.2); }
-                100% { box-shadow: 0 4px 15px rgba(26, 188, 156, 0.5); }
-            }
-
-            @keyframes slide-in {
-                0% { transform: translateX(-20px); opacity: 0; }
-                100% { transform: translateX(0); opacity: 1; }
-            }
-
-            @keyframes nav-hover-animation {
-                0% { background-position: 0% 50%; }
-                50% { background-position: 100% 50%; }
-                100% { background-position: 0% 50%; }
-            }
-
-            @keyframes icon-pulse {
-                0% { transform: scale(1); }
-                50% { transform: scale(1.2); }
-                100% { transform: scale(1); }
-            }
-
-            @keyframes border-glow {
-                0% { border-color: rgba(26, 188, 156, 0.6); }
-                50% { border-color: rgba(26, 188, 156, 1); }
-                100% { border-color: rgba(26, 188, 156, 0.6); }
-            }
-
-            .nav-button i {
-                transition: transform 0.3s cubic-bezier(0.68, -0.55, 0.265, 1.55) !important;
-                margin-right: 12px !important;
-                width: 20px !important;
-                text-align: center !important;
-                color: rgba(255, 255, 255, 0.8) !important;
-                text-shadow: 0 1px 2px rgba(0, 0, 0, 0.2) !important;
-            }
-
-            .nav-button:hover i {
-                transform: scale(1.2) !important;
-                color: var(--primary) !important;
-                animation: icon-pulse 1.5s infinite !important;
-                text-shadow: 0 0 8px rgba(26, 188, 156, 0.5) !important;
-            }
-
-            .nav-button.active i {
-                color: var(--primary) !important;
-                animation: icon-pulse 2s infinite !important;
-                text-shadow: 0 0 10px rgba(26, 188, 156, 0.6) !important;
-            }
-
-            @keyframes pulse-icon {
-                0% { transform: scale(1); }
-                50% { transform: scale(1.3); }
-                100% { transform: scale(1.2); }
-            }
-        </style>
-    </head>
-    <body>
-        {%app_entry%}
-        </style>
     </head>
     <body>
         {%app_entry%}
@@ -789,14 +447,6 @@ custom_css = {
         "marginBottom": "25px",
         "border": "1px solid var(--border-color)",
     },
-    "card_header": {
-        "backgroundColor": "rgba(0, 0, 0, 0.2)",
-        "color": "var(--text-primary)",
-        "fontWeight": "600",
-        "padding": "16px 20px",
-        "borderRadius": "var(--card-radius) var(--card-radius) 0 0",
-        "borderBottom": "1px solid var(--border-color)",
-    },
     "button": {
         "backgroundColor": "var(--primary)",
         "color": "#ffffff",
@@ -817,20 +467,6 @@ custom_css = {
         "transform": "translateY(-1px)",
         "boxShadow": "0 4px 8px rgba(0,0,0,0.3)",
     },
-    "upload": {
-        "width": "100%",
-        "height": "120px",
-        "lineHeight": "120px",
-        "borderWidth": "2px",
-        "borderStyle": "dashed",
-        "borderRadius": "8px",
-        "textAlign": "center",
-        "margin": "20px 0",
-        "backgroundColor": "#16213e",
-        "color": "#e6e6e6",
-        "borderColor": "#2a3a5e",
-        "fontSize": "18px",
-    },
     "table": {
         "backgroundColor": "#16213e",
         "color": "#e6e6e6",
@@ -843,6 +479,12 @@ custom_css = {
         "color": "#ffffff",
         "fontWeight": "bold",
     },
+    "table_cell": {
+        "backgroundColor": "#16213e",
+        "color": "#e6e6e6",
+        "padding": "10px",
+        "border": "1px solid #2a3a5e",
+    },
     "dropdown": {
         "backgroundColor": "#16213e",
         "border": "1px solid rgba(255, 255, 255, 0.1)",
@@ -886,39 +528,6 @@ custom_css = {
         "borderLeft": "3px solid #1abc9c",
         "transition": "all 0.2s ease",
     },
-    "nav_button": {
-        "backgroundColor": "var(--nav-button-bg)",
-        "color": "#e6e6e6",
-        "border": "none",
-        "borderRadius": "8px",
-        "padding": "12px 16px",
-        "margin": "5px 0",
-        "fontSize": "14px",
-        "fontWeight": "400",
-        "textAlign": "left",
-        "width": "100%",
-        "transition": "all 0.3s ease-out",
-        "position": "relative",
-        "overflow": "hidden",
-        "boxShadow": "0 2px 5px rgba(0,0,0,0.1)",
-        "backdropFilter": "blur(5px)",
-        "borderLeft": "3px solid transparent",
-        "transform": "translateZ(0)",
-        "letterSpacing": "0.3px",
-        "backgroundImage": "linear-gradient(to bottom, rgba(255, 255, 255, 0.03) 0%, rgba(0, 0, 0, 0.05) 100%)",
-    },
-    "nav_button_hover": {
-        "backgroundColor": "var(--nav-button-hover-bg)",
-        "color": "var(--primary)",
-        "transform": "translateX(5px)",
-        "boxShadow": "0 2px 8px rgba(26, 188, 156, 0.15)",
-    },
-    "nav_button_active": {
-        "backgroundColor": "var(--nav-active-bg)",
-        "color": "var(--primary)",
-        "boxShadow": "0 2px 5px rgba(0,0,0,0.2)",
-        "borderLeft": "3px solid var(--active-indicator)",
-    },
     "text_dark": {
         "color": "#e6e6e6",
     },
@@ -935,190 +544,388 @@ custom_css = {
         "color": "#51cf66",
     },
 }
+# Read-only from here on; merged variants shared by several components are built once below
+custom_css = MappingProxyType(custom_css)
+
+STYLES = MappingProxyType({
+    "table_scroll": {"overflowX": "auto", **custom_css["table"]},
+    "card_spaced": {**custom_css["card"], "marginTop": "20px"},
+    "card_header_large": {"fontSize": "18px", "fontWeight": "500"},
+    # Fixed-height scroll box for virtualized tables (only the visible rows are in the DOM)
+    "table_virtualized": {"overflowX": "auto", "maxHeight": "600px", "overflowY": "auto", **custom_css["table"]},
+    # Control labels and fixed-height dropdowns of the statistics plot controls
+    "label": {"color": "#e6e6e6", "fontWeight": "bold", "marginBottom": "12px", "fontSize": "16px", "display": "block"},
+    "label_wide": {"color": "#e6e6e6", "fontWeight": "bold", "marginBottom": "20px", "fontSize": "16px", "display": "block"},
+    "dropdown_40": {"height": "40px", **custom_css["dropdown"]},
+    "form_group": {"marginBottom": "20px"},
+    "form_group_spaced": {"marginBottom": "25px"},
+    # Initial style of the plot-type control blocks (toggled clientside)
+    "controls_hidden": {"display": "none", "marginBottom": "25px"},
+})
+
+# Custom color palette with teal as primary
+DARK_THEME_COLORS = [
+    "#1abc9c",  # Teal (primary)
+    "#16a085",  # Darker teal
+    "#2ecc71",  # Green
+    "#3498db",  # Blue
+    "#9b59b6",  # Purple
+    "#f1c40f",  # Yellow
+    "#e67e22",  # Orange
+    "#e74c3c",  # Red
+    "#1f3a93",  # Dark blue
+    "#26c281",  # Mint
+]
+
+# Layout settings applied by apply_dark_theme (built once, not per call)
+_DARK_LAYOUT = dict(
+    template="plotly_dark",
+    # Plotly cycles trace colors through the palette itself
+    colorway=DARK_THEME_COLORS,
+    plot_bgcolor='var(--card-bg)',
+    paper_bgcolor='var(--card-bg)',
+    font=dict(
+        family="-apple-system, BlinkMacSystemFont, Segoe UI, Roboto, Helvetica, Arial, sans-serif",
+        size=14,
+        color="var(--text-primary)"
+    ),
+    title_font=dict(
+        family="-apple-system, BlinkMacSystemFont, Segoe UI, Roboto, Helvetica, Arial, sans-serif",
+        size=20,
+        color="var(--primary)"
+    ),
+    legend=dict(
+        bgcolor='rgba(0, 0, 0, 0.2)',
+        bordercolor='var(--border-color)',
+        borderwidth=1,
+        font=dict(size=12)
+    ),
+    margin=dict(l=60, r=40, t=60, b=60),
+    xaxis=dict(
+        showgrid=True,
+        gridcolor='rgba(255, 255, 255, 0.1)',
+        linecolor='var(--border-color)',
+        tickcolor='var(--text-secondary)',
+        zerolinecolor='var(--border-color)',
+        tickfont=dict(size=12),
+        title_font=dict(size=14, color="var(--text-secondary)")
+    ),
+    yaxis=dict(
+        showgrid=True,
+        gridcolor='rgba(255, 255, 255, 0.1)',
+        linecolor='var(--border-color)',
+        tickcolor='var(--text-secondary)',
+        zerolinecolor='var(--border-color)',
+        tickfont=dict(size=12),
+        title_font=dict(size=14, color="var(--text-secondary)")
+    ),
+    hoverlabel=dict(
+        bgcolor='var(--card-bg)',
+        font_size=14,
+        font_family="-apple-system, BlinkMacSystemFont, Segoe UI, Roboto, Helvetica, Arial, sans-serif"
+    )
+)
 
-# Function to apply dark theme to plots
-def apply_dark_theme(fig):
-    # Define a custom color palette with teal as primary
-    custom_colors = [
-        "#1abc9c",  # Teal (primary)
-        "#16a085",  # Darker teal
-        "#2ecc71",  # Green
-        "#3498db",  # Blue
-        "#9b59b6",  # Purple
-        "#f1c40f",  # Yellow
-        "#e67e22",  # Orange
-        "#e74c3c",  # Red
-        "#1f3a93",  # Dark blue
-        "#26c281",  # Mint
-    ]
-
-    # Update layout with improved styling
-    fig.update_layout(
-        template="plotly_dark",
-        plot_bgcolor='var(--card-bg)',
-        paper_bgcolor='var(--card-bg)',
-        font=dict(
-            family="-apple-system, BlinkMacSystemFont, Segoe UI, Roboto, Helvetica, Arial, sans-serif",
-            size=14,
-            color="var(--text-primary)"
-        ),
-        title_font=dict(
-            family="-apple-system, BlinkMacSystemFont, Segoe UI, Roboto, Helvetica, Arial, sans-serif",
-            size=20,
-            color="var(--primary)"
-        ),
-        legend=dict(
-            bgcolor='rgba(0, 0, 0, 0.2)',
-            bordercolor='var(--border-color)',
-            borderwidth=1,
-            font=dict(size=12)
-        ),
-        margin=dict(l=60, r=40, t=60, b=60),
-        xaxis=dict(
-            showgrid=True,
-            gridcolor='rgba(255, 255, 255, 0.1)',
-            linecolor='var(--border-color)',
-            tickcolor='var(--text-secondary)',
-            zerolinecolor='var(--border-color)',
-            tickfont=dict(size=12),
-            title_font=dict(size=14, color="var(--text-secondary)")
-        ),
-        yaxis=dict(
-            showgrid=True,
-            gridcolor='rgba(255, 255, 255, 0.1)',
-            linecolor='var(--border-color)',
-            tickcolor='var(--text-secondary)',
-            zerolinecolor='var(--border-color)',
-            tickfont=dict(size=12),
-            title_font=dict(size=14, color="var(--text-secondary)")
-        ),
-        hoverlabel=dict(
-            bgcolor='var(--card-bg)',
-            font_size=14,
-            font_family="-apple-system, BlinkMacSystemFont, Segoe UI, Roboto, Helvetica, Arial, sans-serif"
-        )
+# Subtle gradient background drawn behind every themed plot
+_DARK_SHAPES = [
+    dict(
+        type="rect",
+        xref="paper", yref="paper",
+        x0=0, y0=0, x1=1, y1=1,
+        fillcolor="rgba(0, 0, 0, 0.1)",
+        layer="below",
+        line_width=0,
     )
+]
 
-    # Color palette setting for different trace types
-    for i, trace in enumerate(fig.data):
-        color_idx = i % len(custom_colors)
-
-        if trace.type == 'scatter':
-            if hasattr(trace, 'marker') and trace.marker is not None:
-                fig.data[i].marker.color = custom_colors[color_idx]
-            if hasattr(trace, 'line') and trace.line is not None:
-                fig.data[i].line.color = custom_colors[color_idx]
-        elif trace.type == 'heatmap':
-            # Create a custom colorscale using the theme colors
-            fig.data[i].colorscale = [[0, "var(--dark-bg)"], [0.5, "#16a085"], [1, "#1abc9c"]]
-
-    # Add subtle gradient background
-    fig.update_layout(
-        shapes=[
-            dict(
-                type="rect",
-                xref="paper", yref="paper",
-                x0=0, y0=0, x1=1, y1=1,
-                fillcolor="rgba(0, 0, 0, 0.1)",
-                layer="below",
-                line_width=0,
-            )
+def is_large_svg_scatter(trace):
+    """True for an SVG scatter trace with more points than WEBGL_THRESHOLD"""
+    return trace.type == 'scatter' and trace.x is not None and len(trace.x) > WEBGL_THRESHOLD
+
+# Function to apply dark theme to plots
+def apply_dark_theme(fig):
+    # Figures are themed in place, so a figure that went through here already has nothing left to do
+    if getattr(fig, '_dark_themed', False):
+        return fig
+
+    # Update layout with improved styling and the subtle gradient background, in one validation pass
+    fig.update_layout(**_DARK_LAYOUT, shapes=_DARK_SHAPES)
+
+    # Large SVG scatter traces are swapped for their WebGL equivalent (properties WebGL lacks, like spline lines, are dropped)
+    if any(is_large_svg_scatter(trace) for trace in fig.data):
+        traces = [
+            go.Scattergl(trace.to_plotly_json(), skip_invalid=True) if is_large_svg_scatter(trace) else trace
+            for trace in fig.data
         ]
-    )
+        fig.data = ()
+        fig.add_traces(traces)
 
+    # Heatmaps get a custom colorscale using the theme colors
+    fig.update_traces(selector=dict(type='heatmap'), colorscale=[[0, "var(--dark-bg)"], [0.5, "#16a085"], [1, "#1abc9c"]])
+
+    fig._dark_themed = True
     return fig
 
-# Helper functions for data type detection
-def is_possible_datetime(series):
-    """Check if a series could be converted to datetime"""
-    if pd.api.types.is_datetime64_any_dtype(series):
-        return True
+# Scatter traces with more points than this render through WebGL instead of SVG
+WEBGL_THRESHOLD = 2000
 
-    # Handle empty series or series with no non-null values
-    non_null = series.dropna()
-    if len(non_null) == 0:
-        return False
+def scatter_trace(x=None, y=None, **kwargs):
+    """go.Scatter for small traces, go.Scattergl once the trace is large enough for SVG rendering to lag"""
+    trace_type = go.Scattergl if x is not None and len(x) > WEBGL_THRESHOLD else go.Scatter
+    return trace_type(x=x, y=y, **kwargs)
+
+# Scatter traces longer than this are served through plotly-resampler (only the visible window is sent)
+RESAMPLE_THRESHOLD = 5000
 
-    # Take a sample of up to 100 non-null values
-    sample_size = min(100, len(non_null))
-    sample = non_null.sample(sample_size) if sample_size > 0 else non_null
+# Resampled figures are pickled per browser tab ("session-id" store) and graph id, so zoom/pan re-aggregates
+# the figure that tab drew, from whichever worker process serves the relayout request
+RESAMPLER_CACHE_DIR = os.path.join(tempfile.gettempdir(), "dashboard-resampler")
+# Resampled figures not redrawn for this long are removed
+RESAMPLER_CACHE_TTL = 3600
 
+@lru_cache(maxsize=1)
+def resampler_cache_dir():
+    """RESAMPLER_CACHE_DIR, or None when it can't be created private to this user (its pickles get loaded)"""
     try:
-        pd.to_datetime(sample, errors='raise')
-        return True
-    except:
+        os.makedirs(RESAMPLER_CACHE_DIR, mode=0o700, exist_ok=True)
+        info = os.stat(RESAMPLER_CACHE_DIR)
+    except OSError:
+        return None
+    if hasattr(os, "getuid") and (info.st_uid != os.getuid() or info.st_mode & 0o077):
+        return None
+    return RESAMPLER_CACHE_DIR
+
+def resampler_cache_path(session_id, graph_id):
+    # Hashed, so the client-supplied session id never becomes part of a path
+    name = hashlib.blake2b(f"{session_id}/{graph_id}".encode(), digest_size=16).hexdigest()
+    return os.path.join(resampler_cache_dir(), f"{name}.pkl")
+
+def load_resampled(session_id, graph_id):
+    """The FigureResampler last drawn in graph_id for this session, or None"""
+    if not session_id or resampler_cache_dir() is None:
+        return None
+    try:
+        with open(resampler_cache_path(session_id, graph_id), "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+def drop_resampled(session_id, graph_id):
+    """Forget the resampled figure of graph_id for this session once the graph is redrawn"""
+    if not session_id or resampler_cache_dir() is None:
+        return
+    try:
+        os.remove(resampler_cache_path(session_id, graph_id))
+    except OSError:
+        pass
+
+def store_resampled(session_id, graph_id, fig):
+    cache_dir = resampler_cache_dir()
+    path = resampler_cache_path(session_id, graph_id)
+    # Written beside the target and renamed into place, so a concurrent reader never sees a partial pickle
+    with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".tmp", delete=False) as f:
+        pickle.dump(fig, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(f.name, path)
+
+    expired = time.time() - RESAMPLER_CACHE_TTL
+    for entry in os.scandir(cache_dir):
+        try:
+            if entry.stat().st_mtime < expired:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+def resample_figure(fig, graph_id, session_id):
+    """Wrap a figure in a FigureResampler when it has large ordered (time-series like) traces and plotly-resampler is available"""
+    FigureResampler = get_figure_resampler()
+    if FigureResampler is None or not session_id or resampler_cache_dir() is None:
+        return fig
+    # Aggregation needs x sorted; unordered point clouds are left untouched
+    large_traces = [
+        trace for trace in fig.data
+        if trace.type in ("scatter", "scattergl") and trace.x is not None and len(trace.x) > RESAMPLE_THRESHOLD
+    ]
+    if not large_traces or not all(pd.Index(trace.x).is_monotonic_increasing for trace in large_traces):
+        return fig
+    fig = FigureResampler(fig, default_n_shown_samples=2000)
+    store_resampled(session_id, graph_id, fig)
+    return fig
+
+# Outputs of the plot callbacks, keyed by graph id, a store_digest of the dataset and the control values
+_PLOT_CACHE = LRUCache(16)
+
+def cached_plot_outputs(graph_id, data, params, build, session_id=None):
+    """Call build() for a plot callback's outputs (figure first), reusing them for a repeated dataset and params.
+    The figure is kept as its plotly JSON dict so a cache hit skips the Figure traversal. With a session_id,
+    large ordered figures go through resample_figure; those are not cached, as the resampler keeps per-view state"""
+    # Any previous resampled figure of this graph is stale once it is redrawn
+    drop_resampled(session_id, graph_id)
+    digest = store_digest(data)
+    if digest is None:
+        return resampled_outputs(graph_id, build(), session_id)
+
+    key = (graph_id, digest, params)
+    cached = _PLOT_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    outputs = build()
+    resampled = resampled_outputs(graph_id, outputs, session_id)
+    if resampled[0] is not outputs[0]:
+        return resampled
+    figure, *rest = outputs
+    if isinstance(figure, go.Figure):
+        figure = figure.to_plotly_json()
+    return _PLOT_CACHE.put(key, (figure, *rest))
+
+def resampled_outputs(graph_id, outputs, session_id):
+    """Plot callback outputs with the figure passed through resample_figure"""
+    figure, *rest = outputs
+    if session_id is None or not isinstance(figure, go.Figure):
+        return outputs
+    return (resample_figure(figure, graph_id, session_id), *rest)
+
+# Helper functions for data type detection
+# String dtype for char-level probes: Arrow-backed (vectorized compute kernels) when pyarrow is installed
+DETECTION_STRING_DTYPE = "string[pyarrow]" if find_spec("pyarrow") is not None else str
+
+# Common boolean representations (lower-cased)
+BOOLEAN_LITERALS = frozenset({'true', 't', 'yes', 'y', '1', 'false', 'f', 'no', 'n', '0'})
+
+# Compiled once: decimal or scientific-notation number with optional sign and surrounding whitespace.
+# ASCII only: pd.to_numeric can't convert other Unicode digits (e.g. Arabic-Indic), so they must not match
+NUMERIC_PATTERN = re.compile(r"\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*", re.ASCII)
+
+# Type-detection results keyed by a cheap column signature; the same columns get probed by several callbacks
+_TYPE_DETECTION_CACHE = LRUCache(512)
+
+def series_signature(series):
+    """Identity for a column: name, dtype and a content hash of its values in order (None when unhashable)"""
+    try:
+        hashes = pd.util.hash_pandas_object(series, index=False).to_numpy()
+    except TypeError:
+        return None
+    return (series.name, str(series.dtype), hashlib.blake2b(hashes.tobytes(), digest_size=16).hexdigest())
+
+def memoize_detection(func):
+    """Cache a type-detection helper on the content signature of the series it is given"""
+    @wraps(func)
+    def wrapper(series, *args):
+        signature = series_signature(series)
+        if signature is None:
+            return func(series, *args)
+        key = (func.__name__, signature, args)
+        result = _TYPE_DETECTION_CACHE.get(key, _MISSING)
+        if result is _MISSING:
+            result = _TYPE_DETECTION_CACHE.put(key, func(series, *args))
+        return result
+    return wrapper
+
+def detection_sample(series, size=100):
+    """Up to `size` non-null values of a series; fixed random_state so repeated probes see the same rows"""
+    non_null = series.dropna()
+    if len(non_null) == 0:
+        return non_null
+    return non_null.sample(min(size, len(non_null)), random_state=0)
+
+def _is_datetime_sample(sample):
+    """Check if every value of a non-null sample parses as a datetime"""
+    if len(sample) == 0:
+        return False
+
+    # Coerce instead of raising: unparseable values become NaT
+    try:
+        if pd.to_datetime(sample, errors='coerce').notna().all():
+            return True
+    except (TypeError, ValueError):
         pass
 
-    # Check for common date formats
+    # Check for common date formats, one vectorized parse per format
     date_formats = [
         '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d',
         '%Y-%m-%d %H:%M:%S', '%m/%d/%Y %H:%M:%S',
         '%d/%m/%Y %H:%M:%S', '%Y/%m/%d %H:%M:%S'
     ]
 
+    str_sample = sample.astype(str)
     for fmt in date_formats:
-        try:
-            sample.apply(lambda x: datetime.strptime(str(x), fmt))
+        if pd.to_datetime(str_sample, format=fmt, errors='coerce').notna().all():
             return True
-        except:
-            continue
 
     return False
 
-def is_possible_numeric(series):
-    """Check if a series could be converted to numeric"""
-    if pd.api.types.is_numeric_dtype(series):
-        return True
-
-    sample = series.dropna().sample(min(100, len(series)))
+def _is_numeric_sample(sample):
+    """Check if every value of a non-null sample converts to a number"""
     if len(sample) == 0:
         return False
 
-    try:
-        pd.to_numeric(sample, errors='raise')
+    # Plain decimal/scientific literals match without launching the converter
+    if sample.astype(str).str.fullmatch(NUMERIC_PATTERN).all():
         return True
-    except:
-        return False
 
-def is_possible_boolean(series):
-    """Check if a series could be converted to boolean"""
-    if pd.api.types.is_bool_dtype(series):
-        return True
+    # Coerce instead of raising: unconvertible values become NaN
+    return bool(pd.to_numeric(sample, errors='coerce').notna().all())
 
-    sample = series.dropna().sample(min(100, len(series)))
+def _is_boolean_sample(sample):
+    """Check if every value of a non-null sample is a common boolean representation"""
     if len(sample) == 0:
         return False
 
-    # Check for common boolean representations
-    true_values = ['true', 't', 'yes', 'y', '1']
-    false_values = ['false', 'f', 'no', 'n', '0']
+    normalized = sample.astype(DETECTION_STRING_DTYPE).str.strip().str.lower()
+    return bool(normalized.isin(BOOLEAN_LITERALS).all())
 
-    try:
-        normalized = sample.str.lower().str.strip()
-        if all(x in true_values + false_values for x in normalized if pd.notna(x)):
-            return True
-    except:
-        pass
+@memoize_detection
+def is_possible_datetime(series):
+    """Check if a series could be converted to datetime"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return True
+    return _is_datetime_sample(detection_sample(series))
 
-    return False
+def is_possible_numeric(series):
+    """Check if a series could be converted to numeric"""
+    if pd.api.types.is_numeric_dtype(series):
+        return True
+    return _is_numeric_sample(detection_sample(series))
+
+def is_possible_boolean(series):
+    """Check if a series could be converted to boolean"""
+    if pd.api.types.is_bool_dtype(series):
+        return True
+    return _is_boolean_sample(detection_sample(series))
 
+@memoize_detection
 def detect_data_type(series):
     """Detect the most appropriate data type for a series"""
-    if is_possible_datetime(series):
+    # Already-typed columns are decided from the dtype alone; only object-like columns get sampled
+    kind = series.dtype.kind
+    if kind == 'M':
         return 'datetime'
-    elif is_possible_numeric(series):
+    if kind in 'iuf':
         return 'numeric'
-    elif is_possible_boolean(series):
+    if kind == 'b':
+        return 'boolean'
+
+    # One shared sample for all three probes
+    sample = detection_sample(series)
+    if _is_datetime_sample(sample):
+        return 'datetime'
+    elif _is_numeric_sample(sample):
+        return 'numeric'
+    elif _is_boolean_sample(sample):
         return 'boolean'
     elif pd.api.types.is_string_dtype(series):
-        # Check if it's actually categorical with low cardinality
-        unique_count = series.nunique()
+        # Check if it's actually categorical with low cardinality (estimated on a sample for long columns)
+        if len(series) < 10_000:
+            unique_count = series.nunique(dropna=True)
+        else:
+            unique_count = series.sample(5000, random_state=0).nunique(dropna=True)
         if unique_count < min(50, len(series) * 0.5):
             return 'categorical'
         return 'text'
     else:
         return str(series.dtype)
 
+@memoize_detection
 def get_conversion_suggestion(series, current_type):
     """Get suggestion for converting a series to a more appropriate type"""
     detected_type = detect_data_type(series)
@@ -1208,9 +1015,11 @@ html.Div([
             dash_table.DataTable(
                 id="encoded-preview-table",
                 style_table={"overflowX": "auto", "backgroundColor": "#16213e"},
-                style_header={"backgroundColor": "#0f3460", "color": "#ffffff", "fontWeight": "bold"},
-                style_cell={"backgroundColor": "#16213e", "color": "#e6e6e6", "padding": "10px", "border": "1px solid #2a3a5e"},
-                page_size=10
+                style_header=custom_css["table_header"],
+                style_cell=custom_css["table_cell"],
+                page_current=0,
+                page_size=10,
+                page_action="custom"
             )
         ], width=12)
     ], className="mb-4"),
@@ -1229,29 +1038,434 @@ html.Div([
 ], style={"marginTop": "30px", "marginBottom": "30px"})
 
 # Callback to update the encoded data preview table based on dropdown selection
+# The table is paginated server-side: only the rows of the current page are sent
 @app.callback(
     [
         Output("encoded-preview-table", "data"),
-        Output("encoded-preview-table", "columns")
+        Output("encoded-preview-table", "columns"),
+        Output("encoded-preview-table", "page_count")
     ],
     [
         Input("encoded-preview-dropdown", "value"),
-        Input("encoded-df-store", "data")
-    ]
+        Input("encoded-df-store", "data"),
+        Input("encoded-preview-table", "page_current")
+    ],
+    [State("encoded-preview-table", "page_size")]
 )
-def update_encoded_preview_table(preview_option, encoded_data):
-    import pandas as pd
+def update_encoded_preview_table(preview_option, encoded_data, page_current, page_size):
     if not encoded_data:
-        return [], []
-    df = pd.DataFrame(encoded_data)
-    if preview_option == "head":
-        df = df.head(5)
-    elif preview_option == "tail":
-        df = df.tail(5)
-    # else: full dataframe
-    columns = [{"name": col, "id": col} for col in df.columns]
-    data = df.to_dict("records")
-    return data, columns
+        return [], [], 1
+    if preview_option in ("head", "tail"):
+        # Five rows fit on a single page
+        rows = slice(0, 5) if preview_option == "head" else slice(-5, None)
+        page_count = 1
+    else:
+        page_size = page_size or 10
+        start = (page_current or 0) * page_size
+        rows = slice(start, start + page_size)
+        page_count = max(-(-store_num_rows(encoded_data) // page_size), 1)
+    records, column_names = records_from_store(encoded_data, rows)
+    return records, table_columns(tuple(column_names)), page_count
+
+# Plot types generate_plots can draw
+PLOT_TYPE_OPTIONS = [
+    {"label": "Histogram", "value": "histogram"},
+    {"label": "Scatter Plot", "value": "scatter"},
+    {"label": "Bar Chart", "value": "bar"},
+]
+
+# Plot type -> ids of the extra control blocks it shows; every other block stays hidden
+CONTROL_VISIBILITY_MAP = {
+    "timeseries": ["time-series-controls", "moving-avg-col", "seasonality-col"],
+    "scattermatrix": ["scatter-matrix-controls"],
+    "scatter3d": ["3d-plot-controls"],
+    "surface3d": ["3d-plot-controls"],
+    "choropleth": ["geo-plot-controls"],
+    "scattermap": ["geo-plot-controls"],
+    "forecast": ["forecast-controls"],
+    "qqplot": ["stat-plot-controls"],
+    "residual": ["stat-plot-controls"],
+}
+
+# Bin size slider ticks; every mark shares one label style
+_MARK_STYLE = {"color": "white", "font-size": "14px"}
+BIN_SIZE_MARKS = {i: {"label": str(i), "style": _MARK_STYLE} for i in range(5, 51, 5)}
+
+@lru_cache(maxsize=None)
+def dropdown_style(**spacing):
+    """custom_css["dropdown"] plus margins, built once per distinct set of margins and shared by every caller"""
+    return {**spacing, **custom_css["dropdown"]}
+
+@lru_cache(maxsize=None)
+def icon(name):
+    """Leading icon for a button or heading; one shared component per icon name"""
+    return html.I(className=f"icon icon-{name} mr-2")
+
+# dcc.Dropdown with the dark theme classes from assets/dashboard.css
+dark_dropdown = partial(dcc.Dropdown, className='dropdown-dark custom-dropdown')
+
+def card(header, body, style=custom_css["card"]):
+    """Dark card with a standard header above a body of children"""
+    return dbc.Card([
+        dbc.CardHeader(header, className="dash-card-header"),
+        dbc.CardBody(body),
+    ], style=style)
+
+def labeled_dropdown(label, dropdown_id, group_style=STYLES["form_group"], **dropdown_props):
+    """Form group holding a bold label above a 40px dark dropdown"""
+    return html.Div(className="form-group", style=group_style, children=[
+        html.Label(label, style=STYLES["label"]),
+        dark_dropdown(
+            id=dropdown_id,
+            style=STYLES["dropdown_40"],
+            **dropdown_props
+        ),
+    ])
+
+# Sidebar navigation: (category title, ((section, icon, label), ...)); each link's id is "<section>-button"
+NAV_GROUPS = (
+    ("GENERAL", (
+        ("welcome", "icon-home", "Welcome"),
+        ("import", "icon-upload", "Import Data"),
+        ("summary", "icon-table", "Summary"),
+        ("encoding", "icon-link", "Encoding"),
+    )),
+    ("DATA PROCESSING", (
+        ("imputation", "icon-fill-drip", "Imputation"),
+    )),
+    ("ANALYSIS", (
+        ("statistics", "icon-chart-pie", "Statistics"),
+        ("tests", "icon-square-root-alt", "Tests"),
+    )),
+    ("ADVANCED", (
+        ("regression", "icon-chart-line", "Linear Regression"),
+        ("prediction", "icon-robot", "Prediction"),
+        ("report", "icon-file-alt", "Report"),
+    )),
+    ("HELP", (
+        ("faq", "icon-question-circle", "FAQ"),
+    )),
+)
+
+def nav_link(section, icon, label):
+    """Sidebar link for a section; the welcome section starts active"""
+    active = section == "welcome"
+    return dbc.NavLink(
+        [
+            html.I(className=f"icon {icon} mr-2"),
+            label
+        ],
+        id=f"{section}-button",
+        href="#",
+        active=active,
+        className="nav-button active" if active else "nav-button"
+    )
+
+def faq_categories():
+    """FAQ tabs as (tab label, tab id, [(question, answer children), ...]); only built by faq_layout, not at import"""
+    return [
+        ("Getting Started", "getting-started", [
+            ("How can I use this app?", [
+                html.P("This app lets you upload CSV or Excel files and perform data analysis through an intuitive interface. The typical workflow is:"),
+                html.Ol([
+                    html.Li("Upload your data in the Import tab"),
+                    html.Li("View summary statistics in the Summary tab"),
+                    html.Li("Clean your data in the Imputation tab (impute missing values, remove duplicates, handle outliers)"),
+                    html.Li("Create visualizations in the Statistics tab (auto and custom plots)"),
+                    html.Li("Analyze relationships in the Correlation and Tests tabs"),
+                    html.Li("Build and use regression and prediction models in the Regression and Prediction tabs"),
+                    html.Li("Generate a comprehensive EDA report in the Report tab")
+                ])
+            ]),
+            ("What types of files can I upload?", [
+                html.P("You can upload the following file formats:"),
+                html.Ul([
+                    html.Li("CSV (.csv) - Comma-separated values"),
+                    html.Li("Excel (.xls, .xlsx) - Microsoft Excel spreadsheets")
+                ]),
+                html.P("Files should be properly formatted with consistent data types in each column for best results.", style={"marginTop": "10px"})
+            ]),
+            ("How are data types determined?", [html.P("The app automatically detects numeric, categorical, datetime, and boolean columns. It suggests conversions if needed.")]),
+            ("What's the maximum file size I can upload?", [html.P("For best performance, use files with up to 10,000 rows and 100 columns. Larger files may be sampled.")]),
+        ]),
+        ("Data Cleaning", "data-cleaning", [
+            ("How do I handle missing values?", [html.P("In the Imputation tab, select columns and choose a method: mean, median, mode, or KNN (for numeric). Apply changes to fill missing values.")]),
+            ("How can I remove duplicate records?", [html.P("In the Imputation tab, click 'Find Duplicates' to preview, then 'Remove Duplicates' to delete them.")]),
+            ("How do I handle outliers?", [html.P("In the Imputation tab, select numeric columns, choose IQR or Z-score, set a threshold, detect outliers, and choose to remove or replace them.")]),
+        ]),
+        ("Visualization", "visualization", [
+            ("What types of visualizations can I create?", [html.P("In the Statistics tab, you can generate histograms, scatter plots, bar charts, and pie charts. The app also auto-generates summary and distribution plots.")]),
+            ("How do I view correlations?", [html.P("The Correlation tab shows heatmaps for numeric, label-encoded, and one-hot encoded variables.")]),
+        ]),
+        ("Statistical Analysis", "statistical-analysis", [
+            ("How do I perform statistical tests?", [html.P("In the Tests tab, select Chi-squared (for categorical), Pearson, or Spearman (for numeric) tests. The app provides results, visualizations, and interpretations.")]),
+            ("How do I perform regression analysis?", [html.P("In the Regression tab, select X and Y variables, calculate regression, view the equation, metrics, and plot. You can also make predictions with confidence intervals.")]),
+            ("How can I make predictions using machine learning?", [html.P("In the Prediction tab, train a Random Forest model by selecting features and a target. Make predictions manually or by uploading a file. View model metrics and results.")]),
+        ]),
+        ("Export & Reporting", "export-reporting", [
+            ("How can I export my data?", [html.P("In the Import tab, export your data as CSV, Excel, or JSON.")]),
+            ("How do I generate a report?", [html.P("In the Report tab, click 'Generate EDA Report' for an interactive summary with stats, visualizations, and warnings.")]),
+        ]),
+        ("Troubleshooting", "troubleshooting", [
+            ("The app is slow. What can I do?", [html.P("If the app is slow, use smaller datasets, limit columns, and avoid complex plots with large data.")]),
+            ("I get errors when uploading files.", [html.P("Check file format, column names, and file integrity. Ensure the header option matches your file.")]),
+            ("My plots aren't displaying. What should I check?", [html.P("Make sure you've selected appropriate variables and plot types. Check for missing values.")]),
+        ]),
+    ]
+
+def faq_item(title, body):
+    return dbc.AccordionItem(body, title=title, className="faq-accordion-item")
+
+@lru_cache(maxsize=1)
+def faq_layout():
+    """FAQ card; static and rarely opened, so it is only sent once the FAQ section is first shown"""
+    return dbc.Card([
+        dbc.CardHeader([
+            html.H3("Frequently Asked Questions", className="mb-0", style={"color": "var(--primary)", "fontWeight": "600"})
+        ], className="dash-card-header"),
+        dbc.CardBody([
+            html.Div(style={"display": "flex", "alignItems": "center", "marginBottom": "25px"}, children=[
+                html.I(className="icon icon-question-circle", style={"fontSize": "24px", "color": "var(--primary)", "marginRight": "15px"}),
+                html.P("Find answers to common questions and learn how to make the most of this data analysis dashboard. Browse through the categories below to quickly find the information you need.",
+                  style={"color": "var(--text-secondary)", "fontSize": "16px", "margin": "0"})
+            ]),
+
+            # FAQ categories
+            dbc.Tabs([
+                dbc.Tab(label=label, tab_id=tab_id, label_class_name="faq-tab-label", active_label_class_name="faq-tab-label-active", children=[
+                    html.Div(className="faq-tab-body", children=[
+                        dbc.Accordion([faq_item(title, body) for title, body in items], start_collapsed=True, className="faq-accordion"),
+                    ]),
+                ])
+                for label, tab_id, items in faq_categories()
+            ], id="faq-tabs", style={"backgroundColor": "var(--card-bg)", "borderRadius": "8px", "padding": "5px"}),
+
+            # Additional help resources
+            html.Div(style={"marginTop": "40px", "padding": "20px", "backgroundColor": "var(--primary-light)", "borderRadius": "12px", "boxShadow": "0 4px 8px rgba(0, 0, 0, 0.1)"}, children=[
+                html.H5("Need More Help?", style={"color": "var(--primary)", "fontWeight": "bold", "marginBottom": "15px"}),
+                html.P([
+                    "If you need assistance with your data analysis, our support team is here to help.",
+                ], style={"color": "var(--text-secondary)", "marginBottom": "15px"}),
+                dbc.Row([
+                    dbc.Col([
+                        html.Div([
+                            html.I(className="icon icon-envelope", style={"marginRight": "10px", "color": "var(--primary)"}),
+                            html.Span("Contact Support: ", style={"fontWeight": "600"}),
+                            html.A("ilyes.frigui.ps@gmail.com",
+                                  href="mailto:ilyes.frigui.ps@gmail.com",
+                                  style={"color": "var(--primary)", "textDecoration": "none", "borderBottom": "1px dotted var(--primary)"}),
+                        ], style={"fontSize": "16px", "display": "flex", "alignItems": "center"}),
+                    ], width=12),
+                ]),
+            ]),
+        ]),
+    ], style=custom_css["card"])
+
+@lru_cache(maxsize=1)
+def report_layout():
+    """Report section; its controls only feed generate_eda_report, so it is sent once the section is first shown"""
+    return [
+        card("Automated EDA Report", [
+            html.Div([
+                html.P("Generate a comprehensive Exploratory Data Analysis report for your dataset.",
+                       style={"color": "var(--text-secondary)", "fontSize": "16px", "marginBottom": "20px"}),
+
+                # Button to generate the report
+                dbc.Button([
+                    icon("file-alt"),
+                    "Generate EDA Report"
+                ],
+                id="generate-report-button",
+                style=custom_css["button"],
+                className="mb-4"),
+
+                # Loading spinner during report generation
+                dbc.Spinner(
+                    html.Div(id="eda-report-container", style={"minHeight": "200px"}),
+                    color="info",
+                    type="grow",
+                    fullscreen=False,
+                ),
+            ]),
+        ]),
+    ]
+
+@lru_cache(maxsize=1)
+def prediction_layout():
+    """Prediction section; its callbacks only write to components inside it and to the root-level stores"""
+    return [
+        card("Random Forest Prediction", [
+            dbc.Row([
+                dbc.Col([
+                    # Left panel for model training and selection
+                    card("Train Model", [
+                        html.P("Train a Random Forest classifier on your dataset.",
+                               style={"color": "var(--text-secondary)", "marginBottom": "15px"}),
+
+                        # Target column selection
+                        html.Div([
+                            html.Label("Select Target Variable:", style={
+                                "color": "#e6e6e6",
+                                "fontWeight": "bold",
+                                "marginBottom": "8px",
+                                "display": "block"
+                            }),
+                            dark_dropdown(
+                                id="prediction-target-dropdown",
+                                placeholder="Select target column",
+                                style=dropdown_style(marginBottom="20px"),
+                            )
+                        ]),
+
+                        # Feature selection
+                        html.Div([
+                            html.Label("Select Features:", style={
+                                "color": "#e6e6e6",
+                                "fontWeight": "bold",
+                                "marginBottom": "8px",
+                                "display": "block"
+                            }),
+                            dark_dropdown(
+                                id="prediction-features-dropdown",
+                                multi=True,
+                                placeholder="Select features",
+                                style=dropdown_style(marginBottom="20px"),
+                            )
+                        ]),
+
+                        # Model parameters
+                        html.Div([
+                            html.Label("Model Parameters:", style={
+                                "color": "#e6e6e6",
+                                "fontWeight": "bold",
+                                "marginBottom": "8px",
+                                "display": "block"
+                            }),
+                            dbc.Row([
+                                dbc.Col([
+                                    html.Label("Number of Trees:", style={"color": "#e6e6e6"}),
+                                    dbc.Input(
+                                        id="n-estimators-input",
+                                        type="number",
+                                        min=10,
+                                        max=500,
+                                        step=10,
+                                        value=100,
+                                        style=dropdown_style(marginBottom="15px")
+                                    )
+                                ], width=6),
+                                dbc.Col([
+                                    html.Label("Max Depth:", style={"color": "#e6e6e6"}),
+                                    dbc.Input(
+                                        id="max-depth-input",
+                                        type="number",
+                                        min=1,
+                                        max=50,
+                                        value=None,
+                                        placeholder="None (unlimited)",
+                                        style=dropdown_style(marginBottom="15px")
+                                    )
+                                ], width=6)
+                            ]),
+                            dbc.Row([
+                                dbc.Col([
+                                    html.Label("Train/Test Split:", style={"color": "#e6e6e6"}),
+                                    dbc.Input(
+                                        id="test-size-input",
+                                        type="number",
+                                        min=0.1,
+                                        max=0.5,
+                                        step=0.05,
+                                        value=0.3,
+                                        style=dropdown_style(marginBottom="15px")
+                                    )
+                                ], width=6),
+                                dbc.Col([
+                                    html.Label("Random State:", style={"color": "#e6e6e6"}),
+                                    dbc.Input(
+                                        id="random-state-input",
+                                        type="number",
+                                        min=0,
+                                        value=42,
+                                        style=dropdown_style(marginBottom="15px")
+                                    )
+                                ], width=6)
+                            ])
+                        ]),
+
+                        # Train button
+                        dbc.Button(
+                            [icon("cogs"), "Train Model"],
+                            id="train-model-button",
+                            color="primary",
+                            style=custom_css["button"],
+                            className="mb-3"
+                        ),
+
+                        # Training status and metrics
+                        dbc.Spinner(
+                            html.Div(id="training-status", style={"minHeight": "50px"}),
+                            type="grow",
+                            color="info",
+                            size="sm"
+                        )
+                    ])
+                ], width=6),
+
+                dbc.Col([
+                    # Right panel for making predictions
+                    card("Make Predictions", [
+                        html.P("Make predictions using the trained Random Forest model.",
+                               style={"color": "var(--text-secondary)", "marginBottom": "15px"}),
+
+                        # Two tabs: Manual Input and File Upload
+                        dbc.Tabs([
+                            dbc.Tab(label="Manual Input", tab_id="manual-input", children=[
+                                html.Div(id="manual-inputs-container", style={"marginTop": "15px"}),
+                                dbc.Button(
+                                    [icon("magic"), "Predict"],
+                                    id="predict-button-manual",
+                                    color="success",
+                                    style=custom_css["button"],
+                                    className="mt-3",
+                                    disabled=True
+                                )
+                            ]),
+                            dbc.Tab(label="File Upload", tab_id="file-upload", children=[
+                                dcc.Upload(
+                                    id="prediction-upload",
+                                    children=html.Div([
+                                        html.I(className="icon icon-cloud-upload-alt mr-2", style={"fontSize": "24px", "color": "var(--primary)"}),
+                                        "Drag and Drop or ",
+                                        html.A("Select a File", style={"color": "var(--primary)", "fontWeight": "bold", "textDecoration": "underline"}),
+                                    ]),
+                                    className="upload-area dash-upload mt-3 mb-3",
+                                ),
+                                html.Div(id="prediction-upload-status", style={
+                                    "color": "#a3a3a3",
+                                    "textAlign": "center",
+                                    "marginBottom": "15px"
+                                }),
+                                dbc.Button(
+                                    [icon("magic"), "Predict from File"],
+                                    id="predict-button-file",
+                                    color="success",
+                                    style=custom_css["button"],
+                                    className="mt-2",
+                                    disabled=True
+                                )
+                            ])
+                        ], id="prediction-tabs")
+                    ]),
+
+                    # Results card
+                    card("Prediction Results", [
+                        html.Div(id="prediction-results", style={"minHeight": "200px"})
+                    ], style=STYLES["card_spaced"])
+                ], width=6)
+            ])
+        ]),
+    ]
 
 # Layout with updated styling
 app.layout = html.Div(style=custom_css["background"], children=[
@@ -1275,7 +1489,7 @@ app.layout = html.Div(style=custom_css["background"], children=[
                 "backgroundClip": "text"
             }),
             html.Div([
-                html.I(className="fas fa-chart-line", style={
+                html.I(className="icon icon-chart-line", style={
                     "color": "var(--primary)",
                     "fontSize": "24px",
                     "marginRight": "10px",
@@ -1296,173 +1510,38 @@ app.layout = html.Div(style=custom_css["background"], children=[
             }),
         ]),
 
-        # Category Group - General
-        html.Div([
-            html.P("GENERAL", className="nav-category-title"),
-            dbc.Nav([
-                dbc.NavLink(
-                    [
-                        html.I(className="fas fa-home mr-2"),
-                        "Welcome"
-                    ],
-                    id="welcome-button",
-                    href="#",
-                    active=True,
-                    style=custom_css["nav_button"],
-                    className="nav-button active"
-                ),
-                dbc.NavLink(
-                    [
-                        html.I(className="fas fa-upload mr-2"),
-                        "Import Data"
-                    ],
-                    id="import-button",
-                    href="#",
-                    active=False,
-                    style=custom_css["nav_button"],
-                    className="nav-button"
-                ),
-                dbc.NavLink(
-                    [
-                        html.I(className="fas fa-table mr-2"),
-                        "Summary"
-                    ],
-                    id="summary-button",
-                    href="#",
-                    style=custom_css["nav_button"],
-                    className="nav-button"
-                ),
-                dbc.NavLink(
-                    [
-                        html.I(className="fas fa-link mr-2"),
-                        "Encoding"
-                    ],
-                    id="encoding-button",
-                    href="#",
-                    style=custom_css["nav_button"],
-                    className="nav-button"
-                ),
-            ], vertical=True, pills=True, className="nav-pills", style={"marginBottom": "20px"}),
-        ], className="nav-category"),
-
-        # Category Group - Data Processing
-        html.Div([
-            html.P("DATA PROCESSING", className="nav-category-title"),
-            dbc.Nav([
-                dbc.NavLink(
-                    [
-                        html.I(className="fas fa-fill-drip mr-2"),
-                        "Imputation"
-                    ],
-                    id="imputation-button",
-                    href="#",
-                    style=custom_css["nav_button"],
-                    className="nav-button"
-                ),
-            ], vertical=True, pills=True, className="nav-pills", style={"marginBottom": "20px"}),
-        ], className="nav-category"),
-
-        # Category Group - Analysis
-        html.Div([
-            html.P("ANALYSIS", className="nav-category-title"),
-            dbc.Nav([
-                dbc.NavLink(
-                    [
-                        html.I(className="fas fa-chart-pie mr-2"),
-                        "Statistics"
-                    ],
-                    id="statistics-button",
-                    href="#",
-                    style=custom_css["nav_button"],
-                    className="nav-button"
-                ),
-                dbc.NavLink(
-                    [
-                        html.I(className="fas fa-square-root-alt mr-2"),
-                        "Tests"
-                    ],
-                    id="tests-button",
-                    href="#",
-                    style=custom_css["nav_button"],
-                    className="nav-button"
-                ),
-            ], vertical=True, pills=True, className="nav-pills", style={"marginBottom": "20px"}),
-        ], className="nav-category"),
-
-        # Category Group - Advanced
-        html.Div([
-            html.P("ADVANCED", className="nav-category-title"),
-            dbc.Nav([
-                dbc.NavLink(
-                    [
-                        html.I(className="fas fa-chart-line mr-2"),
-                        "Linear Regression"
-                    ],
-                    id="regression-button",
-                    href="#",
-                    style=custom_css["nav_button"],
-                    className="nav-button"
-                ),
-                dbc.NavLink(
-                    [
-                        html.I(className="fas fa-robot mr-2"),
-                        "Prediction"
-                    ],
-                    id="prediction-button",
-                    href="#",
-                    style=custom_css["nav_button"],
-                    className="nav-button"
-                ),
-                dbc.NavLink(
-                    [
-                        html.I(className="fas fa-file-alt mr-2"),
-                        "Report"
-                    ],
-                    id="report-button",
-                    href="#",
-                    style=custom_css["nav_button"],
-                    className="nav-button"
-                ),
-            ], vertical=True, pills=True, className="nav-pills", style={"marginBottom": "20px"}),
-        ], className="nav-category"),
-
-        # Category Group - Help
-        html.Div([
-            html.P("HELP", className="nav-category-title"),
-            dbc.Nav([
-                dbc.NavLink(
-                    [
-                        html.I(className="fas fa-question-circle mr-2"),
-                        "FAQ"
-                    ],
-                    id="faq-button",
-                    href="#",
-                    style=custom_css["nav_button"],
-                    className="nav-button"
+        # Category groups, built from NAV_GROUPS
+        *[
+            html.Div([
+                html.P(title, className="nav-category-title"),
+                dbc.Nav(
+                    [nav_link(section, icon, label) for section, icon, label in items],
+                    vertical=True, pills=True, className="nav-pills", style={"marginBottom": "20px"}
                 ),
-            ], vertical=True, pills=True, className="nav-pills", style={"marginBottom": "20px"}),
-        ], className="nav-category"),
+            ], className="nav-category")
+            for title, items in NAV_GROUPS
+        ],
     ]),
 
     # Main Content
     html.Div(style=custom_css["content"], children=[
         # Welcome Page
-        html.Div(id="welcome-content", style={"display": "block", "opacity": "1", "transition": "opacity 0.3s ease-in-out"}, children=[
+        html.Div(id="welcome-content", style={"display": "block", "opacity": "1"}, children=[
             dbc.Card([
                 dbc.CardHeader([
                     html.Div([
-                        html.I(className="fas fa-home", style={"fontSize": "28px", "color": "var(--primary)", "marginRight": "15px"}),
+                        html.I(className="icon icon-home", style={"fontSize": "28px", "color": "var(--primary)", "marginRight": "15px"}),
                         html.Span("Welcome to the Data Analysis Dashboard!", style={"fontSize": "1.6em", "fontWeight": "bold", "color": "var(--primary)"})
                     ], style={"display": "flex", "alignItems": "center"})
-                ], style=custom_css["card_header"]),
+                ], className="dash-card-header"),
                 dbc.CardBody([
                     html.Div([
                         html.P("This dashboard is your all-in-one solution for exploring, cleaning, visualizing, and modeling your data. Whether you're a beginner or an expert, you can easily upload your CSV or Excel files and start analyzing in just a few clicks.", style={"color": "var(--text-secondary)", "fontSize": "18px", "marginBottom": "18px"}),
                         html.Ul([
-                            html.Li([html.I(className="fas fa-mouse-pointer", style={"color": "var(--primary)", "marginRight": "8px"}), "Intuitive and interactive: No coding required, just point and click!"], style={"fontSize": "16px", "marginBottom": "10px", "color": "var(--text-primary)"}),
-                            html.Li([html.I(className="fas fa-users", style={"color": "var(--primary)", "marginRight": "8px"}), "Accessible to everyone: Designed for all users, regardless of experience."], style={"fontSize": "16px", "marginBottom": "10px", "color": "var(--text-primary)"}),
-                            html.Li([html.I(className="fas fa-chart-bar", style={"color": "var(--primary)", "marginRight": "8px"}), "Powerful features: Data cleaning, visualization, machine learning, and more."], style={"fontSize": "16px", "marginBottom": "10px", "color": "var(--text-primary)"}),
-                            html.Li([html.I(className="fas fa-magic", style={"color": "var(--primary)", "marginRight": "8px"}), "Modern, beautiful, and responsive design."], style={"fontSize": "16px", "marginBottom": "10px", "color": "var(--text-primary)"}),
+                            html.Li([html.I(className="icon icon-mouse-pointer", style={"color": "var(--primary)", "marginRight": "8px"}), "Intuitive and interactive: No coding required, just point and click!"], style={"fontSize": "16px", "marginBottom": "10px", "color": "var(--text-primary)"}),
+                            html.Li([html.I(className="icon icon-users", style={"color": "var(--primary)", "marginRight": "8px"}), "Accessible to everyone: Designed for all users, regardless of experience."], style={"fontSize": "16px", "marginBottom": "10px", "color": "var(--text-primary)"}),
+                            html.Li([html.I(className="icon icon-chart-bar", style={"color": "var(--primary)", "marginRight": "8px"}), "Powerful features: Data cleaning, visualization, machine learning, and more."], style={"fontSize": "16px", "marginBottom": "10px", "color": "var(--text-primary)"}),
+                            html.Li([html.I(className="icon icon-magic", style={"color": "var(--primary)", "marginRight": "8px"}), "Modern, beautiful, and responsive design."], style={"fontSize": "16px", "marginBottom": "10px", "color": "var(--text-primary)"}),
                         ], style={"marginBottom": "25px"}),
                         html.P("Get started by uploading your data, or explore the tabs to see what you can do!", style={"color": "var(--primary)", "fontWeight": "bold", "fontSize": "18px", "marginBottom": "30px"}),
                     ]),
@@ -1474,7 +1553,7 @@ app.layout = html.Div(style=custom_css["background"], children=[
                                 html.H4("About the Author", style={"color": "var(--primary)", "fontWeight": "bold", "marginBottom": "10px"}),
                                 html.P("I'm Ilyes Frigui, a first-year computer science engineering student at ESSAI in Tunisia. I'm passionate about technology, artificial intelligence, and data science. I'm currently part of a machine learning club, where I actively participate in projects and workshops focused on real-world applications of AI. I enjoy solving complex problems, building useful tools, and collaborating with others to turn ideas into reality. Outside academics, I'm involved in extracurricular activities such as Enactus, where I develop my teamwork and leadership skills.", style={"color": "var(--text-secondary)", "fontSize": "16px"}),
                                 html.Div([
-                                    html.I(className="fas fa-envelope", style={"color": "var(--primary)", "marginRight": "8px"}),
+                                    html.I(className="icon icon-envelope", style={"color": "var(--primary)", "marginRight": "8px"}),
                                     html.A("ilyes.frigui.ps@gmail.com", href="mailto:ilyes.frigui.ps@gmail.com", style={"color": "var(--primary)", "textDecoration": "underline", "fontWeight": "bold"})
                                 ], style={"marginTop": "10px", "fontSize": "16px"})
                             ])
@@ -1485,1527 +1564,714 @@ app.layout = html.Div(style=custom_css["background"], children=[
         ]),
 
         # Import tab
-        html.Div(id="import-content", style={"display": "block", "opacity": "1", "transition": "opacity 0.3s ease-in-out"}, children=[
-            dbc.Card([
-                dbc.CardHeader("Import Data", style=custom_css["card_header"]),
-                dbc.CardBody([
-                    dcc.Upload(
-                        id="upload-data",
-                        children=html.Div([
-                            html.I(className="fas fa-cloud-upload-alt mr-2", style={"fontSize": "24px", "color": "var(--primary)"}),
-                            "Drag and Drop or ",
-                            html.A("Select a File", style={"color": "var(--primary)", "fontWeight": "bold", "textDecoration": "underline"}),
-                        ]),
-                        style=custom_css["upload"],
-                        className="upload-area",
-                    ),
-                    html.Div(id="file-upload-status", style={
-                        "color": "#a3a3a3",
-                        "textAlign": "center",
-                        "marginBottom": "15px"
-                    }),
-                    dbc.Checklist(
-                        id="header-checkbox",
-                        options=[{"label": html.Span("First row is header", style={"color": "#FFFFFF"}), "value": "header"}],
-                        value=["header"],
-                        inline=True,
-                        style={"marginBottom": "15px", "color": "#e6e6e6"}
-                    ),
-                    dash_table.DataTable(
-                        id="data-table",
-                        page_size=10,
-                        style_table={"overflowX": "auto", **custom_css["table"]},
-                        style_header=custom_css["table_header"],
-                        style_cell={
-                            "backgroundColor": "#16213e",
-                            "color": "#e6e6e6",
-                            "padding": "10px",
-                            "border": "1px solid #2a3a5e"
-                        },
-                        style_data_conditional=[
-                            {
-                                "if": {"row_index": "odd"},
-                                "backgroundColor": "#1a1a2e"
-                            }
-                        ],
-                    ),
+        html.Div(id="import-content", style={"display": "block", "opacity": "1"}, children=[
+            card("Import Data", [
+                dcc.Upload(
+                    id="upload-data",
+                    children=html.Div([
+                        html.I(className="icon icon-cloud-upload-alt mr-2", style={"fontSize": "24px", "color": "var(--primary)"}),
+                        "Drag and Drop or ",
+                        html.A("Select a File", style={"color": "var(--primary)", "fontWeight": "bold", "textDecoration": "underline"}),
+                    ]),
+                    className="upload-area dash-upload",
+                ),
+                html.Div(id="file-upload-status", style={
+                    "color": "#a3a3a3",
+                    "textAlign": "center",
+                    "marginBottom": "15px"
+                }),
+                dbc.Checklist(
+                    id="header-checkbox",
+                    options=[{"label": "First row is header", "value": "header"}],
+                    value=["header"],
+                    inline=True,
+                    style={"marginBottom": "15px", "color": "#e6e6e6"}
+                ),
+                dash_table.DataTable(
+                    id="data-table",
+                    page_current=0,
+                    page_size=10,
+                    page_action="custom",
+                    sort_action="custom",
+                    sort_mode="multi",
+                    filter_action="custom",
+                    style_table=STYLES["table_virtualized"],
+                    virtualization=True,
+                    fixed_rows={"headers": True},
+                    style_header=custom_css["table_header"],
+                    style_cell=custom_css["table_cell"],
+                ),
+                dbc.Button([
+                    icon("download"),
+                    "Download Data"
+                ], id="download-button", style=custom_css["button"]),
+                html.Div([
                     dbc.Button([
-                        html.I(className="fas fa-download mr-2"),
-                        "Download Data"
-                    ], id="download-button", style=custom_css["button"]),
-                    dcc.Download(id="download-data"),
-                    html.Div([
-                        dbc.Button([
-                            html.I(className="fas fa-file-excel mr-2"),
-                            "Excel"
-                        ], id="export-excel-button", color="success", style={"marginRight": "10px", "marginTop": "15px"}),
-                        dbc.Button([
-                            html.I(className="fas fa-file-code mr-2"),
-                            "JSON"
-                        ], id="export-json-button", color="info", style={"marginRight": "10px", "marginTop": "15px"}),
-                        dbc.Button([
-                            html.I(className="fas fa-file-csv mr-2"),
-                            "CSV"
-                        ], id="export-csv-button", color="warning", style={"marginTop": "15px"}),
-                    ], style={"display": "flex", "justifyContent": "center", "width": "100%", "marginTop": "10px"}),
-                    dcc.Download(id="export-excel"),
-                    dcc.Download(id="export-json"),
-                    dcc.Download(id="export-csv"),
-                ]),
-            ], style=custom_css["card"]),
+                        icon("file-excel"),
+                        "Excel"
+                    ], id="export-excel-button", color="success", style={"marginRight": "10px", "marginTop": "15px"}),
+                    dbc.Button([
+                        icon("file-code"),
+                        "JSON"
+                    ], id="export-json-button", color="info", style={"marginRight": "10px", "marginTop": "15px"}),
+                    dbc.Button([
+                        icon("file-csv"),
+                        "CSV"
+                    ], id="export-csv-button", color="warning", style={"marginTop": "15px"}),
+                ], style={"display": "flex", "justifyContent": "center", "width": "100%", "marginTop": "10px"}),
+            ]),
         ]),
 
         # Summary tab
-        html.Div(id="summary-content", style={"display": "none", "opacity": "0", "transition": "opacity 0.3s ease-in-out"}, children=[
-            dbc.Card([
-                dbc.CardHeader("Summary Statistics", style=custom_css["card_header"]),
-                dbc.CardBody([
-                    dbc.Row([
-                        dbc.Col([
-                            dbc.Card([
-                                dbc.CardHeader("Dataset Overview", style=custom_css["card_header"]),
-                                dbc.CardBody([
-                                    dbc.Row([
-                                        dbc.Col([
-                                            html.Div([
-                                                html.I(className="fas fa-list-ol fa-2x mr-2", style={"color": "var(--primary)"}),
-                                                html.H5("Number of Rows", className="mb-0", style={
-                                                    "fontSize": "16px",
-                                                    "fontWeight": "600",
-                                                    "color": "var(--text-primary)",
-                                                    "marginBottom": "5px"
-                                                }),
-                                                html.P(id="num-rows", className="mb-0", style={
-                                                    "fontSize": "24px",
-                                                    "fontWeight": "700",
-                                                    "color": "var(--primary)",
-                                                    "textShadow": "0 0 5px var(--primary-shadow)"
-                                                })
-                                            ], style={"textAlign": "center"})
-                                        ], width=6),
-                                        dbc.Col([
-                                            html.Div([
-                                                html.I(className="fas fa-columns fa-2x mr-2", style={"color": "var(--primary)"}),
-                                                html.H5("Number of Columns", className="mb-0", style={
-                                                    "fontSize": "16px",
-                                                    "fontWeight": "600",
-                                                    "color": "var(--text-primary)",
-                                                    "marginBottom": "5px"
-                                                }),
-                                                html.P(id="num-cols", className="mb-0", style={
-                                                    "fontSize": "24px",
-                                                    "fontWeight": "700",
-                                                    "color": "var(--primary)",
-                                                    "textShadow": "0 0 5px var(--primary-shadow)"
-                                                })
-                                            ], style={"textAlign": "center"})
-                                        ], width=6),
-                                    ]),
-                                ]),
-                            ], style=custom_css["card"]),
-                        ], width=12),
-                    ]),
-                    dbc.Row([
-                        dbc.Col([
-                            dbc.Card([
-                                dbc.CardHeader("Column Statistics", style=custom_css["card_header"]),
-                                dbc.CardBody([
-                                    dash_table.DataTable(
-                                        id="summary-table",
-                                        page_size=10,
-                                        style_table={"overflowX": "auto", **custom_css["table"]},
-                                        style_header=custom_css["table_header"],
-                                        style_cell={
-                                            "backgroundColor": "#16213e",
-                                            "color": "#e6e6e6",
-                                            "padding": "10px",
-                                            "border": "1px solid #2a3a5e"
-                                        },
-                                        style_data_conditional=[
-                                            {
-                                                "if": {"row_index": "odd"},
-                                                "backgroundColor": "#1a1a2e"
-                                            }
-                                        ],
-                                    ),
-                                ]),
-                            ], style=custom_css["card"]),
-                        ], width=12),
-                    ]),
-                    dbc.Row([
-                        dbc.Col([
-                            dbc.Card([
-                                dbc.CardHeader("Missing Values", style=custom_css["card_header"]),
-                                dbc.CardBody([
-                                    html.Div(id="missing-values-summary", style={
-                                        "textAlign": "center",
-                                        "color": "#e6e6e6"
-                                    }),
-                                ]),
-                            ], style=custom_css["card"]),
-                        ], width=12),
-                    ]),
-                    dbc.Row([
-                        dbc.Col(
-                            dbc.Alert(
-                                id="summary-error",
-                                color="danger",
-                                is_open=False,
-                                duration=4000
+        html.Div(id="summary-content", style={"display": "none", "opacity": "0"}, children=[
+            card("Summary Statistics", [
+                dbc.Row([
+                    dbc.Col([
+                        card("Dataset Overview", [
+                            dbc.Row([
+                                dbc.Col([
+                                    html.Div([
+                                        html.I(className="icon icon-list-ol icon-2x mr-2", style={"color": "var(--primary)"}),
+                                        html.H5("Number of Rows", className="mb-0", style={
+                                            "fontSize": "16px",
+                                            "fontWeight": "600",
+                                            "color": "var(--text-primary)",
+                                            "marginBottom": "5px"
+                                        }),
+                                        html.P(id="num-rows", className="mb-0", style={
+                                            "fontSize": "24px",
+                                            "fontWeight": "700",
+                                            "color": "var(--primary)",
+                                            "textShadow": "0 0 5px var(--primary-shadow)"
+                                        })
+                                    ], style={"textAlign": "center"})
+                                ], width=6),
+                                dbc.Col([
+                                    html.Div([
+                                        html.I(className="icon icon-columns icon-2x mr-2", style={"color": "var(--primary)"}),
+                                        html.H5("Number of Columns", className="mb-0", style={
+                                            "fontSize": "16px",
+                                            "fontWeight": "600",
+                                            "color": "var(--text-primary)",
+                                            "marginBottom": "5px"
+                                        }),
+                                        html.P(id="num-cols", className="mb-0", style={
+                                            "fontSize": "24px",
+                                            "fontWeight": "700",
+                                            "color": "var(--primary)",
+                                            "textShadow": "0 0 5px var(--primary-shadow)"
+                                        })
+                                    ], style={"textAlign": "center"})
+                                ], width=6),
+                            ]),
+                        ]),
+                    ], width=12),
+                ]),
+                dbc.Row([
+                    dbc.Col([
+                        card("Column Statistics", [
+                            dash_table.DataTable(
+                                id="summary-table",
+                                page_size=10,
+                                style_table=STYLES["table_scroll"],
+                                style_header=custom_css["table_header"],
+                                style_cell=custom_css["table_cell"],
                             ),
-                            width=12
+                        ]),
+                    ], width=12),
+                ]),
+                dbc.Row([
+                    dbc.Col([
+                        card("Missing Values", [
+                            html.Div(id="missing-values-summary", style={
+                                "textAlign": "center",
+                                "color": "#e6e6e6"
+                            }),
+                        ]),
+                    ], width=12),
+                ]),
+                dbc.Row([
+                    dbc.Col(
+                        dbc.Alert(
+                            id="summary-error",
+                            color="danger",
+                            is_open=False,
+                            duration=4000
                         ),
-                    ]),
+                        width=12
+                    ),
                 ]),
-            ], style=custom_css["card"]),
+            ]),
         ]),
 
         # Imputation tab
-        html.Div(id="imputation-content", style={"display": "none", "opacity": "0", "transition": "opacity 0.3s ease-in-out"}, children=[
-            dbc.Card([
-                dbc.CardHeader("Data Imputation", style=custom_css["card_header"]),
-                dbc.CardBody([
-                    dbc.Row([
-                        dbc.Col([
-                            dbc.Card([
-                                dbc.CardHeader("Missing Value Handling", style={**custom_css["card_header"], "fontSize": "18px", "fontWeight": "500"}),
-                                dbc.CardBody([
-                                    html.Div(id="missing-values-message", style={
-                                        "marginBottom": "20px",
+        html.Div(id="imputation-content", style={"display": "none", "opacity": "0"}, children=[
+            card("Data Imputation", [
+                dbc.Row([
+                    dbc.Col([
+                        dbc.Card([
+                            dbc.CardHeader("Missing Value Handling", className="dash-card-header", style=STYLES["card_header_large"]),
+                            dbc.CardBody([
+                                html.Div(id="missing-values-message", style={
+                                    "marginBottom": "20px",
+                                    "color": "#e6e6e6",
+                                    "padding": "10px",
+                                    "borderRadius": "6px",
+                                    "backgroundColor": "rgba(26, 188, 156, 0.1)"
+                                }),
+                                html.Div([
+                                    html.Label("Select columns with missing values:", style={
                                         "color": "#e6e6e6",
-                                        "padding": "10px",
-                                        "borderRadius": "6px",
-                                        "backgroundColor": "rgba(26, 188, 156, 0.1)"
+                                        "fontWeight": "500",
+                                        "marginBottom": "8px",
+                                        "display": "block"
                                     }),
-                                    html.Div([
-                                        html.Label("Select columns with missing values:", style={
-                                            "color": "#e6e6e6",
-                                            "fontWeight": "500",
-                                            "marginBottom": "8px",
-                                            "display": "block"
-                                        }),
-                                        dcc.Dropdown(
-                                            id="imputation-columns",
-                                            multi=True,
-                                            placeholder="Select columns to impute",
-                                            style={"marginBottom": "25px", **custom_css["dropdown"]},
-                                            className='dropdown-dark custom-dropdown'
-                                        )
-                                    ]),
-                                    html.Div([
-                                        html.Label("Select imputation method:", style={
-                                            "color": "#e6e6e6",
-                                            "fontWeight": "500",
-                                            "marginBottom": "8px",
-                                            "display": "block"
-                                        }),
-                                        dcc.Dropdown(
-                                            id="missing-method",
-                                            options=[
-                                                {"label": html.Span("Replace with mean (numeric only)", style={"color": "#FFFFFF"}), "value": "mean"},
-                                                {"label": html.Span("Replace with median (numeric only)", style={"color": "#FFFFFF"}), "value": "median"},
-                                                {"label": html.Span("Replace with mode (numeric & categorical)", style={"color": "#FFFFFF"}), "value": "mode"},
-                                                {"label": html.Span("KNN Imputation (numeric only)", style={"color": "#FFFFFF"}), "value": "knn"},
-                                            ],
-                                            value="mean",
-                                            placeholder="Select imputation method",
-                                            style={"marginBottom": "25px", **custom_css["dropdown"]},
-                                            className='dropdown-dark custom-dropdown'
-                                        )
-                                    ]),
-                                    html.Div([
-                                        dbc.Button(
-                                            "Apply Imputation",
-                                            id="apply-imputation-button",
-                                            color="primary",
-                                            className="mt-2",
-                                            style={
-                                                "backgroundColor": "#1abc9c",
-                                                "border": "none",
-                                                "width": "100%",
-                                                "padding": "12px",
-                                                "fontWeight": "500",
-                                                "boxShadow": "0 4px 6px rgba(0, 0, 0, 0.1)",
-                                                "transition": "all 0.3s ease"
-                                            }
-                                        ),
-                                    ]),
-                                    dbc.Toast(
-                                        "Imputation applied successfully!",
-                                        id="imputation-success-toast",
-                                        header="Success",
-                                        is_open=False,
-                                        dismissable=True,
-                                        icon="success",
-                                        duration=4000,
-                                        style={
-                                            "position": "fixed",
-                                            "top": 10,
-                                            "right": 10,
-                                            "width": 350,
-                                            "zIndex": 1999
-                                        }
-                                    ),
-                                    dbc.Toast(
-                                        "Please select at least one column for imputation.",
-                                        id="imputation-warning-toast",
-                                        header="Warning",
-                                        is_open=False,
-                                        dismissable=True,
-                                        icon="danger",
-                                        duration=4000,
-                                        style={
-                                            "position": "fixed",
-                                            "top": 10,
-                                            "right": 10,
-                                            "width": 350,
-                                            "zIndex": 1999
-                                        }
-                                    ),
+                                    dark_dropdown(
+                                        id="imputation-columns",
+                                        multi=True,
+                                        placeholder="Select columns to impute",
+                                        style=dropdown_style(marginBottom="25px"),
+                                    )
                                 ]),
-                            ], style=custom_css["card"]),
-                        ], width=4),
-                        dbc.Col([
-                            dbc.Card([
-                                dbc.CardHeader("Duplicate Rows Handling", style=custom_css["card_header"]),
-                                dbc.CardBody([
-                                    html.Div(id="duplicates-message", style={
-                                        "marginBottom": "15px",
-                                        "color": "#e6e6e6"
+                                html.Div([
+                                    html.Label("Select imputation method:", style={
+                                        "color": "#e6e6e6",
+                                        "fontWeight": "500",
+                                        "marginBottom": "8px",
+                                        "display": "block"
                                     }),
-                                    dbc.Button(
-                                        [html.I(className="fas fa-search mr-2"), "Find Duplicates"],
-                                        id="find-duplicates-button",
-                                        style=custom_css["button"]
-                                    ),
-                                    dbc.Button(
-                                        [html.I(className="fas fa-trash-alt mr-2"), "Remove Duplicates"],
-                                        id="remove-duplicates-button",
-                                        style=custom_css["button"],
-                                        disabled=True
-                                    ),
-                                ]),
-                            ], style=custom_css["card"]),
-                        ], width=4),
-                        dbc.Col([
-                            dbc.Card([
-                                dbc.CardHeader("Outlier Detection", style=custom_css["card_header"]),
-                                dbc.CardBody([
-                                    dcc.Dropdown(
-                                        id="outlier-columns",
-                                        multi=True,
-                                        placeholder="Select numeric columns",
-                                        style={"marginBottom": "15px", **custom_css["dropdown"]},
-                                        className='dropdown-dark custom-dropdown'
-                                    ),
-                                    dcc.Dropdown(
-                                        id="outlier-method",
+                                    dark_dropdown(
+                                        id="missing-method",
                                         options=[
-                                            {"label": html.Span("IQR Method", style={"color": "#FFFFFF"}), "value": "iqr"},
-                                            {"label": html.Span("Z-Score Method", style={"color": "#FFFFFF"}), "value": "zscore"},
+                                            {"label": "Replace with mean (numeric only)", "value": "mean"},
+                                            {"label": "Replace with median (numeric only)", "value": "median"},
+                                            {"label": "Replace with mode (numeric & categorical)", "value": "mode"},
+                                            {"label": "KNN Imputation (numeric only)", "value": "knn"},
                                         ],
-                                        value="iqr",
-                                        placeholder="Select detection method",
-                                        style={"marginBottom": "15px", **custom_css["dropdown"]},
-                                        className='dropdown-dark custom-dropdown'
-                                    ),
-                                    dbc.Input(
-                                        id="outlier-threshold",
-                                        type="number",
-                                        placeholder="Threshold (default: 3 for z-score, 1.5 for IQR)",
-                                        style={"marginBottom": "15px", **custom_css["dropdown"]}
-                                    ),
-                                    dbc.Button(
-                                        [html.I(className="fas fa-search mr-2"), "Detect Outliers"],
-                                        id="detect-outliers-button",
-                                        style=custom_css["button"]
-                                    ),
-                                    html.Div(id="outliers-message", style={"marginTop": "15px"}),
-                                    dcc.Dropdown(
-                                        id="outlier-handling-method",
-                                        options=[
-                                            {"label": html.Span("Remove outliers", style={"color": "#FFFFFF"}), "value": "remove"},
-                                            {"label": html.Span("Replace with median", style={"color": "#FFFFFF"}), "value": "median"},
-                                            {"label": html.Span("Replace with mean", style={"color": "#FFFFFF"}), "value": "mean"},
-                                        ],
-                                        value="remove",
-                                        placeholder="Select handling method",
-                                        style={"marginTop": "15px", **custom_css["dropdown"]},
-                                        className='dropdown-dark custom-dropdown'
-                                    ),
-                                    dbc.Button(
-                                        [html.I(className="fas fa-wrench mr-2"), "Handle Outliers"],
-                                        id="handle-outliers-button",
-                                        style=custom_css["button"],
-                                        disabled=True
-                                    ),
+                                        value="mean",
+                                        placeholder="Select imputation method",
+                                        style=dropdown_style(marginBottom="25px"),
+                                    )
                                 ]),
-                            ], style=custom_css["card"]),
-                        ], width=4),
-                    ]),
-                    dbc.Row([
-                        dbc.Col([
-                            dbc.Card([
-                                dbc.CardHeader("Preview", style=custom_css["card_header"]),
-                                dbc.CardBody([
-                                    dcc.Dropdown(
-                                        id="imputation-rows",
-                                        options=[
-                                            {"label": html.Span("Show 5 rows", style={"color": "#FFFFFF"}), "value": 5},
-                                            {"label": html.Span("Show 10 rows", style={"color": "#FFFFFF"}), "value": 10},
-                                            {"label": html.Span("Show 20 rows", style={"color": "#FFFFFF"}), "value": 20},
-                                            {"label": html.Span("Show 50 rows", style={"color": "#FFFFFF"}), "value": 50},
-                                            {"label": html.Span("Show all rows", style={"color": "#FFFFFF"}), "value": "all"},
-                                        ],
-                                        value=10,
-                                        placeholder="Select number of rows to display",
-                                        style={"marginBottom": "20px", **custom_css["dropdown"]},
-                                        className='dropdown-dark custom-dropdown'
-                                    ),
-                                    dash_table.DataTable(
-                                        id="imputed-table",
-                                        style_table={"overflowX": "auto", **custom_css["table"]},
-                                        style_header=custom_css["table_header"],
-                                        style_cell={
-                                            "backgroundColor": "#16213e",
-                                            "color": "#e6e6e6",
-                                            "padding": "10px",
-                                            "border": "1px solid #2a3a5e"
-                                        },
-                                        style_data_conditional=[
-                                            {
-                                                "if": {"row_index": "odd"},
-                                                "backgroundColor": "#1a1a2e"
-                                            }
-                                        ],
+                                html.Div([
+                                    dbc.Button(
+                                        "Apply Imputation",
+                                        id="apply-imputation-button",
+                                        color="primary",
+                                        className="mt-2",
+                                        style={
+                                            "backgroundColor": "#1abc9c",
+                                            "border": "none",
+                                            "width": "100%",
+                                            "padding": "12px",
+                                            "fontWeight": "500",
+                                            "boxShadow": "0 4px 6px rgba(0, 0, 0, 0.1)",
+                                            "transition": "all 0.3s ease"
+                                        }
                                     ),
-                                    html.Div([
-                                        html.H6("Download Imputed Data", style={"marginTop": "20px", "marginBottom": "10px", "color": "#e6e6e6"}),
-                                        html.Div([
-                                            dbc.Button([
-                                                html.I(className="fas fa-file-csv mr-2"),
-                                                "CSV"
-                                            ], id="download-imputed-csv-button", color="success", style={"marginRight": "10px"}),
-                                            dbc.Button([
-                                                html.I(className="fas fa-file-code mr-2"),
-                                                "JSON"
-                                            ], id="download-imputed-json-button", color="info", style={"marginRight": "10px"}),
-                                            dbc.Button([
-                                                html.I(className="fas fa-file-excel mr-2"),
-                                                "Excel"
-                                            ], id="download-imputed-excel-button", color="warning"),
-                                        ], style={"display": "flex", "justifyContent": "center", "width": "100%"}),
-                                        dcc.Download(id="download-imputed-csv"),
-                                        dcc.Download(id="download-imputed-json"),
-                                        dcc.Download(id="download-imputed-excel"),
-                                    ], style={"marginTop": "15px", "textAlign": "center"}),
                                 ]),
-                            ], style=custom_css["card"]),
-                        ], width=12),
-                    ]),
+                            ]),
+                        ], style=custom_css["card"]),
+                    ], width=4),
+                    dbc.Col([
+                        card("Duplicate Rows Handling", [
+                            html.Div(id="duplicates-message", style={
+                                "marginBottom": "15px",
+                                "color": "#e6e6e6"
+                            }),
+                            dbc.Button(
+                                [icon("search"), "Find Duplicates"],
+                                id="find-duplicates-button",
+                                style=custom_css["button"]
+                            ),
+                            dbc.Button(
+                                [icon("trash-alt"), "Remove Duplicates"],
+                                id="remove-duplicates-button",
+                                style=custom_css["button"],
+                                disabled=True
+                            ),
+                        ]),
+                    ], width=4),
+                    dbc.Col([
+                        card("Outlier Detection", [
+                            dark_dropdown(
+                                id="outlier-columns",
+                                multi=True,
+                                placeholder="Select numeric columns",
+                                style=dropdown_style(marginBottom="15px"),
+                            ),
+                            dark_dropdown(
+                                id="outlier-method",
+                                options=[
+                                    {"label": "IQR Method", "value": "iqr"},
+                                    {"label": "Z-Score Method", "value": "zscore"},
+                                ],
+                                value="iqr",
+                                placeholder="Select detection method",
+                                style=dropdown_style(marginBottom="15px"),
+                            ),
+                            dbc.Input(
+                                id="outlier-threshold",
+                                type="number",
+                                debounce=True,
+                                placeholder="Threshold (default: 3 for z-score, 1.5 for IQR)",
+                                style=dropdown_style(marginBottom="15px")
+                            ),
+                            dbc.Button(
+                                [icon("search"), "Detect Outliers"],
+                                id="detect-outliers-button",
+                                style=custom_css["button"]
+                            ),
+                            html.Div(id="outliers-message", style={"marginTop": "15px"}),
+                            dark_dropdown(
+                                id="outlier-handling-method",
+                                options=[
+                                    {"label": "Remove outliers", "value": "remove"},
+                                    {"label": "Replace with median", "value": "median"},
+                                    {"label": "Replace with mean", "value": "mean"},
+                                ],
+                                value="remove",
+                                placeholder="Select handling method",
+                                style=dropdown_style(marginTop="15px"),
+                            ),
+                            dbc.Button(
+                                [icon("wrench"), "Handle Outliers"],
+                                id="handle-outliers-button",
+                                style=custom_css["button"],
+                                disabled=True
+                            ),
+                        ]),
+                    ], width=4),
                 ]),
-            ], style=custom_css["card"]),
+                dbc.Row([
+                    dbc.Col([
+                        card("Preview", [
+                            dark_dropdown(
+                                id="imputation-rows",
+                                options=[
+                                    {"label": "Show 5 rows", "value": 5},
+                                    {"label": "Show 10 rows", "value": 10},
+                                    {"label": "Show 20 rows", "value": 20},
+                                    {"label": "Show 50 rows", "value": 50},
+                                    {"label": "Show all rows", "value": "all"},
+                                ],
+                                value=10,
+                                placeholder="Select number of rows to display",
+                                style=dropdown_style(marginBottom="20px"),
+                            ),
+                            dash_table.DataTable(
+                                id="imputed-table",
+                                page_current=0,
+                                page_size=10,
+                                page_action="custom",
+                                sort_action="custom",
+                                sort_mode="multi",
+                                filter_action="custom",
+                                style_table=STYLES["table_virtualized"],
+                                virtualization=True,
+                                fixed_rows={"headers": True},
+                                style_header=custom_css["table_header"],
+                                style_cell=custom_css["table_cell"],
+                            ),
+                            html.Div([
+                                html.H6("Download Imputed Data", style={"marginTop": "20px", "marginBottom": "10px", "color": "#e6e6e6"}),
+                                html.Div([
+                                    dbc.Button([
+                                        icon("file-csv"),
+                                        "CSV"
+                                    ], id="download-imputed-csv-button", color="success", style={"marginRight": "10px"}),
+                                    dbc.Button([
+                                        icon("file-code"),
+                                        "JSON"
+                                    ], id="download-imputed-json-button", color="info", style={"marginRight": "10px"}),
+                                    dbc.Button([
+                                        icon("file-excel"),
+                                        "Excel"
+                                    ], id="download-imputed-excel-button", color="warning"),
+                                ], style={"display": "flex", "justifyContent": "center", "width": "100%"}),
+                            ], style={"marginTop": "15px", "textAlign": "center"}),
+                        ]),
+                    ], width=12),
+                ]),
+            ]),
         ]),
 
         # Statistics tab
-        html.Div(id="statistics-content", style={"display": "none", "opacity": "0", "transition": "opacity 0.3s ease-in-out"}, children=[
-            dbc.Card([
-                dbc.CardHeader("Data Visualization", style=custom_css["card_header"]),
-                dbc.CardBody([
-                    # New Auto-generated visualizations section
-                    dbc.Row([
-                        dbc.Col([
-                            html.H4("Data Overview", style={"color": "#FFFFFF", "marginBottom": "20px"}),
-                            html.P("Automatically generated visualizations based on your data:",
-                                  style={"color": "#e6e6e6", "marginBottom": "20px"}),
-                            dbc.Spinner(html.Div(id="auto-visualizations")),
-                        ], width=12),
-                    ]),
-                    html.Hr(style={"borderColor": "#2a3a5e", "margin": "30px 0"}),
-
-                    # Original custom plot controls section
-                    html.H4("Custom Plot Controls", style={"color": "#FFFFFF", "marginBottom": "20px"}),
-                    html.P("Create your own custom visualizations by selecting options below:",
-                          style={"color": "#e6e6e6", "marginBottom": "20px"}),
-                    dbc.Row([
-                        dbc.Col([
-                            dbc.Card([
-                                dbc.CardHeader("Plot Controls", style=custom_css["card_header"]),
-                                dbc.CardBody([
-                                    # X-axis selection
-                                    html.Div(className="form-group", style={"marginBottom": "25px"}, children=[
-                                        html.Label("Select X-axis:", style={
-                                            "color": "#e6e6e6",
-                                            "fontWeight": "bold",
-                                            "marginBottom": "12px",
-                                            "fontSize": "16px",
-                                            "display": "block"
-                                        }),
-                                        dcc.Dropdown(
-                                            id="x-axis-dropdown",
-                                            placeholder="Select X-axis",
-                                            style={"height": "40px", **custom_css["dropdown"]},
-                                            className='dropdown-dark custom-dropdown'
-                                        ),
-                                    ]),
-
-                                    # Y-axis selection
-                                    html.Div(className="form-group", style={"marginBottom": "25px"}, children=[
-                                        html.Label("Select Y-axis (optional):", style={
-                                            "color": "#e6e6e6",
-                                            "fontWeight": "bold",
-                                            "marginBottom": "12px",
-                                            "fontSize": "16px",
-                                            "display": "block"
-                                        }),
-                                        dcc.Dropdown(
-                                            id="y-axis-dropdown",
-                                            placeholder="Select Y-axis",
-                                            style={"height": "40px", **custom_css["dropdown"]},
-                                            className='dropdown-dark custom-dropdown'
-                                        ),
-                                    ]),
-
-                                    # Plot type selection
-                                    html.Div(className="form-group", style={"marginBottom": "25px"}, children=[
-                                        html.Label("Select Plot Type:", style={
-                                            "color": "#e6e6e6",
-                                            "fontWeight": "bold",
-                                            "marginBottom": "12px",
-                                            "fontSize": "16px",
-                                            "display": "block"
-                                        }),
-                                        dcc.Dropdown(
-                                            id="plot-type-dropdown",
-                                            options=[
-                                                {"label": html.Span("Scatter Plot", style={"color": "#FFFFFF"}), "value": "scatter"},
-                                                {"label": html.Span("Line Chart", style={"color": "#FFFFFF"}), "value": "line"},
-                                                {"label": html.Span("Bar Chart", style={"color": "#FFFFFF"}), "value": "bar"},
-                                                {"label": html.Span("Box Plot", style={"color": "#FFFFFF"}), "value": "box"},
-                                                {"label": html.Span("Violin Plot", style={"color": "#FFFFFF"}), "value": "violin"},
-                                                {"label": html.Span("Histogram", style={"color": "#FFFFFF"}), "value": "histogram"},
-                                                {"label": html.Span("Pie Chart", style={"color": "#FFFFFF"}), "value": "pie"},
-                                                {"label": html.Span("Heatmap", style={"color": "#FFFFFF"}), "value": "heatmap"},
-                                                {"label": html.Span("Time Series", style={"color": "#FFFFFF"}), "value": "timeseries"},
-                                                {"label": html.Span("Scatter Matrix", style={"color": "#FFFFFF"}), "value": "scattermatrix"},
-                                                {"label": html.Span("3D Scatter", style={"color": "#FFFFFF"}), "value": "scatter3d"},
-                                                {"label": html.Span("3D Surface", style={"color": "#FFFFFF"}), "value": "surface3d"},
-                                                {"label": html.Span("Choropleth Map", style={"color": "#FFFFFF"}), "value": "choropleth"},
-                                                {"label": html.Span("Scatter Map", style={"color": "#FFFFFF"}), "value": "scattermap"},
-                                                {"label": html.Span("Q-Q Plot", style={"color": "#FFFFFF"}), "value": "qqplot"},
-                                                {"label": html.Span("Residual Plot", style={"color": "#FFFFFF"}), "value": "residual"},
-                                            ],
-                                            value="scatter",
-                                            clearable=False,
-                                            style={"marginBottom": "15px", **custom_css["dropdown"]},
-                                            className='dropdown-dark custom-dropdown'
-                                        ),
-                                    ]),
-
-                                    # Bin size slider
-                                    html.Div(id="bin-size-col", className="form-group", style={"marginBottom": "35px"}, children=[
-                                        html.Label("Adjust Bin Size (for histograms):", style={
-                                            "color": "#e6e6e6",
-                                            "fontWeight": "bold",
-                                            "marginBottom": "20px",
-                                            "fontSize": "16px",
-                                            "display": "block"
-                                        }),
-                                        html.Div([
-                                            dcc.Slider(
-                                                id="bin-size-slider",
-                                                min=5,
-                                                max=50,
-                                                step=5,
-                                                value=10,
-                                                marks={i: {"label": str(i), "style": {"color": "white", "font-size": "14px"}}
-                                                      for i in range(5, 51, 5)},
-                                            )
-                                        ], style={"paddingTop": "15px", "paddingBottom": "15px", "paddingLeft": "10px", "paddingRight": "10px"}),
-                                    ]),
-
-                                    # Time Series Controls (hidden by default)
-                                    html.Div(id="time-series-controls", style={"display": "none", "marginBottom": "25px"}, children=[
-                                        # Date column
-                                        html.Div(className="form-group", style={"marginBottom": "20px"}, children=[
-                                            html.Label("Date Column:", style={
-                                                "color": "#e6e6e6",
-                                                "fontWeight": "bold",
-                                                "marginBottom": "12px",
-                                                "fontSize": "16px",
-                                                "display": "block"
-                                            }),
-                                            dcc.Dropdown(
-                                                id="date-column-dropdown",
-                                                placeholder="Select date column",
-                                                style={"height": "40px", **custom_css["dropdown"]},
-                                                className='dropdown-dark custom-dropdown'
-                                            ),
-                                        ]),
-
-                                        # Value column
-                                        html.Div(className="form-group", style={"marginBottom": "20px"}, children=[
-                                            html.Label("Value Column:", style={
-                                                "color": "#e6e6e6",
-                                                "fontWeight": "bold",
-                                                "marginBottom": "12px",
-                                                "fontSize": "16px",
-                                                "display": "block"
-                                            }),
-                                            dcc.Dropdown(
-                                                id="value-column-dropdown",
-                                                placeholder="Select value column",
-                                                style={"height": "40px", **custom_css["dropdown"]},
-                                                className='dropdown-dark custom-dropdown'
-                                            ),
-                                        ]),
-
-                                        # Time series options
-                                        html.Div(className="form-group", style={"marginBottom": "20px"}, children=[
-                                            html.Label("Time Series Options:", style={
-                                                "color": "#e6e6e6",
-                                                "fontWeight": "bold",
-                                                "marginBottom": "12px",
-                                                "fontSize": "16px",
-                                                "display": "block"
-                                            }),
-                                            dbc.Checklist(
-                                                id="time-series-options",
-                                                options=[
-                                                    {"label": html.Span("Show Trendline", style={"color": "#FFFFFF", "marginLeft": "5px"}), "value": "trendline"},
-                                                    {"label": html.Span("Show Moving Average", style={"color": "#FFFFFF", "marginLeft": "5px"}), "value": "moving_avg"},
-                                                    {"label": html.Span("Show Seasonality", style={"color": "#FFFFFF", "marginLeft": "5px"}), "value": "seasonality"},
-                                                ],
-                                                value=[],
-                                                inline=True,
-                                                style={"marginBottom": "20px", "color": "#e6e6e6"}
-                                            ),
-                                        ]),
-
-                                        # Moving average and seasonality
-                                        dbc.Row([
-                                            dbc.Col([
-                                                html.Div(id="moving-avg-col", className="form-group", children=[
-                                                    html.Label("Moving Average Window:", style={
-                                                        "color": "#e6e6e6",
-                                                        "fontWeight": "bold",
-                                                        "marginBottom": "12px",
-                                                        "fontSize": "16px",
-                                                        "display": "block"
-                                                    }),
-                                                    dbc.Input(
-                                                        id="moving-avg-window",
-                                                        type="number",
-                                                        min=2,
-                                                        value=7,
-                                                        style={"height": "40px", **custom_css["dropdown"]}
-                                                    ),
-                                                ]),
-                                            ], width=6),
-                                            dbc.Col([
-                                                html.Div(id="seasonality-col", className="form-group", children=[
-                                                    html.Label("Seasonality Period:", style={
-                                                        "color": "#e6e6e6",
-                                                        "fontWeight": "bold",
-                                                        "marginBottom": "12px",
-                                                        "fontSize": "16px",
-                                                        "display": "block"
-                                                    }),
-                                                    dbc.Input(
-                                                        id="seasonality-period",
-                                                        type="number",
-                                                        min=2,
-                                                        value=12,
-                                                        style={"height": "40px", **custom_css["dropdown"]}
-                                                    ),
-                                                ]),
-                                            ], width=6),
-                                        ]),
-                                    ]),
-
-                                    # Scatter Matrix Controls (hidden by default)
-                                    html.Div(id="scatter-matrix-controls", style={"display": "none", "marginBottom": "25px"}, children=[
-                                        # Variables selection
-                                        html.Div(className="form-group", style={"marginBottom": "20px"}, children=[
-                                            html.Label("Select Variables:", style={
-                                                "color": "#e6e6e6",
-                                                "fontWeight": "bold",
-                                                "marginBottom": "12px",
-                                                "fontSize": "16px",
-                                                "display": "block"
-                                            }),
-                                            dcc.Dropdown(
-                                                id="scatter-matrix-vars",
-                                                multi=True,
-                                                placeholder="Select variables for scatter matrix",
-                                                style={"height": "40px", **custom_css["dropdown"]},
-                                                className='dropdown-dark custom-dropdown'
-                                            ),
-                                        ]),
-
-                                        # Color selection
-                                        html.Div(className="form-group", style={"marginBottom": "20px"}, children=[
-                                            html.Label("Color By (optional):", style={
-                                                "color": "#e6e6e6",
-                                                "fontWeight": "bold",
-                                                "marginBottom": "12px",
-                                                "fontSize": "16px",
-                                                "display": "block"
-                                            }),
-                                            dcc.Dropdown(
-                                                id="scatter-matrix-color",
-                                                placeholder="Select variable for coloring",
-                                                style={"height": "40px", **custom_css["dropdown"]},
-                                                className='dropdown-dark custom-dropdown'
-                                            ),
-                                        ]),
-                                    ]),
-
-                                    # 3D Plot Controls (hidden by default)
-                                    html.Div(id="3d-plot-controls", style={"display": "none", "marginBottom": "25px"}, children=[
-                                        # Z-axis column
-                                        html.Div(className="form-group", style={"marginBottom": "20px"}, children=[
-                                            html.Label("Z-axis Column:", style={
-                                                "color": "#e6e6e6",
-                                                "fontWeight": "bold",
-                                                "marginBottom": "12px",
-                                                "fontSize": "16px",
-                                                "display": "block"
-                                            }),
-                                            dcc.Dropdown(
-                                                id="z-axis-dropdown",
-                                                placeholder="Select Z-axis column",
-                                                style={"height": "40px", **custom_css["dropdown"]},
-                                                className='dropdown-dark custom-dropdown'
-                                            ),
-                                        ]),
+        html.Div(id="statistics-content", style={"display": "none", "opacity": "0"}, children=[
+            card("Data Visualization", [
+                # New Auto-generated visualizations section
+                dbc.Row([
+                    dbc.Col([
+                        html.H4("Data Overview", style={"color": "#FFFFFF", "marginBottom": "20px"}),
+                        html.P("Automatically generated visualizations based on your data:",
+                              style={"color": "#e6e6e6", "marginBottom": "20px"}),
+                        dcc.Loading(
+                            id="auto-viz-loading",
+                            type="circle",
+                            color="#1abc9c",
+                            parent_style={"minHeight": "400px"},
+                            children=html.Div(id="auto-visualizations"),
+                        ),
+                    ], width=12),
+                ]),
+                html.Hr(style={"borderColor": "#2a3a5e", "margin": "30px 0"}),
 
-                                        # Color column
-                                        html.Div(className="form-group", style={"marginBottom": "20px"}, children=[
-                                            html.Label("Color Column (optional):", style={
-                                                "color": "#e6e6e6",
-                                                "fontWeight": "bold",
-                                                "marginBottom": "12px",
-                                                "fontSize": "16px",
-                                                "display": "block"
-                                            }),
-                                            dcc.Dropdown(
-                                                id="color-variable-dropdown",
-                                                placeholder="Select color column",
-                                                style={"height": "40px", **custom_css["dropdown"]},
-                                                className='dropdown-dark custom-dropdown'
-                                            ),
-                                        ]),
-                                    ]),
+                # Original custom plot controls section
+                html.H4("Custom Plot Controls", style={"color": "#FFFFFF", "marginBottom": "20px"}),
+                html.P("Create your own custom visualizations by selecting options below:",
+                      style={"color": "#e6e6e6", "marginBottom": "20px"}),
+                dbc.Row([
+                    dbc.Col([
+                        card("Plot Controls", [
+                            # X-axis selection
+                            labeled_dropdown("Select X-axis:", "x-axis-dropdown", placeholder="Select X-axis", group_style=STYLES["form_group_spaced"]),
+
+                            # Y-axis selection
+                            labeled_dropdown("Select Y-axis (optional):", "y-axis-dropdown", placeholder="Select Y-axis", group_style=STYLES["form_group_spaced"]),
+
+                            # Plot type selection
+                            html.Div(className="form-group", style=STYLES["form_group_spaced"], children=[
+                                html.Label("Select Plot Type:", style=STYLES["label"]),
+                                dark_dropdown(
+                                    id="plot-type-dropdown",
+                                    options=PLOT_TYPE_OPTIONS,
+                                    value="scatter",
+                                    clearable=False,
+                                    style=dropdown_style(marginBottom="15px"),
+                                ),
+                                dcc.Store(id="control-visibility-map", data=CONTROL_VISIBILITY_MAP),
+                            ]),
 
-                                    # Geographic Map Controls (hidden by default)
-                                    html.Div(id="geo-plot-controls", style={"display": "none", "marginBottom": "25px"}, children=[
-                                        # Location column
-                                        html.Div(className="form-group", style={"marginBottom": "20px"}, children=[
-                                            html.Label("Location Column:", style={
-                                                "color": "#e6e6e6",
-                                                "fontWeight": "bold",
-                                                "marginBottom": "12px",
-                                                "fontSize": "16px",
-                                                "display": "block"
-                                            }),
-                                            dcc.Dropdown(
-                                                id="geo-location-dropdown",
-                                                placeholder="Select location column",
-                                                style={"height": "40px", **custom_css["dropdown"]},
-                                                className='dropdown-dark custom-dropdown'
-                                            ),
-                                        ]),
+                            # Bin size slider
+                            html.Div(id="bin-size-col", className="form-group", style={"marginBottom": "35px"}, children=[
+                                html.Label("Adjust Bin Size (for histograms):", style=STYLES["label_wide"]),
+                                html.Div([
+                                    dcc.Slider(
+                                        id="bin-size-slider",
+                                        min=5,
+                                        max=50,
+                                        step=5,
+                                        value=10,
+                                        marks=BIN_SIZE_MARKS,
+                                    )
+                                ], style={"paddingTop": "15px", "paddingBottom": "15px", "paddingLeft": "10px", "paddingRight": "10px"}),
+                            ]),
 
-                                        # Value column for geographic maps
-                                        html.Div(className="form-group", style={"marginBottom": "20px"}, children=[
-                                            html.Label("Value Column:", style={
-                                                "color": "#e6e6e6",
-                                                "fontWeight": "bold",
-                                                "marginBottom": "12px",
-                                                "fontSize": "16px",
-                                                "display": "block"
-                                            }),
-                                            dcc.Dropdown(
-                                                id="geo-value-dropdown",
-                                                placeholder="Select value column",
-                                                style={"height": "40px", **custom_css["dropdown"]},
-                                                className='dropdown-dark custom-dropdown'
-                                            ),
-                                        ]),
+                            # Time Series Controls (hidden by default)
+                            html.Div(id="time-series-controls", style=STYLES["controls_hidden"], children=[
+                                # Date column
+                                labeled_dropdown("Date Column:", "date-column-dropdown", placeholder="Select date column"),
 
-                                        # Geographic scope
-                                        html.Div(className="form-group", style={"marginBottom": "20px"}, children=[
-                                            html.Label("Map Scope:", style={
-                                                "color": "#e6e6e6",
-                                                "fontWeight": "bold",
-                                                "marginBottom": "12px",
-                                                "fontSize": "16px",
-                                                "display": "block"
-                                            }),
-                                            dcc.Dropdown(
-                                                id="geo-scope-dropdown",
-                                                options=[
-                                                    {"label": html.Span("World", style={"color": "#FFFFFF"}), "value": "world"},
-                                                    {"label": html.Span("USA", style={"color": "#FFFFFF"}), "value": "usa"},
-                                                    {"label": html.Span("Europe", style={"color": "#FFFFFF"}), "value": "europe"},
-                                                    {"label": html.Span("Asia", style={"color": "#FFFFFF"}), "value": "asia"},
-                                                    {"label": html.Span("Africa", style={"color": "#FFFFFF"}), "value": "africa"},
-                                                ],
-                                                value="world",
-                                                style={"height": "40px", **custom_css["dropdown"]},
-                                                className='dropdown-dark custom-dropdown'
-                                            ),
-                                        ]),
-                                    ]),
+                                # Value column
+                                labeled_dropdown("Value Column:", "value-column-dropdown", placeholder="Select value column"),
 
-                                    # Forecast Controls (hidden by default)
-                                    html.Div(id="forecast-controls", style={"display": "none", "marginBottom": "25px"}, children=[
-                                        # Forecast model
-                                        html.Div(className="form-group", style={"marginBottom": "20px"}, children=[
-                                            html.Label("Forecast Model:", style={
-                                                "color": "#e6e6e6",
-                                                "fontWeight": "bold",
-                                                "marginBottom": "12px",
-                                                "fontSize": "16px",
-                                                "display": "block"
-                                            }),
-                                            dcc.Dropdown(
-                                                id="forecast-model-dropdown",
-                                                options=[
-                                                    {"label": html.Span("ARIMA", style={"color": "#FFFFFF"}), "value": "arima"},
-                                                    {"label": html.Span("Prophet", style={"color": "#FFFFFF"}), "value": "prophet"},
-                                                ],
-                                                value="arima",
-                                                style={"height": "40px", **custom_css["dropdown"]},
-                                                className='dropdown-dark custom-dropdown'
-                                            ),
-                                        ]),
+                                # Time series options
+                                html.Div(className="form-group", style=STYLES["form_group"], children=[
+                                    html.Label("Time Series Options:", style=STYLES["label"]),
+                                    dbc.Checklist(
+                                        id="time-series-options",
+                                        options=[
+                                            {"label": html.Span("Show Trendline", style={"color": "#FFFFFF", "marginLeft": "5px"}), "value": "trendline"},
+                                            {"label": html.Span("Show Moving Average", style={"color": "#FFFFFF", "marginLeft": "5px"}), "value": "moving_avg"},
+                                            {"label": html.Span("Show Seasonality", style={"color": "#FFFFFF", "marginLeft": "5px"}), "value": "seasonality"},
+                                        ],
+                                        value=[],
+                                        inline=True,
+                                        style={"marginBottom": "20px", "color": "#e6e6e6"}
+                                    ),
+                                ]),
 
-                                        # Forecast periods
-                                        html.Div(className="form-group", style={"marginBottom": "20px"}, children=[
-                                            html.Label("Forecast Periods:", style={
-                                                "color": "#e6e6e6",
-                                                "fontWeight": "bold",
-                                                "marginBottom": "12px",
-                                                "fontSize": "16px",
-                                                "display": "block"
-                                            }),
+                                # Moving average and seasonality
+                                dbc.Row([
+                                    dbc.Col([
+                                        html.Div(id="moving-avg-col", className="form-group", children=[
+                                            html.Label("Moving Average Window:", style=STYLES["label"]),
                                             dbc.Input(
-                                                id="forecast-periods",
+                                                id="moving-avg-window",
                                                 type="number",
-                                                min=1,
-                                                value=10,
-                                                style={"height": "40px", **custom_css["dropdown"]}
+                                                min=2,
+                                                value=7,
+                                                style=STYLES["dropdown_40"]
                                             ),
                                         ]),
-                                    ]),
-
-                                    # Statistical Plot Controls (hidden by default)
-                                    html.Div(id="stat-plot-controls", style={"display": "none", "marginBottom": "25px"}, children=[
-                                        # Reference distribution
-                                        html.Div(className="form-group", style={"marginBottom": "20px"}, children=[
-                                            html.Label("Reference Distribution:", style={
-                                                "color": "#e6e6e6",
-                                                "fontWeight": "bold",
-                                                "marginBottom": "12px",
-                                                "fontSize": "16px",
-                                                "display": "block"
-                                            }),
-                                            dcc.Dropdown(
-                                                id="reference-distribution-dropdown",
-                                                options=[
-                                                    {"label": html.Span("Normal", style={"color": "#FFFFFF"}), "value": "norm"},
-                                                    {"label": html.Span("T", style={"color": "#FFFFFF"}), "value": "t"},
-                                                    {"label": html.Span("Chi-Square", style={"color": "#FFFFFF"}), "value": "chi2"},
-                                                ],
-                                                value="norm",
-                                                style={"height": "40px", **custom_css["dropdown"]},
-                                                className='dropdown-dark custom-dropdown'
+                                    ], width=6),
+                                    dbc.Col([
+                                        html.Div(id="seasonality-col", className="form-group", children=[
+                                            html.Label("Seasonality Period:", style=STYLES["label"]),
+                                            dbc.Input(
+                                                id="seasonality-period",
+                                                type="number",
+                                                min=2,
+                                                value=12,
+                                                style=STYLES["dropdown_40"]
                                             ),
                                         ]),
-                                    ]),
-
-                                    # Generate Plot button
-                                    dbc.Button([
-                                        html.I(className="fas fa-chart-bar mr-2"),
-                                        "Generate Plot"
-                                    ], id="generate-plot-button", style=custom_css["button"]),
+                                    ], width=6),
                                 ]),
-                            ], style=custom_css["card"]),
-                        ], width=4),
-                        dbc.Col([
-                            dbc.Card([
-                                dbc.CardHeader("Visualization", style=custom_css["card_header"]),
-                                dbc.CardBody([
-                                    dcc.Graph(id="statistics-plot", style={"height": "700px"}),
-                                    dbc.Alert(id="statistics-error", color="danger", is_open=False, duration=4000),
-                                ]),
-                            ], style=custom_css["card"]),
-                        ], width=8),
-                    ]),
-                ]),
-            ], style=custom_css["card"]),
-        ]),
-
-        # Tests tab
-        html.Div(id="tests-content", style={"display": "none", "opacity": "0", "transition": "opacity 0.3s ease-in-out"}, children=[
-            dbc.Card([
-                dbc.CardHeader("Statistical Tests", style=custom_css["card_header"]),
-                dbc.CardBody([
-                    dbc.Row([
-                        dbc.Col(html.Div([
-                            dcc.Dropdown(
-                                id="test-type-dropdown",
-                                placeholder="Select Test Type",
-                                options=[
-                                    {"label": html.Span("Chi-squared Test", style={"color": "#FFFFFF"}), "value": "chi2"},
-                                    {"label": html.Span("Pearson Correlation", style={"color": "#FFFFFF"}), "value": "pearson"},
-                                    {"label": html.Span("Spearman Correlation", style={"color": "#FFFFFF"}), "value": "spearman"},
-                                ],
-                                style=custom_css["dropdown"],
-                                className='dropdown-dark'
-                            )
-                        ]), width=6),
-                        dbc.Col(html.Div([
-                            dcc.Dropdown(
-                                id="test-x-dropdown",
-                                placeholder="Select variable (filtered by test)",
-                                style=custom_css["dropdown"],
-                                className='dropdown-dark'
-                            )
-                        ]), width=6),
-                    ], style={"marginBottom": "20px"}),
-                    dbc.Row([
-                        dbc.Col(html.Div([
-                            dcc.Dropdown(
-                                id="test-y-dropdown",
-                                placeholder="Select second variable (filtered by test)",
-                                style=custom_css["dropdown"],
-                                className='dropdown-dark'
-                            )
-                        ]), width=6),
-                    ], style={"marginBottom": "20px"}),
-                    dbc.Row([
-                        dbc.Col(dbc.Button(
-                            [html.I(className="fas fa-calculator mr-2"), "Perform Test"],
-                            id="perform-test",
-                            style=custom_css["button"]
-                        ))
-                    ]),
-                    dbc.Row([
-                        dbc.Col(dcc.Graph(id="test-plot"))
-                    ]),
-                    dbc.Row([
-                        dbc.Col(html.Div(
-                            id="test-result",
-                            style={
-                                "textAlign": "center",
-                                "margin": "15px 0",
-                                "color": "#e6e6e6"
-                            }
-                        ))
-                    ]),
-                    dbc.Row([
-                        dbc.Col(dash_table.DataTable(
-                            id="test-table",
-                            style_table={"overflowX": "auto", **custom_css["table"]},
-                            style_header=custom_css["table_header"],
-                            style_cell={
-                                "backgroundColor": "#16213e",
-                                "color": "#e6e6e6",
-                                "padding": "10px",
-                                "border": "1px solid #2a3a5e"
-                            },
-                            style_data_conditional=[
-                                {
-                                    "if": {"row_index": "odd"},
-                                    "backgroundColor": "#1a1a2e"
-                                }
-                            ],
-                        ))
-                    ]),
-                ]),
-            ], style=custom_css["card"]),
-        ]),
-
-        # Regression tab
-        html.Div(id="regression-content", style={"display": "none", "opacity": "0", "transition": "opacity 0.3s ease-in-out"}, children=[
-            dbc.Card([
-                dbc.CardHeader("Linear Regression Analysis", style=custom_css["card_header"]),
-                dbc.CardBody([
-                    dbc.Row([
-                        dbc.Col([
-                            dbc.Card([
-                                dbc.CardHeader("Variable Selection", style=custom_css["card_header"]),
-                                dbc.CardBody([
-                                    html.Div([
-                                        html.Label("Independent Variable (X):", style={
-                                            "color": "#e6e6e6",
-                                            "fontWeight": "bold",
-                                            "marginBottom": "12px",
-                                            "fontSize": "16px",
-                                            "display": "block"
-                                        }),
-                                        dcc.Dropdown(
-                                            id="regression-x-dropdown",
-                                            placeholder="Select independent variable",
-                                            style={"marginBottom": "20px", **custom_css["dropdown"]},
-                                            className='dropdown-dark custom-dropdown'
-                                        ),
-                                    ]),
-                                    html.Div([
-                                        html.Label("Dependent Variable (Y):", style={
-                                            "color": "#e6e6e6",
-                                            "fontWeight": "bold",
-                                            "marginBottom": "12px",
-                                            "fontSize": "16px",
-                                            "display": "block"
-                                        }),
-                                        dcc.Dropdown(
-                                            id="regression-y-dropdown",
-                                            placeholder="Select dependent variable",
-                                            style={"marginBottom": "20px", **custom_css["dropdown"]},
-                                            className='dropdown-dark custom-dropdown'
-                                        ),
-                                    ]),
-                                    dbc.Button(
-                                        [html.I(className="fas fa-calculator mr-2"), "Calculate Regression"],
-                                        id="calculate-regression",
-                                        style=custom_css["button"]
-                                    ),
-                                ]),
-                            ], style=custom_css["card"]),
+                            ]),
 
-                            # Regression Results Card
-                            dbc.Card([
-                                dbc.CardHeader("Regression Results", style=custom_css["card_header"]),
-                                dbc.CardBody([
-                                    html.Div(id="regression-equation", style={
-                                        "fontSize": "1.2em",
-                                        "fontWeight": "bold",
-                                        "marginBottom": "20px",
-                                        "color": "var(--primary)",
-                                        "textAlign": "center"
-                                    }),
-                                    html.Div(id="regression-metrics", style={
-                                        "marginBottom": "20px",
-                                        "color": "#e6e6e6"
-                                    }),
-                                    html.Hr(style={"borderColor": "var(--border-color)"}),
-                                    html.Div([
-                                        html.Label("Make a Prediction:", style={
-                                            "color": "#e6e6e6",
-                                            "fontWeight": "bold",
-                                            "marginBottom": "12px",
-                                            "fontSize": "16px",
-                                            "display": "block"
-                                        }),
-                                        dbc.Input(
-                                            id="prediction-input",
-                                            type="number",
-                                            placeholder="Enter X value",
-                                            style={"marginBottom": "15px", **custom_css["dropdown"]}
-                                        ),
-                                        dbc.Button(
-                                            [html.I(className="fas fa-magic mr-2"), "Predict"],
-                                            id="predict-button",
-                                            style=custom_css["button"]
-                                        ),
-                                        html.Div(id="prediction-result", style={
-                                            "marginTop": "15px",
-                                            "color": "var(--primary)",
-                                            "fontWeight": "bold",
-                                            "textAlign": "center"
-                                        })
-                                    ])
-                                ]),
-                            ], style={**custom_css["card"], "marginTop": "20px"}),
-                        ], width=4),
+                            # Scatter Matrix Controls (hidden by default)
+                            html.Div(id="scatter-matrix-controls", style=STYLES["controls_hidden"], children=[
+                                # Variables selection
+                                labeled_dropdown("Select Variables:", "scatter-matrix-vars", multi=True, placeholder="Select variables for scatter matrix"),
 
-                        # Regression Plot
-                        dbc.Col([
-                            dbc.Card([
-                                dbc.CardHeader("Regression Plot", style=custom_css["card_header"]),
-                                dbc.CardBody([
-                                    dcc.Graph(id="regression-plot", style={"height": "600px"}),
-                                ]),
-                            ], style=custom_css["card"]),
-                        ], width=8),
-                    ]),
-                    dbc.Row([
-                        dbc.Col(
-                            dbc.Alert(
-                                id="regression-error",
-                                color="danger",
-                                is_open=False,
-                                duration=4000
-                            ),
-                            width=12
-                        ),
-                    ]),
-                ]),
-            ], style=custom_css["card"]),
-        ]),
+                                # Color selection
+                                labeled_dropdown("Color By (optional):", "scatter-matrix-color", placeholder="Select variable for coloring"),
+                            ]),
 
-        # FAQ tab
-        html.Div(id="faq-content", style={"display": "none", "opacity": "0", "transition": "opacity 0.3s ease-in-out"}, children=[
-            dbc.Card([
-                dbc.CardHeader([
-                    html.H3("Frequently Asked Questions", className="mb-0", style={"color": "var(--primary)", "fontWeight": "600"})
-                ], style=custom_css["card_header"]),
-                dbc.CardBody([
-                    html.Div(style={"display": "flex", "alignItems": "center", "marginBottom": "25px"}, children=[
-                        html.I(className="fas fa-question-circle", style={"fontSize": "24px", "color": "var(--primary)", "marginRight": "15px"}),
-                        html.P("Find answers to common questions and learn how to make the most of this data analysis dashboard. Browse through the categories below to quickly find the information you need.",
-                          style={"color": "var(--text-secondary)", "fontSize": "16px", "margin": "0"})
-                    ]),
+                            # 3D Plot Controls (hidden by default)
+                            html.Div(id="3d-plot-controls", style=STYLES["controls_hidden"], children=[
+                                # Z-axis column
+                                labeled_dropdown("Z-axis Column:", "z-axis-dropdown", placeholder="Select Z-axis column"),
 
-                    # FAQ categories
-                    dbc.Tabs([
-                        # Getting Started Tab
-                        dbc.Tab(label="Getting Started", tab_id="getting-started", label_style={"fontWeight": "bold", "padding": "12px 15px"}, active_label_style={"color": "var(--primary)", "borderBottom": "2px solid var(--primary)"}, children=[
-                            html.Div(style={"marginTop": "20px", "padding": "5px"}, children=[
-                                dbc.Accordion([
-                                    dbc.AccordionItem(
-                                        [
-                                            html.P("This app lets you upload CSV or Excel files and perform data analysis through an intuitive interface. The typical workflow is:", style={"color": "var(--text-secondary)"}),
-                                            html.Ol([
-                                                html.Li("Upload your data in the Import tab"),
-                                                html.Li("View summary statistics in the Summary tab"),
-                                                html.Li("Clean your data in the Imputation tab (impute missing values, remove duplicates, handle outliers)"),
-                                                html.Li("Create visualizations in the Statistics tab (auto and custom plots)"),
-                                                html.Li("Analyze relationships in the Correlation and Tests tabs"),
-                                                html.Li("Build and use regression and prediction models in the Regression and Prediction tabs"),
-                                                html.Li("Generate a comprehensive EDA report in the Report tab")
-                                            ], style={"color": "var(--text-secondary)", "marginLeft": "20px"})
-                                        ],
-                                        title="How can I use this app?",
-                                        style={"backgroundColor": "var(--card-bg)", "marginBottom": "10px", "borderColor": "var(--border-color)", "borderRadius": "8px"},
-                                        className="faq-accordion-item",
-                                    ),
-                                    dbc.AccordionItem(
-                                        [
-                                            html.P("You can upload the following file formats:", style={"color": "var(--text-secondary)"}),
-                                            html.Ul([
-                                                html.Li("CSV (.csv) - Comma-separated values"),
-                                                html.Li("Excel (.xls, .xlsx) - Microsoft Excel spreadsheets")
-                                            ], style={"color": "var(--text-secondary)", "marginLeft": "20px"}),
-                                            html.P("Files should be properly formatted with consistent data types in each column for best results.", style={"color": "var(--text-secondary)", "marginTop": "10px"})
-                                        ],
-                                        title="What types of files can I upload?",
-                                        style={"backgroundColor": "var(--card-bg)", "marginBottom": "10px", "borderColor": "var(--border-color)", "borderRadius": "8px"},
-                                        className="faq-accordion-item",
-                                    ),
-                                    dbc.AccordionItem(
-                                        [
-                                            html.P("The app automatically detects numeric, categorical, datetime, and boolean columns. It suggests conversions if needed.", style={"color": "var(--text-secondary)"}),
-                                        ],
-                                        title="How are data types determined?",
-                                        style={"backgroundColor": "var(--card-bg)", "marginBottom": "10px", "borderColor": "var(--border-color)", "borderRadius": "8px"},
-                                        className="faq-accordion-item",
-                                    ),
-                                    dbc.AccordionItem(
-                                        [
-                                            html.P("For best performance, use files with up to 10,000 rows and 100 columns. Larger files may be sampled.", style={"color": "var(--text-secondary)"}),
-                                        ],
-                                        title="What's the maximum file size I can upload?",
-                                        style={"backgroundColor": "var(--card-bg)", "marginBottom": "10px", "borderColor": "var(--border-color)", "borderRadius": "8px"},
-                                        className="faq-accordion-item",
-                                    ),
-                                ], start_collapsed=True, style={"borderRadius": "8px", "boxShadow": "0 2px 5px rgba(0, 0, 0, 0.05)"}),
+                                # Color column
+                                labeled_dropdown("Color Column (optional):", "color-variable-dropdown", placeholder="Select color column"),
                             ]),
-                        ]),
 
-                        # Data Cleaning Tab
-                        dbc.Tab(label="Data Cleaning", tab_id="data-cleaning", label_style={"fontWeight": "bold", "padding": "12px 15px"}, active_label_style={"color": "var(--primary)", "borderBottom": "2px solid var(--primary)"}, children=[
-                            html.Div(style={"marginTop": "20px", "padding": "5px"}, children=[
-                                dbc.Accordion([
-                                    dbc.AccordionItem(
-                                        [
-                                            html.P("In the Imputation tab, select columns and choose a method: mean, median, mode, or KNN (for numeric). Apply changes to fill missing values.", style={"color": "var(--text-secondary)"}),
-                                        ],
-                                        title="How do I handle missing values?",
-                                        style={"backgroundColor": "var(--card-bg)", "marginBottom": "10px", "borderColor": "var(--border-color)", "borderRadius": "8px"},
-                                        className="faq-accordion-item",
-                                    ),
-                                    dbc.AccordionItem(
-                                        [
-                                            html.P("In the Imputation tab, click 'Find Duplicates' to preview, then 'Remove Duplicates' to delete them.", style={"color": "var(--text-secondary)"}),
-                                        ],
-                                        title="How can I remove duplicate records?",
-                                        style={"backgroundColor": "var(--card-bg)", "marginBottom": "10px", "borderColor": "var(--border-color)", "borderRadius": "8px"},
-                                        className="faq-accordion-item",
-                                    ),
-                                    dbc.AccordionItem(
-                                        [
-                                            html.P("In the Imputation tab, select numeric columns, choose IQR or Z-score, set a threshold, detect outliers, and choose to remove or replace them.", style={"color": "var(--text-secondary)"}),
-                                        ],
-                                        title="How do I handle outliers?",
-                                        style={"backgroundColor": "var(--card-bg)", "marginBottom": "10px", "borderColor": "var(--border-color)", "borderRadius": "8px"},
-                                        className="faq-accordion-item",
-                                    ),
-                                ], start_collapsed=True, style={"borderRadius": "8px", "boxShadow": "0 2px 5px rgba(0, 0, 0, 0.05)"}),
+                            # Geographic Map Controls (hidden by default)
+                            html.Div(id="geo-plot-controls", style=STYLES["controls_hidden"], children=[
+                                # Location column
+                                labeled_dropdown("Location Column:", "geo-location-dropdown", placeholder="Select location column"),
+
+                                # Value column for geographic maps
+                                labeled_dropdown("Value Column:", "geo-value-dropdown", placeholder="Select value column"),
+
+                                # Geographic scope
+                                labeled_dropdown(
+                                    "Map Scope:", "geo-scope-dropdown",
+                                    options=[
+                                        {"label": "World", "value": "world"},
+                                        {"label": "USA", "value": "usa"},
+                                        {"label": "Europe", "value": "europe"},
+                                        {"label": "Asia", "value": "asia"},
+                                        {"label": "Africa", "value": "africa"},
+                                    ],
+                                    value="world",
+                                ),
                             ]),
-                        ]),
 
-                        # Visualization Tab
-                        dbc.Tab(label="Visualization", tab_id="visualization", label_style={"fontWeight": "bold", "padding": "12px 15px"}, active_label_style={"color": "var(--primary)", "borderBottom": "2px solid var(--primary)"}, children=[
-                            html.Div(style={"marginTop": "20px", "padding": "5px"}, children=[
-                                dbc.Accordion([
-                                    dbc.AccordionItem(
-                                        [
-                                            html.P("In the Statistics tab, you can generate histograms, scatter plots, bar charts, and pie charts. The app also auto-generates summary and distribution plots.", style={"color": "var(--text-secondary)"}),
-                                        ],
-                                        title="What types of visualizations can I create?",
-                                        style={"backgroundColor": "var(--card-bg)", "marginBottom": "10px", "borderColor": "var(--border-color)", "borderRadius": "8px"},
-                                        className="faq-accordion-item",
-                                    ),
-                                    dbc.AccordionItem(
-                                        [
-                                            html.P("The Correlation tab shows heatmaps for numeric, label-encoded, and one-hot encoded variables.", style={"color": "var(--text-secondary)"}),
-                                        ],
-                                        title="How do I view correlations?",
-                                        style={"backgroundColor": "var(--card-bg)", "marginBottom": "10px", "borderColor": "var(--border-color)", "borderRadius": "8px"},
-                                        className="faq-accordion-item",
-                                    ),
-                                ], start_collapsed=True, style={"borderRadius": "8px", "boxShadow": "0 2px 5px rgba(0, 0, 0, 0.05)"}),
-                            ]),
-                        ]),
+                            # Forecast Controls (hidden by default)
+                            html.Div(id="forecast-controls", style=STYLES["controls_hidden"], children=[
+                                # Forecast model
+                                labeled_dropdown(
+                                    "Forecast Model:", "forecast-model-dropdown",
+                                    options=[
+                                        {"label": "ARIMA", "value": "arima"},
+                                        {"label": "Prophet", "value": "prophet"},
+                                    ],
+                                    value="arima",
+                                ),
 
-                        # Statistical Analysis Tab
-                        dbc.Tab(label="Statistical Analysis", tab_id="statistical-analysis", label_style={"fontWeight": "bold", "padding": "12px 15px"}, active_label_style={"color": "var(--primary)", "borderBottom": "2px solid var(--primary)"}, children=[
-                            html.Div(style={"marginTop": "20px", "padding": "5px"}, children=[
-                                dbc.Accordion([
-                                    dbc.AccordionItem(
-                                        [
-                                            html.P("In the Tests tab, select Chi-squared (for categorical), Pearson, or Spearman (for numeric) tests. The app provides results, visualizations, and interpretations.", style={"color": "var(--text-secondary)"}),
-                                        ],
-                                        title="How do I perform statistical tests?",
-                                        style={"backgroundColor": "var(--card-bg)", "marginBottom": "10px", "borderColor": "var(--border-color)", "borderRadius": "8px"},
-                                        className="faq-accordion-item",
-                                    ),
-                                    dbc.AccordionItem(
-                                        [
-                                            html.P("In the Regression tab, select X and Y variables, calculate regression, view the equation, metrics, and plot. You can also make predictions with confidence intervals.", style={"color": "var(--text-secondary)"}),
-                                        ],
-                                        title="How do I perform regression analysis?",
-                                        style={"backgroundColor": "var(--card-bg)", "marginBottom": "10px", "borderColor": "var(--border-color)", "borderRadius": "8px"},
-                                        className="faq-accordion-item",
-                                    ),
-                                    dbc.AccordionItem(
-                                        [
-                                            html.P("In the Prediction tab, train a Random Forest model by selecting features and a target. Make predictions manually or by uploading a file. View model metrics and results.", style={"color": "var(--text-secondary)"}),
-                                        ],
-                                        title="How can I make predictions using machine learning?",
-                                        style={"backgroundColor": "var(--card-bg)", "marginBottom": "10px", "borderColor": "var(--border-color)", "borderRadius": "8px"},
-                                        className="faq-accordion-item",
+                                # Forecast periods
+                                html.Div(className="form-group", style=STYLES["form_group"], children=[
+                                    html.Label("Forecast Periods:", style=STYLES["label"]),
+                                    dbc.Input(
+                                        id="forecast-periods",
+                                        type="number",
+                                        min=1,
+                                        value=10,
+                                        style=STYLES["dropdown_40"]
                                     ),
-                                ], start_collapsed=True, style={"borderRadius": "8px", "boxShadow": "0 2px 5px rgba(0, 0, 0, 0.05)"}),
+                                ]),
                             ]),
-                        ]),
 
-                        # Export & Reporting Tab
-                        dbc.Tab(label="Export & Reporting", tab_id="export-reporting", label_style={"fontWeight": "bold", "padding": "12px 15px"}, active_label_style={"color": "var(--primary)", "borderBottom": "2px solid var(--primary)"}, children=[
-                            html.Div(style={"marginTop": "20px", "padding": "5px"}, children=[
-                                dbc.Accordion([
-                                    dbc.AccordionItem(
-                                        [
-                                            html.P("In the Import tab, export your data as CSV, Excel, or JSON.", style={"color": "var(--text-secondary)"}),
-                                        ],
-                                        title="How can I export my data?",
-                                        style={"backgroundColor": "var(--card-bg)", "marginBottom": "10px", "borderColor": "var(--border-color)", "borderRadius": "8px"},
-                                        className="faq-accordion-item",
-                                    ),
-                                    dbc.AccordionItem(
-                                        [
-                                            html.P("In the Report tab, click 'Generate EDA Report' for an interactive summary with stats, visualizations, and warnings.", style={"color": "var(--text-secondary)"}),
-                                        ],
-                                        title="How do I generate a report?",
-                                        style={"backgroundColor": "var(--card-bg)", "marginBottom": "10px", "borderColor": "var(--border-color)", "borderRadius": "8px"},
-                                        className="faq-accordion-item",
-                                    ),
-                                ], start_collapsed=True, style={"borderRadius": "8px", "boxShadow": "0 2px 5px rgba(0, 0, 0, 0.05)"}),
+                            # Statistical Plot Controls (hidden by default)
+                            html.Div(id="stat-plot-controls", style=STYLES["controls_hidden"], children=[
+                                # Reference distribution
+                                labeled_dropdown(
+                                    "Reference Distribution:", "reference-distribution-dropdown",
+                                    options=[
+                                        {"label": "Normal", "value": "norm"},
+                                        {"label": "T", "value": "t"},
+                                        {"label": "Chi-Square", "value": "chi2"},
+                                    ],
+                                    value="norm",
+                                ),
                             ]),
-                        ]),
 
-                        # Troubleshooting Tab
-                        dbc.Tab(label="Troubleshooting", tab_id="troubleshooting", label_style={"fontWeight": "bold", "padding": "12px 15px"}, active_label_style={"color": "var(--primary)", "borderBottom": "2px solid var(--primary)"}, children=[
-                            html.Div(style={"marginTop": "20px"}, children=[
-                                dbc.Accordion([
-                                    dbc.AccordionItem(
-                                        [
-                                            html.P("If the app is slow, use smaller datasets, limit columns, and avoid complex plots with large data.", style={"color": "var(--text-secondary)"}),
-                                        ],
-                                        title="The app is slow. What can I do?",
-                                        style={"backgroundColor": "var(--card-bg)", "marginBottom": "10px", "borderColor": "var(--border-color)", "borderRadius": "8px"},
-                                        className="faq-accordion-item",
-                                    ),
-                                    dbc.AccordionItem(
-                                        [
-                                            html.P("Check file format, column names, and file integrity. Ensure the header option matches your file.", style={"color": "var(--text-secondary)"}),
-                                        ],
-                                        title="I get errors when uploading files.",
-                                        style={"backgroundColor": "var(--card-bg)", "marginBottom": "10px", "borderColor": "var(--border-color)", "borderRadius": "8px"},
-                                        className="faq-accordion-item",
-                                    ),
-                                    dbc.AccordionItem(
-                                        [
-                                            html.P("Make sure you've selected appropriate variables and plot types. Check for missing values.", style={"color": "var(--text-secondary)"}),
-                                        ],
-                                        title="My plots aren't displaying. What should I check?",
-                                        style={"backgroundColor": "var(--card-bg)", "marginBottom": "10px", "borderColor": "var(--border-color)", "borderRadius": "8px"},
-                                        className="faq-accordion-item",
-                                    ),
-                                ], start_collapsed=True, style={"borderRadius": "8px", "boxShadow": "0 2px 5px rgba(0, 0, 0, 0.05)"}),
-                            ]),
+                            # Generate Plot button
+                            dbc.Button([
+                                icon("chart-bar"),
+                                "Generate Plot"
+                            ], id="generate-plot-button", style=custom_css["button"]),
                         ]),
-                    ], id="faq-tabs", style={"backgroundColor": "var(--card-bg)", "borderRadius": "8px", "padding": "5px"}),
-
-                    # Additional help resources
-                    html.Div(style={"marginTop": "40px", "padding": "20px", "backgroundColor": "var(--primary-light)", "borderRadius": "12px", "boxShadow": "0 4px 8px rgba(0, 0, 0, 0.1)"}, children=[
-                        html.H5("Need More Help?", style={"color": "var(--primary)", "fontWeight": "bold", "marginBottom": "15px"}),
-                        html.P([
-                            "If you need assistance with your data analysis, our support team is here to help.",
-                        ], style={"color": "var(--text-secondary)", "marginBottom": "15px"}),
-                        dbc.Row([
-                            dbc.Col([
-                                html.Div([
-                                    html.I(className="fas fa-envelope", style={"marginRight": "10px", "color": "var(--primary)"}),
-                                    html.Span("Contact Support: ", style={"fontWeight": "600"}),
-                                    html.A("ilyes.frigui.ps@gmail.com",
-                                          href="mailto:ilyes.frigui.ps@gmail.com",
-                                          style={"color": "var(--primary)", "textDecoration": "none", "borderBottom": "1px dotted var(--primary)"}),
-                                ], style={"fontSize": "16px", "display": "flex", "alignItems": "center"}),
-                            ], width=12),
+                    ], width=4),
+                    dbc.Col([
+                        card("Visualization", [
+                            dcc.Graph(id="statistics-plot", style={"height": "700px"}),
+                            dbc.Alert(id="statistics-error", color="danger", is_open=False, duration=4000),
                         ]),
-                    ]),
+                    ], width=8),
                 ]),
-            ], style=custom_css["card"]),
-        ]),
-
-        # Report tab
-        html.Div(id="report-content", style={"display": "none", "opacity": "0", "transition": "opacity 0.3s ease-in-out"}, children=[
-            dbc.Card([
-                dbc.CardHeader("Automated EDA Report", style=custom_css["card_header"]),
-                dbc.CardBody([
-                    html.Div([
-                        html.P("Generate a comprehensive Exploratory Data Analysis report for your dataset.",
-                               style={"color": "var(--text-secondary)", "fontSize": "16px", "marginBottom": "20px"}),
-
-                        # Button to generate the report
-                        dbc.Button([
-                            html.I(className="fas fa-file-alt mr-2"),
-                            "Generate EDA Report"
-                        ],
-                        id="generate-report-button",
-                        style=custom_css["button"],
-                        className="mb-4"),
-
-                        # Loading spinner during report generation
-                        dbc.Spinner(
-                            html.Div(id="eda-report-container", style={"minHeight": "200px"}),
-                            color="info",
-                            type="grow",
-                            fullscreen=False,
-                        ),
-                    ]),
-                ]),
-            ], style=custom_css["card"]),
+            ]),
         ]),
 
-        # Prediction tab
-        html.Div(id="prediction-content", style={"display": "none", "opacity": "0", "transition": "opacity 0.3s ease-in-out"}, children=[
-            dbc.Card([
-                dbc.CardHeader("Random Forest Prediction", style=custom_css["card_header"]),
-                dbc.CardBody([
-                    dbc.Row([
-                        dbc.Col([
-                            # Left panel for model training and selection
-                            dbc.Card([
-                                dbc.CardHeader("Train Model", style=custom_css["card_header"]),
-                                dbc.CardBody([
-                                    html.P("Train a Random Forest classifier on your dataset.",
-                                           style={"color": "var(--text-secondary)", "marginBottom": "15px"}),
-
-                                    # Target column selection
-                                    html.Div([
-                                        html.Label("Select Target Variable:", style={
-                                            "color": "#e6e6e6",
-                                            "fontWeight": "bold",
-                                            "marginBottom": "8px",
-                                            "display": "block"
-                                        }),
-                                        dcc.Dropdown(
-                                            id="prediction-target-dropdown",
-                                            placeholder="Select target column",
-                                            style={"marginBottom": "20px", **custom_css["dropdown"]},
-                                            className='dropdown-dark custom-dropdown'
-                                        )
-                                    ]),
-
-                                    # Feature selection
-                                    html.Div([
-                                        html.Label("Select Features:", style={
-                                            "color": "#e6e6e6",
-                                            "fontWeight": "bold",
-                                            "marginBottom": "8px",
-                                            "display": "block"
-                                        }),
-                                        dcc.Dropdown(
-                                            id="prediction-features-dropdown",
-                                            multi=True,
-                                            placeholder="Select features",
-                                            style={"marginBottom": "20px", **custom_css["dropdown"]},
-                                            className='dropdown-dark custom-dropdown'
-                                        )
-                                    ]),
-
-                                    # Model parameters
-                                    html.Div([
-                                        html.Label("Model Parameters:", style={
-                                            "color": "#e6e6e6",
-                                            "fontWeight": "bold",
-                                            "marginBottom": "8px",
-                                            "display": "block"
-                                        }),
-                                        dbc.Row([
-                                            dbc.Col([
-                                                html.Label("Number of Trees:", style={"color": "#e6e6e6"}),
-                                                dbc.Input(
-                                                    id="n-estimators-input",
-                                                    type="number",
-                                                    min=10,
-                                                    max=500,
-                                                    step=10,
-                                                    value=100,
-                                                    style={"marginBottom": "15px", **custom_css["dropdown"]}
-                                                )
-                                            ], width=6),
-                                            dbc.Col([
-                                                html.Label("Max Depth:", style={"color": "#e6e6e6"}),
-                                                dbc.Input(
-                                                    id="max-depth-input",
-                                                    type="number",
-                                                    min=1,
-                                                    max=50,
-                                                    value=None,
-                                                    placeholder="None (unlimited)",
-                                                    style={"marginBottom": "15px", **custom_css["dropdown"]}
-                                                )
-                                            ], width=6)
-                                        ]),
-                                        dbc.Row([
-                                            dbc.Col([
-                                                html.Label("Train/Test Split:", style={"color": "#e6e6e6"}),
-                                                dbc.Input(
-                                                    id="test-size-input",
-                                                    type="number",
-                                                    min=0.1,
-                                                    max=0.5,
-                                                    step=0.05,
-                                                    value=0.3,
-                                                    style={"marginBottom": "15px", **custom_css["dropdown"]}
-                                                )
-                                            ], width=6),
-                                            dbc.Col([
-                                                html.Label("Random State:", style={"color": "#e6e6e6"}),
-                                                dbc.Input(
-                                                    id="random-state-input",
-                                                    type="number",
-                                                    min=0,
-                                                    value=42,
-                                                    style={"marginBottom": "15px", **custom_css["dropdown"]}
-                                                )
-                                            ], width=6)
-                                        ])
-                                    ]),
-
-                                    # Train button
-                                    dbc.Button(
-                                        [html.I(className="fas fa-cogs mr-2"), "Train Model"],
-                                        id="train-model-button",
-                                        color="primary",
-                                        style=custom_css["button"],
-                                        className="mb-3"
-                                    ),
+        # Tests tab
+        html.Div(id="tests-content", style={"display": "none", "opacity": "0"}, children=[
+            card("Statistical Tests", [
+                dbc.Row([
+                    dbc.Col(html.Div([
+                        dcc.Dropdown(
+                            id="test-type-dropdown",
+                            placeholder="Select Test Type",
+                            options=[
+                                {"label": "Chi-squared Test", "value": "chi2"},
+                                {"label": "Pearson Correlation", "value": "pearson"},
+                                {"label": "Spearman Correlation", "value": "spearman"},
+                            ],
+                            style=custom_css["dropdown"],
+                            className='dropdown-dark'
+                        )
+                    ]), width=6),
+                    dbc.Col(html.Div([
+                        dcc.Dropdown(
+                            id="test-x-dropdown",
+                            placeholder="Select variable (filtered by test)",
+                            style=custom_css["dropdown"],
+                            className='dropdown-dark'
+                        )
+                    ]), width=6),
+                ], style={"marginBottom": "20px"}),
+                dbc.Row([
+                    dbc.Col(html.Div([
+                        dcc.Dropdown(
+                            id="test-y-dropdown",
+                            placeholder="Select second variable (filtered by test)",
+                            style=custom_css["dropdown"],
+                            className='dropdown-dark'
+                        )
+                    ]), width=6),
+                ], style={"marginBottom": "20px"}),
+                dbc.Row([
+                    dbc.Col(dbc.Button(
+                        [icon("calculator"), "Perform Test"],
+                        id="perform-test",
+                        style=custom_css["button"]
+                    ))
+                ]),
+                dbc.Row([
+                    dbc.Col(dcc.Graph(id="test-plot"))
+                ]),
+                dbc.Row([
+                    dbc.Col(html.Div(
+                        id="test-result",
+                        style={
+                            "textAlign": "center",
+                            "margin": "15px 0",
+                            "color": "#e6e6e6"
+                        }
+                    ))
+                ]),
+                dbc.Row([
+                    dbc.Col(dash_table.DataTable(
+                        id="test-table",
+                        # Contingency tables can run long; render only the rows in view
+                        page_action="none",
+                        style_table=STYLES["table_virtualized"],
+                        virtualization=True,
+                        fixed_rows={"headers": True},
+                        style_header=custom_css["table_header"],
+                        style_cell=custom_css["table_cell"],
+                    ))
+                ]),
+            ]),
+        ]),
 
-                                    # Training status and metrics
-                                    dbc.Spinner(
-                                        html.Div(id="training-status", style={"minHeight": "50px"}),
-                                        type="grow",
-                                        color="info",
-                                        size="sm"
-                                    )
-                                ])
-                            ], style=custom_css["card"])
-                        ], width=6),
+        # Regression tab
+        html.Div(id="regression-content", style={"display": "none", "opacity": "0"}, children=[
+            card("Linear Regression Analysis", [
+                dbc.Row([
+                    dbc.Col([
+                        card("Variable Selection", [
+                            html.Div([
+                                html.Label("Independent Variable (X):", style=STYLES["label"]),
+                                dark_dropdown(
+                                    id="regression-x-dropdown",
+                                    placeholder="Select independent variable",
+                                    style=dropdown_style(marginBottom="20px"),
+                                ),
+                            ]),
+                            html.Div([
+                                html.Label("Dependent Variable (Y):", style=STYLES["label"]),
+                                dark_dropdown(
+                                    id="regression-y-dropdown",
+                                    placeholder="Select dependent variable",
+                                    style=dropdown_style(marginBottom="20px"),
+                                ),
+                            ]),
+                            dbc.Button(
+                                [icon("calculator"), "Calculate Regression"],
+                                id="calculate-regression",
+                                style=custom_css["button"]
+                            ),
+                        ]),
 
-                        dbc.Col([
-                            # Right panel for making predictions
-                            dbc.Card([
-                                dbc.CardHeader("Make Predictions", style=custom_css["card_header"]),
-                                dbc.CardBody([
-                                    html.P("Make predictions using the trained Random Forest model.",
-                                           style={"color": "var(--text-secondary)", "marginBottom": "15px"}),
-
-                                    # Two tabs: Manual Input and File Upload
-                                    dbc.Tabs([
-                                        dbc.Tab(label="Manual Input", tab_id="manual-input", children=[
-                                            html.Div(id="manual-inputs-container", style={"marginTop": "15px"}),
-                                            dbc.Button(
-                                                [html.I(className="fas fa-magic mr-2"), "Predict"],
-                                                id="predict-button-manual",
-                                                color="success",
-                                                style=custom_css["button"],
-                                                className="mt-3",
-                                                disabled=True
-                                            )
-                                        ]),
-                                        dbc.Tab(label="File Upload", tab_id="file-upload", children=[
-                                            dcc.Upload(
-                                                id="prediction-upload",
-                                                children=html.Div([
-                                                    html.I(className="fas fa-cloud-upload-alt mr-2", style={"fontSize": "24px", "color": "var(--primary)"}),
-                                                    "Drag and Drop or ",
-                                                    html.A("Select a File", style={"color": "var(--primary)", "fontWeight": "bold", "textDecoration": "underline"}),
-                                                ]),
-                                                style=custom_css["upload"],
-                                                className="upload-area mt-3 mb-3",
-                                            ),
-                                            html.Div(id="prediction-upload-status", style={
-                                                "color": "#a3a3a3",
-                                                "textAlign": "center",
-                                                "marginBottom": "15px"
-                                            }),
-                                            dbc.Button(
-                                                [html.I(className="fas fa-magic mr-2"), "Predict from File"],
-                                                id="predict-button-file",
-                                                color="success",
-                                                style=custom_css["button"],
-                                                className="mt-2",
-                                                disabled=True
-                                            )
-                                        ])
-                                    ], id="prediction-tabs")
-                                ])
-                            ], style=custom_css["card"]),
+                        # Regression Results Card
+                        card("Regression Results", [
+                            html.Div(id="regression-equation", style={
+                                "fontSize": "1.2em",
+                                "fontWeight": "bold",
+                                "marginBottom": "20px",
+                                "color": "var(--primary)",
+                                "textAlign": "center"
+                            }),
+                            html.Div(id="regression-metrics", style={
+                                "marginBottom": "20px",
+                                "color": "#e6e6e6"
+                            }),
+                            html.Hr(style={"borderColor": "var(--border-color)"}),
+                            html.Div([
+                                html.Label("Make a Prediction:", style=STYLES["label"]),
+                                dbc.Input(
+                                    id="prediction-input",
+                                    type="number",
+                                    debounce=True,
+                                    placeholder="Enter X value",
+                                    style=dropdown_style(marginBottom="15px")
+                                ),
+                                dbc.Button(
+                                    [icon("magic"), "Predict"],
+                                    id="predict-button",
+                                    style=custom_css["button"]
+                                ),
+                                html.Div(id="prediction-result", style={
+                                    "marginTop": "15px",
+                                    "color": "var(--primary)",
+                                    "fontWeight": "bold",
+                                    "textAlign": "center"
+                                })
+                            ])
+                        ], style=STYLES["card_spaced"]),
+                    ], width=4),
 
-                            # Results card
-                            dbc.Card([
-                                dbc.CardHeader("Prediction Results", style=custom_css["card_header"]),
-                                dbc.CardBody([
-                                    html.Div(id="prediction-results", style={"minHeight": "200px"})
-                                ])
-                            ], style={"marginTop": "20px", **custom_css["card"]})
-                        ], width=6)
-                    ])
+                    # Regression Plot
+                    dbc.Col([
+                        card("Regression Plot", [
+                            dcc.Graph(id="regression-plot", style={"height": "600px"}),
+                        ]),
+                    ], width=8),
                 ]),
-            ], style=custom_css["card"]),
+                dbc.Row([
+                    dbc.Col(
+                        dbc.Alert(
+                            id="regression-error",
+                            color="danger",
+                            is_open=False,
+                            duration=4000
+                        ),
+                        width=12
+                    ),
+                ]),
+            ]),
         ]),
 
+        # FAQ, Report and Prediction tabs (children rendered on first open, see LAZY_SECTIONS)
+        html.Div(id="faq-content", style={"display": "none", "opacity": "0"}),
+        html.Div(id="report-content", style={"display": "none", "opacity": "0"}),
+        html.Div(id="prediction-content", style={"display": "none", "opacity": "0"}),
+
         # Encoding tab
-        html.Div(id="encoding-content", style={"display": "none", "opacity": "0", "transition": "opacity 0.3s ease-in-out"}, children=[
+        html.Div(id="encoding-content", style={"display": "none", "opacity": "0"}, children=[
             dbc.Card([
                 dbc.CardHeader(
                     html.H4("Categorical Variable Encoding",
@@ -3020,8 +2286,8 @@ app.layout = html.Div(style=custom_css["background"], children=[
                                "letterSpacing": "0.5px"
                            }
                     ),
+                    className="dash-card-header",
                     style={
-                        **custom_css["card_header"],
                         "textAlign": "center",
                         "display": "flex",
                         "justifyContent": "center",
@@ -3037,21 +2303,20 @@ app.layout = html.Div(style=custom_css["background"], children=[
                             dbc.Card([
                                 dbc.CardHeader(
                                     html.Div([
-                                        html.I(className="fas fa-cogs mr-2", style={"color": "var(--primary)"}),
+                                        html.I(className="icon icon-cogs mr-2", style={"color": "var(--primary)"}),
                                         "Encoding Options"
                                     ], style={"fontSize": "16px", "fontWeight": "bold"}),
-                                    style=custom_css["card_header"]
+                                    className="dash-card-header"
                                 ),
                                 dbc.CardBody([
                                     # Column selection
                                     html.Div([
                                         html.Label("Select Column to Encode:",
                                                   style={"color": "#e6e6e6", "fontWeight": "bold", "marginBottom": "8px", "display": "block"}),
-                                        dcc.Dropdown(
+                                        dark_dropdown(
                                             id="encoding_column_dropdown",
                                             placeholder="Select a categorical column",
-                                            style={**custom_css["dropdown"], "marginBottom": "16px"},
-                                            className='dropdown-dark custom-dropdown'
+                                            style=dropdown_style(marginBottom="16px"),
                                         ),
                                     ], className="mb-4"),
 
@@ -3059,7 +2324,7 @@ app.layout = html.Div(style=custom_css["background"], children=[
                                     html.Div([
                                         html.Label("Select Encoding Method:",
                                                   style={"color": "#e6e6e6", "fontWeight": "bold", "marginBottom": "8px", "display": "block"}),
-                                        dcc.Dropdown(
+                                        dark_dropdown(
                                             id="encoding_method_dropdown",
                                             options=[
                                                 {"label": "Label Encoding", "value": "label"},
@@ -3067,8 +2332,7 @@ app.layout = html.Div(style=custom_css["background"], children=[
                                                 {"label": "Ordinal Encoding", "value": "ordinal"},
                                             ],
                                             placeholder="Select encoding method",
-                                            style={**custom_css["dropdown"], "marginBottom": "16px"},
-                                            className='dropdown-dark custom-dropdown'
+                                            style=dropdown_style(marginBottom="16px"),
                                         ),
                                     ], className="mb-4"),
 
@@ -3118,19 +2382,19 @@ app.layout = html.Div(style=custom_css["background"], children=[
                                         dbc.Row([
                                             dbc.Col([
                                                 dbc.Button([
-                                                    html.I(className="fas fa-file-csv mr-2"),
+                                                    icon("file-csv"),
                                                     "CSV"
                                                 ], id="encoding_download_csv_button", color="primary", style={"width": "100%"}),
                                             ], width=4),
                                             dbc.Col([
                                                 dbc.Button([
-                                                    html.I(className="fas fa-file-code mr-2"),
+                                                    icon("file-code"),
                                                     "JSON"
                                                 ], id="encoding_download_json_button", color="info", style={"width": "100%"}),
                                             ], width=4),
                                             dbc.Col([
                                                 dbc.Button([
-                                                    html.I(className="fas fa-file-excel mr-2"),
+                                                    icon("file-excel"),
                                                     "Excel"
                                                 ], id="encoding_download_excel_button", color="success", style={"width": "100%"}),
                                             ], width=4),
@@ -3145,10 +2409,10 @@ app.layout = html.Div(style=custom_css["background"], children=[
                             dbc.Card([
                                 dbc.CardHeader(
                                     html.Div([
-                                        html.I(className="fas fa-table mr-2", style={"color": "var(--primary)"}),
+                                        html.I(className="icon icon-table mr-2", style={"color": "var(--primary)"}),
                                         "Data Preview"
                                     ], style={"fontSize": "16px", "fontWeight": "bold"}),
-                                    style=custom_css["card_header"]
+                                    className="dash-card-header"
                                 ),
                                 dbc.CardBody([
                                     # Preview table
@@ -3162,16 +2426,10 @@ app.layout = html.Div(style=custom_css["background"], children=[
                                         },
                                         style_header=custom_css["table_header"],
                                         style_cell={
-                                            "backgroundColor": "#16213e",
-                                            "color": "#e6e6e6",
-                                            "padding": "10px",
-                                            "border": "1px solid #2a3a5e",
+                                            **custom_css["table_cell"],
                                             "textOverflow": "ellipsis",
                                             "maxWidth": "400px",
                                         },
-                                        style_data_conditional=[
-                                            {"if": {"row_index": "odd"}, "backgroundColor": "#1a1a2e"}
-                                        ],
                                         page_size=10,
                                         fixed_rows={'headers': True},
                                     )
@@ -3207,6 +2465,30 @@ app.layout = html.Div(style=custom_css["background"], children=[
         })
     ]),
 
+    # Random per-tab id set in the browser (session.ensureId); keys server-side state such as resampled figures
+    dcc.Store(id="session-id", storage_type="session"),
+
+    # Full uploaded / imputed datasets (df_to_store payloads); the DataTables only ever hold the current page
+    dcc.Store(id="stored-data"),
+    dcc.Store(id="imputed-data"),
+
+    # Shared target of the dataset download/export buttons
+    dcc.Download(id="unified-download"),
+    # Notifications for every section share this one toast; callbacks fill it with toast_outputs()
+    dbc.Toast(
+        id="global-toast",
+        is_open=False,
+        dismissable=True,
+        duration=4000,
+        style={
+            "position": "fixed",
+            "top": 10,
+            "right": 10,
+            "width": 350,
+            "zIndex": 1999
+        }
+    ),
+
     # Store for duplicates and outliers data
     dcc.Store(id='duplicates-store'),
     dcc.Store(id='outliers-store'),
@@ -3218,96 +2500,101 @@ app.layout = html.Div(style=custom_css["background"], children=[
     dcc.Store(id='model-performance-store')  # Stores model performance metrics
 ])
 
-# Navigation callback
-@app.callback(
-    [
-        Output("welcome-content", "style"),
-        Output("import-content", "style"),
-        Output("summary-content", "style"),
-        Output("imputation-content", "style"),
-        Output("statistics-content", "style"),
-        Output("encoding-content", "style"),
-        Output("tests-content", "style"),
-        Output("regression-content", "style"),
-        Output("report-content", "style"),
-        Output("prediction-content", "style"),
-        Output("faq-content", "style"),
-        Output("welcome-button", "active"),
-        Output("import-button", "active"),
-        Output("summary-button", "active"),
-        Output("imputation-button", "active"),
-        Output("statistics-button", "active"),
-        Output("encoding-button", "active"),
-        Output("tests-button", "active"),
-        Output("regression-button", "active"),
-        Output("report-button", "active"),
-        Output("prediction-button", "active"),
-        Output("faq-button", "active"),
-        Output("welcome-button", "className"),
-        Output("import-button", "className"),
-        Output("summary-button", "className"),
-        Output("imputation-button", "className"),
-        Output("statistics-button", "className"),
-        Output("encoding-button", "className"),
-        Output("tests-button", "className"),
-        Output("regression-button", "className"),
-        Output("report-button", "className"),
-        Output("prediction-button", "className"),
-        Output("faq-button", "className"),
-    ],
-    [
-        Input("welcome-button", "n_clicks"),
-        Input("import-button", "n_clicks"),
-        Input("summary-button", "n_clicks"),
-        Input("imputation-button", "n_clicks"),
-        Input("statistics-button", "n_clicks"),
-        Input("encoding-button", "n_clicks"),
-        Input("tests-button", "n_clicks"),
-        Input("regression-button", "n_clicks"),
-        Input("report-button", "n_clicks"),
-        Input("prediction-button", "n_clicks"),
-        Input("faq-button", "n_clicks"),
-    ],
+# The layout never changes after import, so serialize it once rather than on every /_dash-layout request
+@lru_cache(maxsize=1)
+def layout_json():
+    """(JSON body, ETag) for /_dash-layout, built on the first request"""
+    body = to_json_plotly(app.layout)
+    return body, hashlib.blake2b(body.encode(), digest_size=16).hexdigest()
+
+# Encodings the layout is pre-compressed in, in order of preference
+LAYOUT_ENCODINGS = ("br", "gzip") if find_spec("brotli") is not None else ("gzip",)
+
+@lru_cache(maxsize=None)
+def compressed_layout(encoding):
+    """The layout body compressed once, at the highest level, instead of by flask-compress on every request"""
+    body = layout_json()[0].encode()
+    if encoding == "br":
+        import brotli
+        return brotli.compress(body, quality=11)
+    return gzip.compress(body, compresslevel=9)
+
+def serve_layout():
+    body, etag = layout_json()
+    # Browsers revalidate on every load and get a bodiless 304 while the layout is unchanged.
+    # Compressed bodies get the encoding appended to the ETag (":br"), so match on the part before it
+    if any(tag.split(":")[0] == etag for tag in flask.request.if_none_match.as_set()):
+        response = flask.Response(status=304)
+    else:
+        encoding = flask.request.accept_encodings.best_match(LAYOUT_ENCODINGS)
+        if encoding:
+            # flask-compress leaves responses that already carry a Content-Encoding alone
+            response = flask.Response(compressed_layout(encoding), mimetype="application/json")
+            response.headers["Content-Encoding"] = encoding
+            etag = f"{etag}:{encoding}"
+        else:
+            response = flask.Response(body, mimetype="application/json")
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "no-cache"
+    response.vary.add("Accept-Encoding")
+    return response
+
+app.server.view_functions[app.config.routes_pathname_prefix + "_dash-layout"] = serve_layout
+
+# Give each browser tab its own session id on first load
+app.clientside_callback(
+    ClientsideFunction(namespace="session", function_name="ensureId"),
+    Output("session-id", "data"),
+    Input("session-id", "modified_timestamp"),
+    State("session-id", "data"),
+)
+
+# Sidebar highlight runs in the browser (assets/clientside.js) - no server round-trip per click
+NAV_SECTIONS = [section for _, items in NAV_GROUPS for section, _, _ in items]
+
+app.clientside_callback(
+    ClientsideFunction(namespace="nav", function_name="highlight"),
+    [Output(f"{section}-button", "active") for section in NAV_SECTIONS]
+    + [Output(f"{section}-button", "className") for section in NAV_SECTIONS],
+    [Input(f"{section}-button", "n_clicks") for section in NAV_SECTIONS],
+)
+
+# Sections whose children are built on first open instead of shipping with the initial layout
+LAZY_SECTIONS = {
+    "faq": faq_layout,
+    "report": report_layout,
+    "prediction": prediction_layout,
+}
+
+def render_section(build):
+    """Fill a lazy section the first time its sidebar link is clicked"""
+    # The sections are static: encode the component tree once and reply with the plain JSON tree
+    encoded = lru_cache(maxsize=1)(lambda: json.loads(to_json_plotly(build())))
+    def callback(n_clicks, children):
+        if children:
+            return dash.no_update
+        return encoded()
+    return callback
+
+for section, build in LAZY_SECTIONS.items():
+    app.callback(
+        Output(f"{section}-content", "children"),
+        Input(f"{section}-button", "n_clicks"),
+        State(f"{section}-content", "children"),
+        prevent_initial_call=True,
+    )(render_section(build))
+
+# Section switching also runs in the browser: show the clicked link's "<section>-content" div, hide the rest
+app.clientside_callback(
+    ClientsideFunction(namespace="nav", function_name="showSection"),
+    [Output(f"{section}-content", "style") for section in NAV_SECTIONS],
+    [Input(f"{section}-button", "n_clicks") for section in NAV_SECTIONS],
 )
-def update_content(welcome_clicks, import_clicks, summary_clicks, imputation_clicks, statistics_clicks, encoding_clicks, tests_clicks, regression_clicks, report_clicks, prediction_clicks, faq_clicks):
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        return [
-            {"display": "block", "opacity": "1", "transition": "all 0.4s ease-in-out", "animation": "fade-in 0.5s ease-out"},
-            *[{"display": "none", "opacity": "0", "transition": "all 0.4s ease-in-out"}] * 10,
-            True, *[False] * 10,
-            "nav-button active", *["nav-button"] * 10
-        ]
-    button_id = ctx.triggered[0]["prop_id"].split(".")[0]
-    styles = [
-        {"display": "none", "opacity": "0", "transition": "all 0.4s ease-in-out"}
-    ] * 11
-    active_states = [False] * 11
-    classes = ["nav-button"] * 11
-    idx_map = {
-        "welcome-button": 0,
-        "import-button": 1,
-        "summary-button": 2,
-        "imputation-button": 3,
-        "statistics-button": 4,
-        "encoding-button": 5,
-        "tests-button": 6,
-        "regression-button": 7,
-        "report-button": 8,
-        "prediction-button": 9,
-        "faq-button": 10
-    }
-    if button_id in idx_map:
-        idx = idx_map[button_id]
-        styles[idx] = {"display": "block", "opacity": "1", "transition": "all 0.4s ease-in-out", "animation": "fade-in 0.5s ease-out"}
-        active_states[idx] = True
-        classes[idx] = "nav-button active"
-    return styles + active_states + classes
 
 # Data parsing callback
 @app.callback(
     [
-        Output("data-table", "data"),
+        Output("stored-data", "data"),
         Output("data-table", "columns"),
         Output("file-upload-status", "children"),
         Output("x-axis-dropdown", "options"),
@@ -3332,7 +2619,7 @@ def parse_data(contents, has_header, filename):
     decoded = base64.b64decode(content_string)
     try:
         if "csv" in filename:
-            df = pd.read_csv(StringIO(decoded.decode("utf-8")), header=0 if "header" in has_header else None)
+            df = read_csv_bytes(decoded, header=0 if "header" in has_header else None)
         elif "xls" in filename or "xlsx" in filename:
             df = pd.read_excel(io.BytesIO(decoded), header=0 if "header" in has_header else None)
         else:
@@ -3341,9 +2628,9 @@ def parse_data(contents, has_header, filename):
     except Exception as e:
         return [], [], f"Error processing file: {e}", [], [], [], [], [], [], [], [], [], []
 
-    columns = [{"name": col, "id": col} for col in df.columns]
-    data = df.to_dict("records")
-    dropdown_options = [{"label": html.Span(col, style={"color": "#FFFFFF"}), "value": col} for col in df.columns]
+    columns = table_columns(tuple(df.columns))
+    data = df_to_store(df)
+    dropdown_options = [{"label": col, "value": col} for col in df.columns]
 
     # For test dropdowns, we provide all columns as options initially
     # The test-specific callback will filter them based on the test type
@@ -3355,25 +2642,63 @@ def parse_data(contents, has_header, filename):
 
     # Find columns with missing values for imputation dropdown
     columns_with_missing = [col for col in df.columns if df[col].isna().any()]
-    imputation_dropdown_options = [{"label": html.Span(col, style={"color": "#FFFFFF"}), "value": col} for col in columns_with_missing]
+    imputation_dropdown_options = [{"label": col, "value": col} for col in columns_with_missing]
 
     # Only numeric columns for outlier detection
-    outlier_dropdown_options = [{"label": html.Span(col, style={"color": "#FFFFFF"}), "value": col} for col in numeric_columns]
+    outlier_dropdown_options = [{"label": col, "value": col} for col in numeric_columns]
 
     # Identify potential date columns for time series
     date_columns = [col for col in df.columns if is_possible_datetime(df[col])]
-    date_dropdown_options = [{"label": html.Span(col, style={"color": "#FFFFFF"}), "value": col} for col in date_columns]
+    date_dropdown_options = [{"label": col, "value": col} for col in date_columns]
 
     # Options for scatter matrix
-    scatter_matrix_vars = [{"label": html.Span(col, style={"color": "#FFFFFF"}), "value": col} for col in numeric_columns]
-    scatter_matrix_color = [{"label": html.Span(col, style={"color": "#FFFFFF"}), "value": col} for col in df.columns]
+    scatter_matrix_vars = [{"label": col, "value": col} for col in numeric_columns]
+    scatter_matrix_color = [{"label": col, "value": col} for col in df.columns]
 
     return (data, columns, f"Successfully uploaded {filename}", dropdown_options, dropdown_options,
             test_dropdown_options, test_dropdown_options, imputation_dropdown_options, outlier_dropdown_options,
             date_dropdown_options, dropdown_options, scatter_matrix_vars, scatter_matrix_color)
 
-# Show/hide controls based on plot type selection
-@app.callback(
+def page_table(store_id):
+    """Build the server-side paging callback of a DataTable backed by a df_to_store payload"""
+    def callback(data, page_current, page_size, sort_by, filter_query):
+        if not data:
+            return [], 1, 0
+        # New data, a new sort order or a new filter starts again from the first page
+        ctx = dash.callback_context
+        if ctx.triggered and ctx.triggered[0]["prop_id"].split(".")[-1] in ("data", "sort_by", "filter_query"):
+            page_current = 0
+        if sort_by or filter_query:
+            records, page_count = page_records(frame_from_store(data), page_current, page_size, sort_by, filter_query)
+        else:
+            # Plain paging slices the stored table directly, without building the full DataFrame
+            page_size = page_size or 10
+            start = (page_current or 0) * page_size
+            records, _ = records_from_store(data, slice(start, start + page_size))
+            page_count = max(-(-store_num_rows(data) // page_size), 1)
+        return records, page_count, page_current
+    return callback
+
+# Server-side paging, sorting and filtering for the main and imputed data tables
+for table_id, store_id in (("data-table", "stored-data"), ("imputed-table", "imputed-data")):
+    app.callback(
+        [
+            Output(table_id, "data"),
+            Output(table_id, "page_count"),
+            Output(table_id, "page_current"),
+        ],
+        [
+            Input(store_id, "data"),
+            Input(table_id, "page_current"),
+            Input(table_id, "page_size"),
+            Input(table_id, "sort_by"),
+            Input(table_id, "filter_query"),
+        ],
+    )(page_table(store_id))
+
+# Show/hide controls based on plot type selection (assets/clientside.js, driven by CONTROL_VISIBILITY_MAP)
+app.clientside_callback(
+    ClientsideFunction(namespace="plots", function_name="toggleControls"),
     [
         Output("time-series-controls", "style"),
         Output("bin-size-col", "style"),
@@ -3385,10 +2710,61 @@ def parse_data(contents, has_header, filename):
         Output("forecast-controls", "style"),
         Output("stat-plot-controls", "style"),
     ],
-    [Input("plot-type-dropdown", "value")]
+    [Input("plot-type-dropdown", "value")],
+    [State("control-visibility-map", "data")],
 )
-def toggle_plot_controls(plot_type):
-    return [{"display": "none"}] * 9
+
+def summarize_column(col_data):
+    """Compute the summary-table statistics for a single column"""
+    col_stats = {}
+
+    # Basic count statistics
+    null_count = col_data.isna().sum()
+    col_stats['count'] = len(col_data)
+    col_stats['null_count'] = null_count
+    col_stats['null_pct'] = f"{(null_count / len(col_data) * 100):.2f}%"
+    col_stats['dtype'] = str(col_data.dtype)
+
+    # Try to get unique values (works for most data types)
+    try:
+        col_stats['unique'] = col_data.nunique()
+    except:
+        col_stats['unique'] = 'N/A'
+
+    # Numeric statistics when applicable
+    try:
+        # Check if data can be treated as numeric
+        numeric_data = pd.to_numeric(col_data, errors='coerce')
+        if not numeric_data.isna().all():  # Only calculate if we have some numeric values
+            col_stats['mean'] = numeric_data.mean()
+            col_stats['std'] = numeric_data.std()
+            col_stats['min'] = numeric_data.min()
+            # One quantile call sorts the column once instead of three times
+            quartiles = numeric_data.quantile([0.25, 0.5, 0.75])
+            col_stats['25%'], col_stats['50%'], col_stats['75%'] = quartiles.tolist()
+            col_stats['max'] = numeric_data.max()
+    except:
+        # Fill in N/A for statistics that couldn't be calculated
+        for stat in ['mean', 'std', 'min', '25%', '50%', '75%', 'max']:
+            if stat not in col_stats:
+                col_stats[stat] = 'N/A'
+
+    # Most common value statistics (categorical/object data)
+    try:
+        value_counts = col_data.value_counts(dropna=True)
+        if not value_counts.empty:
+            top_val = value_counts.index[0]
+            # Truncate long values
+            col_stats['top'] = str(top_val)[:20] + "..." if len(str(top_val)) > 20 else str(top_val)
+            col_stats['freq'] = value_counts.iloc[0]
+        else:
+            col_stats['top'] = 'N/A'
+            col_stats['freq'] = 'N/A'
+    except:
+        col_stats['top'] = 'N/A'
+        col_stats['freq'] = 'N/A'
+
+    return col_stats
 
 # Summary statistics callback
 @app.callback(
@@ -3401,7 +2777,7 @@ def toggle_plot_controls(plot_type):
         Output("summary-error", "children"),
         Output("summary-error", "is_open"),
     ],
-    [Input("data-table", "data"), Input("summary-button", "n_clicks")],
+    [Input("stored-data", "data"), Input("summary-button", "n_clicks")],
     prevent_initial_call=True
 )
 def generate_summary(data, n_clicks):
@@ -3409,7 +2785,7 @@ def generate_summary(data, n_clicks):
         return [], [], "", "", "", "", False
 
     try:
-        df = pd.DataFrame(data)
+        df = frame_from_store(data)
         if df.empty:
             return [], [], "", "", "", "No data available to summarize.", True
 
@@ -3417,11 +2793,12 @@ def generate_summary(data, n_clicks):
         num_rows, num_cols = df.shape
 
         # Missing Values Summary
-        missing_values = df.isna().sum().sum()
+        missing_counts = df.isna().sum()
+        missing_values = missing_counts.sum()
         missing_values_pct = (missing_values / (num_rows * num_cols)) * 100 if num_rows * num_cols > 0 else 0
 
         # Get missing values by column for detailed visualization
-        missing_by_column = df.isna().sum().reset_index()
+        missing_by_column = missing_counts.reset_index()
         missing_by_column.columns = ['Column', 'Missing Count']
         missing_by_column['Missing Percentage'] = (missing_by_column['Missing Count'] / num_rows * 100).round(2)
         missing_by_column = missing_by_column.sort_values('Missing Count', ascending=False)
@@ -3433,7 +2810,7 @@ def generate_summary(data, n_clicks):
         missing_values_summary = html.Div([
             # Header with icon and main count
             html.Div([
-                html.I(className="fas fa-exclamation-triangle fa-2x",
+                html.I(className="icon icon-exclamation-triangle icon-2x",
                        style={"color": "#EA4335", "marginRight": "15px"}),
                 html.Div([
                     html.H4("Missing Values", style={"color": "#ffffff", "margin": "0"}),
@@ -3550,57 +2927,10 @@ def generate_summary(data, n_clicks):
                       'unique', 'top', 'freq', 'dtype']
         summary = pd.DataFrame(index=stats_rows)
 
-        # Process each column individually
-        for col in df.columns:
-            col_data = df[col]
-            col_stats = {}
-
-            # Basic count statistics
-            col_stats['count'] = len(col_data)
-            col_stats['null_count'] = col_data.isna().sum()
-            col_stats['null_pct'] = f"{(col_data.isna().sum() / len(col_data) * 100):.2f}%"
-            col_stats['dtype'] = str(col_data.dtype)
-
-            # Try to get unique values (works for most data types)
-            try:
-                col_stats['unique'] = col_data.nunique()
-            except:
-                col_stats['unique'] = 'N/A'
-
-            # Numeric statistics when applicable
-            try:
-                # Check if data can be treated as numeric
-                numeric_data = pd.to_numeric(col_data, errors='coerce')
-                if not numeric_data.isna().all():  # Only calculate if we have some numeric values
-                    col_stats['mean'] = numeric_data.mean()
-                    col_stats['std'] = numeric_data.std()
-                    col_stats['min'] = numeric_data.min()
-                    col_stats['25%'] = numeric_data.quantile(0.25)
-                    col_stats['50%'] = numeric_data.quantile(0.5)
-                    col_stats['75%'] = numeric_data.quantile(0.75)
-                    col_stats['max'] = numeric_data.max()
-            except:
-                # Fill in N/A for statistics that couldn't be calculated
-                for stat in ['mean', 'std', 'min', '25%', '50%', '75%', 'max']:
-                    if stat not in col_stats:
-                        col_stats[stat] = 'N/A'
-
-            # Most common value statistics (categorical/object data)
-            try:
-                value_counts = col_data.value_counts(dropna=True)
-                if not value_counts.empty:
-                    top_val = value_counts.index[0]
-                    # Truncate long values
-                    col_stats['top'] = str(top_val)[:20] + "..." if len(str(top_val)) > 20 else str(top_val)
-                    col_stats['freq'] = value_counts.iloc[0]
-                else:
-                    col_stats['top'] = 'N/A'
-                    col_stats['freq'] = 'N/A'
-            except:
-                col_stats['top'] = 'N/A'
-                col_stats['freq'] = 'N/A'
-
-            # Add this column's stats to the summary DataFrame
+        # Columns are independent and the pandas/NumPy reductions release the GIL, so compute them on a thread pool
+        with ThreadPoolExecutor(max_workers=min(8, len(df.columns)) or 1) as pool:
+            column_stats = list(pool.map(summarize_column, (df[col] for col in df.columns)))
+        for col, col_stats in zip(df.columns, column_stats):
             summary[col] = pd.Series(col_stats)
 
         # Format numeric values
@@ -3637,10 +2967,23 @@ def generate_summary(data, n_clicks):
         print(f"Error in generate_summary: {str(e)}")
         return [], [], "", "", "", f"Error generating summary: {str(e)}", True
 
+# Contents of the shared notification toast: (header, icon, message)
+TOASTS = {
+    "imputation-success": ("Success", "success", "Imputation applied successfully!"),
+    "imputation-warning": ("Warning", "danger", "Please select at least one column for imputation."),
+}
+
+def toast_outputs(kind):
+    """(children, header, icon, is_open) for the global toast; None closes it and leaves its contents alone"""
+    if kind is None:
+        return dash.no_update, dash.no_update, dash.no_update, False
+    header, icon, message = TOASTS[kind]
+    return message, header, icon, True
+
 # Imputation callback
 @app.callback(
     [
-        Output("imputed-table", "data"),
+        Output("imputed-data", "data"),
         Output("imputed-table", "columns"),
         Output("imputed-table", "page_size"),
         Output("missing-values-message", "children"),
@@ -3650,11 +2993,13 @@ def generate_summary(data, n_clicks):
         Output("handle-outliers-button", "disabled"),
         Output("outliers-message", "children"),
         Output('outliers-store', 'data'),
-        Output("imputation-success-toast", "is_open"),
-        Output("imputation-warning-toast", "is_open")
+        Output("global-toast", "children"),
+        Output("global-toast", "header"),
+        Output("global-toast", "icon"),
+        Output("global-toast", "is_open"),
     ],
     [
-        Input("data-table", "data"),
+        Input("stored-data", "data"),
         Input("imputation-columns", "value"),
         Input("missing-method", "value"),
         Input("imputation-rows", "value"),
@@ -3677,12 +3022,12 @@ def handle_data_cleaning(data, selected_columns, method, rows, find_clicks, remo
                         detect_clicks, handle_clicks, apply_imputation_clicks, duplicates_data, outliers_data,
                         outlier_cols, outlier_method, outlier_threshold, outlier_handling):
     if not data:
-        return [], [], 10, "No data uploaded yet", True, "No data uploaded yet", None, True, "No data uploaded yet", None, False, False
+        return [], [], 10, "No data uploaded yet", True, "No data uploaded yet", None, True, "No data uploaded yet", None, *toast_outputs(None)
 
     ctx = dash.callback_context
-    df = pd.DataFrame(data)
+    df = frame_from_store(data)
     if df.empty:
-        return [], [], 10, "No data available", True, "No data available", None, True, "No data available", None, False, False
+        return [], [], 10, "No data available", True, "No data available", None, True, "No data available", None, *toast_outputs(None)
 
     # Initialize variables
     duplicates_message = []
@@ -3693,9 +3038,8 @@ def handle_data_cleaning(data, selected_columns, method, rows, find_clicks, remo
     handle_button_disabled = True
     outliers_store = outliers_data
 
-    # Initialize toast states
-    success_toast_open = False
-    warning_toast_open = False
+    # No notification unless imputation is applied
+    toast = None
 
     # Create a message about missing values
     missing_cols = df.columns[df.isna().any()].tolist()
@@ -3705,7 +3049,7 @@ def handle_data_cleaning(data, selected_columns, method, rows, find_clicks, remo
 
     if len(missing_cols) == 0:
         missing_message = html.Div([
-            html.I(className="fas fa-check-circle mr-2", style={"color": "#51cf66", "marginRight": "8px"}),
+            html.I(className="icon icon-check-circle mr-2", style={"color": "#51cf66", "marginRight": "8px"}),
             "No missing values detected in the dataset."
         ], style={"color": "#51cf66", "fontWeight": "500"})
     else:
@@ -3726,29 +3070,24 @@ def handle_data_cleaning(data, selected_columns, method, rows, find_clicks, remo
         if duplicate_count > 0:
             duplicates_message = [
                 html.P([
-                    html.I(className="fas fa-exclamation-triangle mr-2", style={"color": "#ff6b6b"}),
+                    html.I(className="icon icon-exclamation-triangle mr-2", style={"color": "#ff6b6b"}),
                     f"Found {duplicate_count} duplicate rows"
                 ], style={"color": "#ff6b6b"}),
                 html.P("Preview of duplicates:", style={"marginTop": "10px"}),
                 dash_table.DataTable(
                     data=duplicates.head(10).to_dict('records'),
-                    columns=[{"name": i, "id": i} for i in duplicates.columns],
+                    columns=table_columns(tuple(duplicates.columns)),
                     page_size=5,
-                    style_table={"overflowX": "auto", **custom_css["table"]},
+                    style_table=STYLES["table_scroll"],
                     style_header=custom_css["table_header"],
-                    style_cell={
-                        "backgroundColor": "#16213e",
-                        "color": "#e6e6e6",
-                        "padding": "10px",
-                        "border": "1px solid #2a3a5e"
-                    },
+                    style_cell=custom_css["table_cell"],
                 )
             ]
             remove_button_disabled = False
             duplicates_store = duplicates.to_dict('records')
         else:
             duplicates_message = html.P([
-                html.I(className="fas fa-check-circle mr-2", style={"color": "#51cf66"}),
+                html.I(className="icon icon-check-circle mr-2", style={"color": "#51cf66"}),
                 "No duplicate rows found"
             ], style={"color": "#51cf66"})
             remove_button_disabled = True
@@ -3759,7 +3098,7 @@ def handle_data_cleaning(data, selected_columns, method, rows, find_clicks, remo
         df = df.drop_duplicates()
         df_imputed = df.copy()
         duplicates_message = html.P([
-            html.I(className="fas fa-check-circle mr-2", style={"color": "#51cf66"}),
+            html.I(className="icon icon-check-circle mr-2", style={"color": "#51cf66"}),
             "Duplicate rows removed successfully"
         ], style={"color": "#51cf66"})
         remove_button_disabled = True
@@ -3769,49 +3108,39 @@ def handle_data_cleaning(data, selected_columns, method, rows, find_clicks, remo
     elif ctx.triggered and ctx.triggered[0]['prop_id'] == 'detect-outliers-button.n_clicks':
         if not outlier_cols:
             outliers_message = html.P([
-                html.I(className="fas fa-exclamation-circle mr-2", style={"color": "#ff6b6b"}),
+                html.I(className="icon icon-exclamation-circle mr-2", style={"color": "#ff6b6b"}),
                 "Please select at least one column"
             ], style={"color": "#ff6b6b"})
         else:
             outliers_dict = {}
             outlier_indices = set()
 
-            for col in outlier_cols:
-                if not pd.api.types.is_numeric_dtype(df[col]):
-                    continue
-
-                col_data = df[col].copy().dropna()
-
-                if len(col_data) <= 1:  # Skip if not enough data after dropping NA
-                    continue
-
-                if outlier_method == "iqr":
-                    # IQR method
-                    q1 = col_data.quantile(0.25)
-                    q3 = col_data.quantile(0.75)
-                    iqr = q3 - q1
-                    threshold = outlier_threshold if outlier_threshold else 1.5
-                    lower_bound = q1 - threshold * iqr
-                    upper_bound = q3 + threshold * iqr
-                    outliers = df[(df[col] < lower_bound) | (df[col] > upper_bound)][col]
-                    outlier_rows = outliers.index.tolist()
-
-                elif outlier_method == "zscore":
-                    # Z-score method
-                    threshold = outlier_threshold if outlier_threshold else 3
-
-                    # Calculate z-scores more safely
-                    mean = col_data.mean()
-                    std = col_data.std()
-
-                    # Handle case where std is 0 to avoid division by zero
-                    if std == 0:
-                        outlier_rows = []
-                    else:
-                        # Calculate z-scores manually to avoid errors
-                        z_scores = abs((df[col] - mean) / std)
-                        outlier_rows = df[z_scores > threshold].index.tolist()
-
+            # Numeric columns with enough data, scored together as one float matrix (NaN never counts as an outlier)
+            numeric_cols = [
+                col for col in outlier_cols
+                if pd.api.types.is_numeric_dtype(df[col]) and df[col].count() > 1
+            ]
+            values = df[numeric_cols].to_numpy(dtype=float)
+            outlier_mask = np.zeros(values.shape, dtype=bool)
+
+            if numeric_cols and outlier_method == "iqr":
+                # IQR method
+                threshold = outlier_threshold if outlier_threshold else 1.5
+                q1, q3 = np.nanpercentile(values, [25, 75], axis=0)
+                iqr = q3 - q1
+                outlier_mask = (values < q1 - threshold * iqr) | (values > q3 + threshold * iqr)
+
+            elif numeric_cols and outlier_method == "zscore":
+                # Z-score method
+                threshold = outlier_threshold if outlier_threshold else 3
+                mean = np.nanmean(values, axis=0)
+                std = np.nanstd(values, axis=0, ddof=1)
+                # Columns with zero spread have no outliers
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    outlier_mask = (np.abs((values - mean) / std) > threshold) & (std != 0)
+
+            for j, col in enumerate(numeric_cols):
+                outlier_rows = df.index[outlier_mask[:, j]].tolist()
                 if outlier_rows:
                     outliers_dict[col] = {
                         'outliers': df.loc[outlier_rows, col].to_dict(),
@@ -3824,7 +3153,7 @@ def handle_data_cleaning(data, selected_columns, method, rows, find_clicks, remo
                 total_outliers = len(outlier_indices)
                 outliers_message = [
                     html.P([
-                        html.I(className="fas fa-exclamation-triangle mr-2", style={"color": "#ff6b6b"}),
+                        html.I(className="icon icon-exclamation-triangle mr-2", style={"color": "#ff6b6b"}),
                         f"Found {total_outliers} rows with outliers across selected columns"
                     ], style={"color": "#ff6b6b"}),
                     html.P("Outliers summary:", style={"marginTop": "10px"}),
@@ -3835,16 +3164,11 @@ def handle_data_cleaning(data, selected_columns, method, rows, find_clicks, remo
                     html.P("Preview of rows with outliers:", style={"marginTop": "10px"}),
                     dash_table.DataTable(
                         data=df.loc[list(outlier_indices)].head(10).to_dict('records'),
-                        columns=[{"name": i, "id": i} for i in df.columns],
+                        columns=table_columns(tuple(df.columns)),
                         page_size=5,
-                        style_table={"overflowX": "auto", **custom_css["table"]},
+                        style_table=STYLES["table_scroll"],
                         style_header=custom_css["table_header"],
-                        style_cell={
-                            "backgroundColor": "#16213e",
-                            "color": "#e6e6e6",
-                            "padding": "10px",
-                            "border": "1px solid #2a3a5e"
-                        },
+                        style_cell=custom_css["table_cell"],
                     )
                 ]
                 handle_button_disabled = False
@@ -3856,7 +3180,7 @@ def handle_data_cleaning(data, selected_columns, method, rows, find_clicks, remo
                 }
             else:
                 outliers_message = html.P([
-                    html.I(className="fas fa-check-circle mr-2", style={"color": "#51cf66"}),
+                    html.I(className="icon icon-check-circle mr-2", style={"color": "#51cf66"}),
                     "No outliers found in selected columns"
                 ], style={"color": "#51cf66"})
                 handle_button_disabled = True
@@ -3871,7 +3195,7 @@ def handle_data_cleaning(data, selected_columns, method, rows, find_clicks, remo
             df = df.drop(index=outlier_indices)
             df_imputed = df.copy()
             outliers_message = html.P([
-                html.I(className="fas fa-check-circle mr-2", style={"color": "#51cf66"}),
+                html.I(className="icon icon-check-circle mr-2", style={"color": "#51cf66"}),
                 f"Removed {len(outlier_indices)} rows containing outliers"
             ], style={"color": "#51cf66"})
         else:
@@ -3885,7 +3209,7 @@ def handle_data_cleaning(data, selected_columns, method, rows, find_clicks, remo
                 df_imputed = df.copy()
 
             outliers_message = html.P([
-                html.I(className="fas fa-check-circle mr-2", style={"color": "#51cf66"}),
+                html.I(className="icon icon-check-circle mr-2", style={"color": "#51cf66"}),
                 f"Replaced outliers in {len(outliers_dict)} columns using {outlier_handling}"
             ], style={"color": "#51cf66"})
 
@@ -3895,45 +3219,46 @@ def handle_data_cleaning(data, selected_columns, method, rows, find_clicks, remo
     # Handle imputation button click
     elif ctx.triggered and ctx.triggered[0]['prop_id'] == 'apply-imputation-button.n_clicks':
         if not selected_columns:
-            warning_toast_open = True
+            toast = "imputation-warning"
         else:
             df_imputed = df.copy()
-            for col in selected_columns:
-                if pd.isna(df[col]).any():  # Only impute if there are missing values
-                    if pd.api.types.is_numeric_dtype(df[col]):
-                        if method == "mean":
-                            imputed_value = df[col].mean()
-                            df_imputed[col] = df[col].fillna(round(imputed_value, 3))
-                        elif method == "median":
-                            imputed_value = df[col].median()
-                            df_imputed[col] = df[col].fillna(round(imputed_value, 3))
-                        elif method == "knn":
-                            imputer = get_sklearn('KNNImputer')(n_neighbors=5)
-                            # Apply KNN imputation
-                            knn_imputed_values = imputer.fit_transform(df[[col]])
-                            # Convert back to DataFrame and round
-                            knn_series = pd.Series(knn_imputed_values.flatten(), index=df.index)
-                            df_imputed[col] = knn_series.round(3)
-                    else:  # Categorical or object columns
-                        if method == "mode":
-                            df_imputed[col] = df[col].fillna(df[col].mode()[0] if not df[col].mode().empty else np.nan)
-
-            success_toast_open = True
+            # Only impute columns that have missing values; numeric and categorical columns are filled in one call each
+            missing = [col for col in selected_columns if df[col].isna().any()]
+            numeric_missing = [col for col in missing if pd.api.types.is_numeric_dtype(df[col])]
+            other_missing = [col for col in missing if col not in numeric_missing]
+
+            if numeric_missing:
+                if method == "mean":
+                    df_imputed[numeric_missing] = df[numeric_missing].fillna(df[numeric_missing].mean().round(3))
+                elif method == "median":
+                    df_imputed[numeric_missing] = df[numeric_missing].fillna(df[numeric_missing].median().round(3))
+                elif method == "knn":
+                    imputer = get_sklearn('KNNImputer')(n_neighbors=5, keep_empty_features=True)
+                    # One KNN fit over all selected numeric columns, so neighbours are found across features
+                    knn_imputed_values = imputer.fit_transform(df[numeric_missing].to_numpy(dtype=float))
+                    df_imputed[numeric_missing] = pd.DataFrame(knn_imputed_values, index=df.index, columns=numeric_missing).round(3)
+
+            if other_missing and method == "mode":
+                modes = df[other_missing].mode()
+                if not modes.empty:
+                    df_imputed[other_missing] = df[other_missing].fillna(modes.iloc[0])
+
+            toast = "imputation-success"
 
     # Prepare table data
-    columns = [{"name": col, "id": col} for col in df_imputed.columns]
-    data = df_imputed.to_dict("records")
+    columns = table_columns(tuple(df_imputed.columns))
+    data = df_to_store(df_imputed)
 
     # Handle row display
-    page_size = len(data) if rows == "all" and len(data) > 0 else (rows if rows else 10)
+    page_size = len(df_imputed) if rows == "all" and len(df_imputed) > 0 else (rows if rows else 10)
 
-    if len(data) == 0:
+    if len(df_imputed) == 0:
         missing_message = html.P(
             "Warning: The dataset is empty after applying operations.",
             style={"color": "#ff6b6b"}
         )
 
-    return data, columns, page_size, missing_message, remove_button_disabled, duplicates_message, duplicates_store, handle_button_disabled, outliers_message, outliers_store, success_toast_open, warning_toast_open
+    return data, columns, page_size, missing_message, remove_button_disabled, duplicates_message, duplicates_store, handle_button_disabled, outliers_message, outliers_store, *toast_outputs(toast)
 
 # Statistics Callback - Updated with only histogram, scatter, bar, and pie charts
 @app.callback(
@@ -3948,17 +3273,41 @@ def handle_data_cleaning(data, selected_columns, method, rows, find_clicks, remo
         Input("y-axis-dropdown", "value"),
         Input("plot-type-dropdown", "value"),
         Input("bin-size-slider", "value"),
-        Input("data-table", "data"),
+        Input("stored-data", "data"),
+    ],
+    [
+        State("session-id", "data"),
+        State("statistics-error", "is_open"),
     ],
 )
-def generate_plots(n_clicks, x_axis, y_axis, plot_type, bin_size, data):
+def generate_plots(n_clicks, x_axis, y_axis, plot_type, bin_size, data, session_id, error_shown):
     if not n_clicks or not data:
+        drop_resampled(session_id, "statistics-plot")
         fig = go.Figure()
         return apply_dark_theme(fig), "", False
 
-    df = pd.DataFrame(data)
-    fig = go.Figure()
+    # Only the bin count changed on a drawn histogram: patch nbinsx instead of rebuilding and resending the figure.
+    # Anything build_statistics_plot would not draw as a histogram (or a failed last render) takes the full path
+    ctx = dash.callback_context
+    if (plot_type == "histogram" and x_axis and not error_shown and ctx.triggered
+            and ctx.triggered[0]["prop_id"] == "bin-size-slider.value"):
+        df = frame_from_store(data)
+        if (x_axis in df.columns and pd.api.types.is_numeric_dtype(df[x_axis])
+                and df[x_axis].dropna().nunique() != 2):
+            patch = dash.Patch()
+            patch["data"][0]["nbinsx"] = bin_size if bin_size else 20
+            return patch, "", False
+
+    params = (plot_type, x_axis, y_axis, bin_size if plot_type == "histogram" else None)
+    return cached_plot_outputs(
+        "statistics-plot", data, params,
+        lambda: build_statistics_plot(frame_from_store(data), x_axis, y_axis, plot_type, bin_size),
+        session_id,
+    )
 
+def build_statistics_plot(df, x_axis, y_axis, plot_type, bin_size):
+    """(figure, error message, error shown) for the statistics plot"""
+    fig = go.Figure()
     try:
         # Histogram
         if plot_type == "histogram":
@@ -4003,7 +3352,9 @@ def generate_plots(n_clicks, x_axis, y_axis, plot_type, bin_size, data):
                 return go.Figure(), "Please select both X-axis and Y-axis for scatter plot.", True
             if not pd.api.types.is_numeric_dtype(df[x_axis]) or not pd.api.types.is_numeric_dtype(df[y_axis]):
                 return go.Figure(), "Both X-axis and Y-axis must be numeric for scatter plots.", True
-            fig = px.scatter(df, x=x_axis, y=y_axis, title=f"Scatter Plot of {y_axis} vs {x_axis}")
+            # px writes each trace's marker colour itself, so the theme palette has to be passed in (colorway won't apply)
+            fig = px.scatter(df, x=x_axis, y=y_axis, title=f"Scatter Plot of {y_axis} vs {x_axis}",
+                             color_discrete_sequence=DARK_THEME_COLORS)
 
         # Bar Chart
         elif plot_type == "bar":
@@ -4022,74 +3373,112 @@ def generate_plots(n_clicks, x_axis, y_axis, plot_type, bin_size, data):
 
     return fig, "", False
 
-# Download callback
-@app.callback(
-    Output("download-data", "data"),
-    [Input("download-button", "n_clicks")],
-    [State("data-table", "data")],
-    prevent_initial_call=True,
-)
-def download_data(n_clicks, data):
-    if not data:
-        return None
-
-    df = pd.DataFrame(data)
-    return dcc.send_data_frame(df.to_csv, "processed_data.csv")
+# Graphs whose figures may be served through a FigureResampler. The regression and correlation-test plots are
+# point clouds, which LTTB would thin to the extreme y of each x bucket; scatter_trace renders them through WebGL instead
+RESAMPLED_GRAPHS = ("statistics-plot",)
+
+def update_resampled_plot(graph_id):
+    """Build the zoom/pan callback that re-aggregates a resampled graph from its full data"""
+    def callback(relayout_data, session_id):
+        if not relayout_data:
+            return dash.no_update
+        fig = load_resampled(session_id, graph_id)
+        if fig is None:
+            return dash.no_update
+        return fig.construct_update_data_patch(relayout_data)
+    return callback
+
+# Re-aggregate resampled plots on zoom/pan
+for graph_id in RESAMPLED_GRAPHS:
+    app.callback(
+        Output(graph_id, "figure", allow_duplicate=True),
+        Input(graph_id, "relayoutData"),
+        State("session-id", "data"),
+        prevent_initial_call=True,
+    )(update_resampled_plot(graph_id))
+
+# Download buttons of the import and imputation sections: button id -> (source store, format, filename, writer options)
+DOWNLOAD_BUTTONS = {
+    "download-button": ("stored-data", "csv", "processed_data.csv", {}),
+    "export-excel-button": ("stored-data", "excel", "data_export.xlsx", {"sheet_name": "Data"}),
+    "export-json-button": ("stored-data", "json", "data_export.json", {}),
+    "export-csv-button": ("stored-data", "csv", "data_export.csv", {"index": False}),
+    "download-imputed-csv-button": ("imputed-data", "csv", "imputed_data.csv", {"index": False}),
+    "download-imputed-json-button": ("imputed-data", "json", "imputed_data.json", {}),
+    "download-imputed-excel-button": ("imputed-data", "excel", "imputed_data.xlsx", {"sheet_name": "Imputed Data", "index": False}),
+}
 
-# Excel export callback
+# Generated download payloads, keyed by dataset digest, format, filename and writer options
+_DOWNLOAD_CACHE = LRUCache(8)
+
+def send_dataframe(df, file_format, filename, **kwargs):
+    """dcc.Download payload for a DataFrame in the given format"""
+    if file_format == "json":
+        return dict(content=df.to_json(orient="records"), filename=filename)
+    if file_format == "excel":
+        # xlsxwriter writes workbooks considerably faster than openpyxl (pandas' default)
+        if find_spec("xlsxwriter") is not None:
+            kwargs.setdefault("engine", "xlsxwriter")
+        return dcc.send_data_frame(df.to_excel, filename, **kwargs)
+    return dcc.send_data_frame(df.to_csv, filename, **kwargs)
+
+def send_store(payload, file_format, filename, **kwargs):
+    """send_dataframe for a store payload, reusing the file generated for the same dataset and options"""
+    digest = store_digest(payload)
+    if digest is None:
+        return send_dataframe(frame_from_store(payload), file_format, filename, **kwargs)
+
+    key = (digest, file_format, filename, tuple(sorted(kwargs.items())))
+    result = _DOWNLOAD_CACHE.get(key)
+    if result is None:
+        result = _DOWNLOAD_CACHE.put(key, send_dataframe(frame_from_store(payload), file_format, filename, **kwargs))
+    return result
+
+# Single download callback for all dataset download/export buttons
 @app.callback(
-    Output("export-excel", "data"),
-    [Input("export-excel-button", "n_clicks")],
-    [State("data-table", "data")],
+    Output("unified-download", "data"),
+    [Input(button_id, "n_clicks") for button_id in DOWNLOAD_BUTTONS],
+    [State("stored-data", "data"), State("imputed-data", "data")],
     prevent_initial_call=True,
 )
-def export_excel(n_clicks, data):
-    if not data:
+def download_dataset(*args):
+    stored_data, imputed_data = args[-2:]
+    button_id = dash.callback_context.triggered_id
+    if button_id not in DOWNLOAD_BUTTONS:
         return None
-
-    df = pd.DataFrame(data)
-    return dcc.send_data_frame(df.to_excel, "data_export.xlsx", sheet_name="Data")
-
-# JSON export callback
-@app.callback(
-    Output("export-json", "data"),
-    [Input("export-json-button", "n_clicks")],
-    [State("data-table", "data")],
-    prevent_initial_call=True,
-)
-def export_json(n_clicks, data):
+    store_id, file_format, filename, options = DOWNLOAD_BUTTONS[button_id]
+    data = stored_data if store_id == "stored-data" else imputed_data
     if not data:
         return None
 
-    df = pd.DataFrame(data)
-    return dict(content=df.to_json(orient="records"), filename="data_export.json")
-
-# CSV export callback
-@app.callback(
-    Output("export-csv", "data"),
-    [Input("export-csv-button", "n_clicks")],
-    [State("data-table", "data")],
-    prevent_initial_call=True,
-)
-def export_csv(n_clicks, data):
-    if not data:
-        return None
+    return send_store(data, file_format, filename, **options)
 
-    df = pd.DataFrame(data)
-    return dcc.send_data_frame(df.to_csv, "data_export.csv", index=False)
+# Auto-visualization dashboards, keyed by the store_digest of the dataset they were built from
+_AUTO_VIZ_CACHE = LRUCache(4)
 
 # Auto-visualization callback
 @app.callback(
     Output("auto-visualizations", "children"),
-    [Input("data-table", "data"), Input("statistics-button", "n_clicks")],
+    [Input("stored-data", "data"), Input("statistics-button", "n_clicks")],
     prevent_initial_call=True
 )
 def generate_auto_visualizations(data, statistics_clicks):
     if not data or not statistics_clicks:
         return html.Div("Please upload data to see visualizations")
 
+    key = store_digest(data)
+    if key is None:
+        return build_auto_visualizations(data)
+
+    dashboard = _AUTO_VIZ_CACHE.get(key)
+    if dashboard is None:
+        dashboard = _AUTO_VIZ_CACHE.put(key, build_auto_visualizations(data))
+    return dashboard
+
+def build_auto_visualizations(data):
+    """Build the auto-visualization dashboard for a stored dataset"""
     try:
-        df = pd.DataFrame(data)
+        df = frame_from_store(data)
         if df.empty:
             return html.Div("No data available to visualize")
 
@@ -4168,33 +3557,39 @@ def generate_auto_visualizations(data, statistics_clicks):
             # Create individual distribution dashboards for each column
             col = numeric_cols[i]
 
+            # Column distribution; ±inf (read_csv parses "inf") can't be binned, so only finite values are used
+            hist_data = df[col].to_numpy(dtype=float, na_value=np.nan)
+            hist_data = hist_data[np.isfinite(hist_data)]
+            if len(hist_data) <= 5:  # Skip columns without enough data to plot
+                continue
+
             fig_dist = go.Figure()
 
-            # Column distribution
-            hist_data = df[col].dropna()
-            if len(hist_data) > 5:  # Only plot if we have enough data
-                fig_dist.add_trace(
-                    go.Histogram(
-                        x=hist_data,
-                        nbinsx=20,
-                        marker=dict(
-                            color='#1abc9c',
-                            line=dict(color='#16a085', width=2)
-                        ),
-                        opacity=0.85
-                    )
+            # Bin server-side so the figure carries 20 bars instead of every raw value
+            counts, edges = np.histogram(hist_data, bins=20)
+            fig_dist.add_trace(
+                go.Bar(
+                    x=(edges[:-1] + edges[1:]) / 2,
+                    y=counts,
+                    width=np.diff(edges) * 0.95,
+                    marker=dict(
+                        color='#1abc9c',
+                        line=dict(color='#16a085', width=2)
+                    ),
+                    opacity=0.85
                 )
-                # Add mean line
-                mean = hist_data.mean()
-                fig_dist.add_trace(
-                    go.Scatter(
-                        x=[mean, mean],
-                        y=[0, 1],  # y-range will be auto-scaled
-                        mode='lines',
-                        line=dict(color='#3498db', width=2, dash='dash'),
-                        name='Mean'
-                    )
+            )
+            # Add mean line
+            mean = hist_data.mean()
+            fig_dist.add_trace(
+                go.Scatter(
+                    x=[mean, mean],
+                    y=[0, counts.max()],
+                    mode='lines',
+                    line=dict(color='#3498db', width=2, dash='dash'),
+                    name='Mean'
                 )
+            )
 
             fig_dist.update_layout(
                 title=f"Distribution Analysis: {col}",
@@ -4336,7 +3731,7 @@ def generate_auto_visualizations(data, statistics_clicks):
         Input("test-type-dropdown", "value"),
         Input("test-x-dropdown", "value"),
         Input("test-y-dropdown", "value"),
-        Input("data-table", "data"),
+        Input("stored-data", "data"),
     ],
 )
 def perform_test(n_clicks, test_type, x_axis, y_axis, data):
@@ -4344,7 +3739,13 @@ def perform_test(n_clicks, test_type, x_axis, y_axis, data):
         fig = go.Figure()
         return apply_dark_theme(fig), "Select test type, variables, and click 'Perform Test'.", [], []
 
-    df = pd.DataFrame(data)
+    return cached_plot_outputs(
+        "test-plot", data, (test_type, x_axis, y_axis),
+        lambda: run_test(frame_from_store(data), test_type, x_axis, y_axis)
+    )
+
+def run_test(df, test_type, x_axis, y_axis):
+    """(figure, result text, table data, table columns) for a statistical test"""
     result_text = ""
     table_data = []
     columns = []
@@ -4355,11 +3756,10 @@ def perform_test(n_clicks, test_type, x_axis, y_axis, data):
             if not y_axis:
                 return go.Figure(), "Please select Y-axis for Chi-squared Test.", [], []
 
-            # Direct import of chi2_contingency to avoid circular imports
-            from scipy.stats import chi2_contingency
+            chi2_contingency = get_scipy('chi2_contingency')
 
             contingency_table = pd.crosstab(df[x_axis], df[y_axis])
-            chi2, p, dof, expected = chi2_contingency(contingency_table)
+            chi2, p, dof, expected = cached_stat(chi2_contingency, contingency_table)
 
             fig = go.Figure(
                 data=go.Heatmap(
@@ -4378,7 +3778,7 @@ def perform_test(n_clicks, test_type, x_axis, y_axis, data):
             expected_df["Type"] = "Expected"
             combined_df = pd.concat([observed_df, expected_df])
 
-            columns = [{"name": col, "id": col} for col in combined_df.columns]
+            columns = table_columns(tuple(combined_df.columns))
             table_data = combined_df.reset_index().to_dict("records")
 
             result_text = f"Chi-squared Statistic: {chi2:.3f}, p-value: {p:.3f}, Degrees of Freedom: {dof}"
@@ -4395,8 +3795,8 @@ def perform_test(n_clicks, test_type, x_axis, y_axis, data):
             if len(df_valid) < 2:
                 return go.Figure(), "Not enough valid data points for Pearson correlation.", [], []
 
-            from scipy.stats import pearsonr
-            corr, p_value = pearsonr(df_valid[x_axis], df_valid[y_axis])
+            pearsonr = get_scipy('pearsonr')
+            corr, p_value = cached_stat(pearsonr, df_valid[x_axis], df_valid[y_axis])
 
             fig = make_subplots(rows=1, cols=2,
                                subplot_titles=('Scatter Plot with Regression Line', 'Density Distribution'),
@@ -4404,7 +3804,7 @@ def perform_test(n_clicks, test_type, x_axis, y_axis, data):
                                column_widths=[0.7, 0.3])
 
             fig.add_trace(
-                go.Scatter(
+                scatter_trace(
                     x=df_valid[x_axis],
                     y=df_valid[y_axis],
                     mode='markers',
@@ -4426,7 +3826,7 @@ def perform_test(n_clicks, test_type, x_axis, y_axis, data):
             line_y = coef[0] * line_x + coef[1]
 
             fig.add_trace(
-                go.Scatter(
+                scatter_trace(
                     x=line_x,
                     y=line_y,
                     mode='lines',
@@ -4495,8 +3895,8 @@ def perform_test(n_clicks, test_type, x_axis, y_axis, data):
             if len(df_valid) < 2:
                 return go.Figure(), "Not enough valid data points for Spearman correlation.", [], []
 
-            from scipy.stats import spearmanr
-            corr, p_value = spearmanr(df_valid[x_axis], df_valid[y_axis])
+            spearmanr = get_scipy('spearmanr')
+            corr, p_value = cached_stat(spearmanr, df_valid[x_axis], df_valid[y_axis])
 
             fig = make_subplots(rows=1, cols=2,
                                subplot_titles=('Scatter Plot with LOWESS Trend', 'Rank Correlation'),
@@ -4504,7 +3904,7 @@ def perform_test(n_clicks, test_type, x_axis, y_axis, data):
                                column_widths=[0.7, 0.3])
 
             fig.add_trace(
-                go.Scatter(
+                scatter_trace(
                     x=df_valid[x_axis],
                     y=df_valid[y_axis],
                     mode='markers',
@@ -4522,10 +3922,10 @@ def perform_test(n_clicks, test_type, x_axis, y_axis, data):
             )
 
             try:
-                from statsmodels.nonparametric.smoothers_lowess import lowess
-                lowess_result = lowess(df_valid[y_axis], df_valid[x_axis], frac=0.5)
+                lowess = get_statsmodels('lowess')
+                lowess_result = cached_stat(lowess, df_valid[y_axis], df_valid[x_axis], frac=0.5)
                 fig.add_trace(
-                    go.Scatter(
+                    scatter_trace(
                         x=lowess_result[:, 0],
                         y=lowess_result[:, 1],
                         mode='lines',
@@ -4541,7 +3941,7 @@ def perform_test(n_clicks, test_type, x_axis, y_axis, data):
             y_rank = df_valid[y_axis].rank()
 
             fig.add_trace(
-                go.Scatter(
+                scatter_trace(
                     x=x_rank,
                     y=y_rank,
                     mode='markers',
@@ -4607,7 +4007,7 @@ def perform_test(n_clicks, test_type, x_axis, y_axis, data):
         Input("calculate-regression", "n_clicks"),
         Input("regression-x-dropdown", "value"),
         Input("regression-y-dropdown", "value"),
-        Input("data-table", "data"),
+        Input("stored-data", "data"),
     ],
 )
 def perform_regression(n_clicks, x_var, y_var, data):
@@ -4615,9 +4015,14 @@ def perform_regression(n_clicks, x_var, y_var, data):
         fig = go.Figure()
         return apply_dark_theme(fig), "", "", "", False
 
-    try:
-        df = pd.DataFrame(data)
+    return cached_plot_outputs(
+        "regression-plot", data, (x_var, y_var),
+        lambda: fit_regression(frame_from_store(data), x_var, y_var)
+    )
 
+def fit_regression(df, x_var, y_var):
+    """Outputs of perform_regression (figure, equation, metrics, error message, error shown) for one x/y pair"""
+    try:
         # Check if variables are numeric
         if not pd.api.types.is_numeric_dtype(df[x_var]) or not pd.api.types.is_numeric_dtype(df[y_var]):
             return go.Figure(), "", "", "Both variables must be numeric for regression analysis.", True
@@ -4633,6 +4038,7 @@ def perform_regression(n_clicks, x_var, y_var, data):
         y = df[y_var].values
 
         # Add constant for intercept
+        sm = get_statsmodels('api')
         X_with_const = sm.add_constant(X)
 
         # Fit the model
@@ -4644,16 +4050,12 @@ def perform_regression(n_clicks, x_var, y_var, data):
         slope = results.params[1]
         r_squared = results.rsquared
 
-        # Calculate confidence intervals
-        predictions = results.get_prediction(X_with_const)
-        ci = predictions.conf_int()
-
         # Create the plot
         fig = go.Figure()
 
         # Add scatter plot of data points
         fig.add_trace(
-            go.Scatter(
+            scatter_trace(
                 x=df[x_var],
                 y=df[y_var],
                 mode='markers',
@@ -4671,7 +4073,7 @@ def perform_regression(n_clicks, x_var, y_var, data):
         y_pred = slope * x_range + intercept
 
         fig.add_trace(
-            go.Scatter(
+            scatter_trace(
                 x=x_range,
                 y=y_pred,
                 mode='lines',
@@ -4686,7 +4088,7 @@ def perform_regression(n_clicks, x_var, y_var, data):
         ci = predictions.conf_int()
 
         fig.add_trace(
-            go.Scatter(
+            scatter_trace(
                 x=x_range,
                 y=ci[:, 0],
                 mode='lines',
@@ -4696,7 +4098,7 @@ def perform_regression(n_clicks, x_var, y_var, data):
         )
 
         fig.add_trace(
-            go.Scatter(
+            scatter_trace(
                 x=x_range,
                 y=ci[:, 1],
                 mode='lines',
@@ -4711,7 +4113,9 @@ def perform_regression(n_clicks, x_var, y_var, data):
             title=f"Linear Regression: {y_var} vs {x_var}",
             xaxis_title=x_var,
             yaxis_title=y_var,
-            hovermode='closest'
+            hovermode='closest',
+            # Keep the user's zoom/pan when the same variables are refit; a new pair resets the view
+            uirevision=f"{x_var}|{y_var}",
         )
 
         # Format equation
@@ -4742,6 +4146,35 @@ def perform_regression(n_clicks, x_var, y_var, data):
     except Exception as e:
         return go.Figure(), "", "", f"Error performing regression: {str(e)}", True
 
+# Fitted OLS results keyed by a store_digest of the dataset and the x/y pair; the prediction
+# callback fires on every edit of the input value, which would otherwise refit each time
+_OLS_CACHE = LRUCache(4)
+
+def fit_ols(data, x_var, y_var):
+    """statsmodels OLS results of y_var on x_var (with a constant) over the complete rows of a store payload"""
+    digest = store_digest(data)
+    key = (digest, x_var, y_var)
+    if digest is not None:
+        results = _OLS_CACHE.get(key)
+        if results is not None:
+            return results
+
+    df = frame_from_store(data)
+    if not pd.api.types.is_numeric_dtype(df[x_var]) or not pd.api.types.is_numeric_dtype(df[y_var]):
+        raise ValueError("Variables must be numeric")
+
+    # Drop any rows with missing values
+    df = df[[x_var, y_var]].dropna()
+    if len(df) < 2:
+        raise ValueError("Not enough data points")
+
+    sm = get_statsmodels('api')
+    results = sm.OLS(df[y_var].values, sm.add_constant(df[x_var].values.reshape(-1, 1))).fit()
+
+    if digest is not None:
+        _OLS_CACHE.put(key, results)
+    return results
+
 @app.callback(
     [
         Output("prediction-result", "children"),
@@ -4752,7 +4185,7 @@ def perform_regression(n_clicks, x_var, y_var, data):
         Input("prediction-input", "value"),
         Input("regression-x-dropdown", "value"),
         Input("regression-y-dropdown", "value"),
-        Input("data-table", "data"),
+        Input("stored-data", "data"),
     ],
 )
 def make_prediction(n_clicks, x_value, x_var, y_var, data):
@@ -4760,25 +4193,7 @@ def make_prediction(n_clicks, x_value, x_var, y_var, data):
         return "", False
 
     try:
-        df = pd.DataFrame(data)
-
-        # Check if variables are numeric
-        if not pd.api.types.is_numeric_dtype(df[x_var]) or not pd.api.types.is_numeric_dtype(df[y_var]):
-            return "Error: Variables must be numeric", True
-
-        # Drop any rows with missing values
-        df = df[[x_var, y_var]].dropna()
-
-        if len(df) < 2:
-            return "Error: Not enough data points", True
-
-        # Perform regression
-        X = df[x_var].values.reshape(-1, 1)
-        y = df[y_var].values
-
-        X_with_const = sm.add_constant(X)
-        model = sm.OLS(y, X_with_const)
-        results = model.fit()
+        results = fit_ols(data, x_var, y_var)
 
         # Make prediction
         x_new = np.array([[1, float(x_value)]])
@@ -4805,16 +4220,16 @@ def make_prediction(n_clicks, x_value, x_var, y_var, data):
         Output("regression-x-dropdown", "options"),
         Output("regression-y-dropdown", "options"),
     ],
-    [Input("data-table", "data")],
+    [Input("stored-data", "data")],
 )
 def update_regression_dropdowns(data):
     if not data:
         return [], []
 
     try:
-        df = pd.DataFrame(data)
+        df = frame_from_store(data)
         numeric_cols = df.select_dtypes(include=['number']).columns
-        options = [{"label": html.Span(col, style={"color": "#FFFFFF"}), "value": col} for col in numeric_cols]
+        options = [{"label": col, "value": col} for col in numeric_cols]
         return options, options
     except Exception as e:
         print(f"Error updating regression dropdowns: {str(e)}")
@@ -4826,66 +4241,63 @@ def generate_eda_report_components(df):
     components = []
 
     # ---- 1. OVERVIEW SECTION ----
-    overview_card = dbc.Card([
-        dbc.CardHeader("Dataset Overview", style=custom_css["card_header"]),
-        dbc.CardBody([
-            dbc.Row([
-                dbc.Col([
-                    html.H5("Basic Information", style={"color": "var(--primary)", "marginBottom": "15px"}),
-                    html.P(f"Number of Rows: {df.shape[0]}", style={"color": "var(--text-primary)", "marginBottom": "5px"}),
-                    html.P(f"Number of Columns: {df.shape[1]}", style={"color": "var(--text-primary)", "marginBottom": "5px"}),
-                    html.P(f"Duplicate Rows: {df.duplicated().sum()}", style={"color": "var(--text-primary)", "marginBottom": "5px"}),
-                    html.P(f"Total Missing Values: {df.isna().sum().sum()}", style={"color": "var(--text-primary)", "marginBottom": "15px"}),
-
-                    html.H5("Data Types", style={"color": "var(--primary)", "marginBottom": "15px", "marginTop": "20px"}),
-                    dbc.Table(
-                        # Create a table with column names and their data types
-                        [
-                            html.Thead(html.Tr([html.Th("Column"), html.Th("Type")])),
-                            html.Tbody([
-                                html.Tr([
-                                    html.Td(col, style={"color": "var(--text-primary)"}),
-                                    html.Td(str(df[col].dtype), style={"color": "var(--text-primary)"})
-                                ]) for col in df.columns
-                            ])
-                        ],
-                        bordered=True,
-                        hover=True,
-                        responsive=True,
-                        size="sm",
-                        style={"backgroundColor": "var(--card-bg)", "color": "var(--text-primary)"}
-                    ),
-                ], width=6),
+    overview_card = card("Dataset Overview", [
+        dbc.Row([
+            dbc.Col([
+                html.H5("Basic Information", style={"color": "var(--primary)", "marginBottom": "15px"}),
+                html.P(f"Number of Rows: {df.shape[0]}", style={"color": "var(--text-primary)", "marginBottom": "5px"}),
+                html.P(f"Number of Columns: {df.shape[1]}", style={"color": "var(--text-primary)", "marginBottom": "5px"}),
+                html.P(f"Duplicate Rows: {df.duplicated().sum()}", style={"color": "var(--text-primary)", "marginBottom": "5px"}),
+                html.P(f"Total Missing Values: {df.isna().sum().sum()}", style={"color": "var(--text-primary)", "marginBottom": "15px"}),
+
+                html.H5("Data Types", style={"color": "var(--primary)", "marginBottom": "15px", "marginTop": "20px"}),
+                dbc.Table(
+                    # Create a table with column names and their data types
+                    [
+                        html.Thead(html.Tr([html.Th("Column"), html.Th("Type")])),
+                        html.Tbody([
+                            html.Tr([
+                                html.Td(col, style={"color": "var(--text-primary)"}),
+                                html.Td(str(df[col].dtype), style={"color": "var(--text-primary)"})
+                            ]) for col in df.columns
+                        ])
+                    ],
+                    bordered=True,
+                    hover=True,
+                    responsive=True,
+                    size="sm",
+                    style={"backgroundColor": "var(--card-bg)", "color": "var(--text-primary)"}
+                ),
+            ], width=6),
 
-                dbc.Col([
-                    html.H5("Missing Values by Column", style={"color": "var(--primary)", "marginBottom": "15px"}),
-                    dcc.Graph(
-                        figure=apply_dark_theme(
-                            px.bar(
-                                df.isna().sum().reset_index(),
-                                x="index",
-                                y=0,
-                                labels={"index": "Column", "0": "Missing Values"},
-                                title="Missing Values Count",
-                                height=300
-                            )
+            dbc.Col([
+                html.H5("Missing Values by Column", style={"color": "var(--primary)", "marginBottom": "15px"}),
+                dcc.Graph(
+                    figure=apply_dark_theme(
+                        px.bar(
+                            df.isna().sum().reset_index(),
+                            x="index",
+                            y=0,
+                            labels={"index": "Column", "0": "Missing Values"},
+                            title="Missing Values Count",
+                            height=300
                         )
-                    ),
+                    )
+                ),
 
-                    html.H5("Dataset Warnings", style={"color": "var(--primary)", "marginBottom": "15px", "marginTop": "20px"}),
-                    html.Ul([
-                        # Check for various potential issues in the dataset
-                        html.Li(f"Constant columns: {sum(df.nunique() == 1)}",
-                                style={"color": "var(--text-primary)"}),
-                        html.Li(f"Columns with >50% missing values: {sum(df.isna().mean() > 0.5)}",
-                                style={"color": "var(--warning)" if sum(df.isna().mean() > 0.5) > 0 else "var(--text-primary)"}),
-                        html.Li(f"High cardinality categorical columns: {sum([df[col].nunique() > 50 for col in df.select_dtypes(include=['object']).columns] if not df.select_dtypes(include=['object']).empty else [])}",
-                                style={"color": "var(--warning)" if sum([df[col].nunique() > 50 for col in df.select_dtypes(include=['object']).columns] if not df.select_dtypes(include=['object']).empty else []) > 0 else "var(--text-primary)"}),
-                    ])
-                ], width=6)
-            ])
+                html.H5("Dataset Warnings", style={"color": "var(--primary)", "marginBottom": "15px", "marginTop": "20px"}),
+                html.Ul([
+                    # Check for various potential issues in the dataset
+                    html.Li(f"Constant columns: {sum(df.nunique() == 1)}",
+                            style={"color": "var(--text-primary)"}),
+                    html.Li(f"Columns with >50% missing values: {sum(df.isna().mean() > 0.5)}",
+                            style={"color": "var(--warning)" if sum(df.isna().mean() > 0.5) > 0 else "var(--text-primary)"}),
+                    html.Li(f"High cardinality categorical columns: {sum([df[col].nunique() > 50 for col in df.select_dtypes(include=['object']).columns] if not df.select_dtypes(include=['object']).empty else [])}",
+                            style={"color": "var(--warning)" if sum([df[col].nunique() > 50 for col in df.select_dtypes(include=['object']).columns] if not df.select_dtypes(include=['object']).empty else []) > 0 else "var(--text-primary)"}),
+                ])
+            ], width=6)
         ])
-    ], style=custom_css["card"])
+    ])
 
     components.append(dbc.Row([dbc.Col(overview_card, width=12)], className="mb-4"))
 
@@ -4905,19 +4317,16 @@ def generate_eda_report_components(df):
             if col != 'Column':
                 desc_df[col] = desc_df[col].round(3)
 
-        stats_card = dbc.Card([
-            dbc.CardHeader("Numerical Statistics", style=custom_css["card_header"]),
-            dbc.CardBody([
-                dbc.Table.from_dataframe(
-                    desc_df,
-                    striped=True,
-                    bordered=True,
-                    hover=True,
-                    responsive=True,
-                    style={"backgroundColor": "var(--card-bg)", "color": "var(--text-primary)"}
-                )
-            ])
-        ], style=custom_css["card"])
+        stats_card = card("Numerical Statistics", [
+            dbc.Table.from_dataframe(
+                desc_df,
+                striped=True,
+                bordered=True,
+                hover=True,
+                responsive=True,
+                style={"backgroundColor": "var(--card-bg)", "color": "var(--text-primary)"}
+            )
+        ])
 
         components.append(dbc.Row([dbc.Col(stats_card, width=12)], className="mb-4"))
 
@@ -4964,7 +4373,7 @@ def generate_eda_report_components(df):
             )
 
         cat_stats_card = dbc.Card([
-            dbc.CardHeader("Categorical Variables", style=custom_css["card_header"]),
+            dbc.CardHeader("Categorical Variables", className="dash-card-header"),
             dbc.CardBody(cat_stats_rows)
         ], style=custom_css["card"])
 
@@ -5002,7 +4411,7 @@ def generate_eda_report_components(df):
             hist_rows.append(dbc.Row(row_figs, className="mb-4"))
 
         hist_card = dbc.Card([
-            dbc.CardHeader("Distribution of Numeric Variables", style=custom_css["card_header"]),
+            dbc.CardHeader("Distribution of Numeric Variables", className="dash-card-header"),
             dbc.CardBody(hist_rows)
         ], style=custom_css["card"])
 
@@ -5022,12 +4431,9 @@ def generate_eda_report_components(df):
             aspect="auto"
         )
 
-        corr_card = dbc.Card([
-            dbc.CardHeader("Correlation Heatmap", style=custom_css["card_header"]),
-                        dbc.CardBody([
-                            dcc.Graph(figure=apply_dark_theme(corr_fig))
-                        ])
-        ], style=custom_css["card"])
+        corr_card = card("Correlation Heatmap", [
+                        dcc.Graph(figure=apply_dark_theme(corr_fig))
+                    ])
 
         # Add correlation card to the components
         components.append(dbc.Row([dbc.Col(corr_card, width=12)], className="mb-4"))
@@ -5038,7 +4444,7 @@ def generate_eda_report_components(df):
 @app.callback(
     Output("eda-report-container", "children"),
     [Input("generate-report-button", "n_clicks")],
-    [State("data-table", "data")],
+    [State("stored-data", "data")],
     prevent_initial_call=True
 )
 def generate_eda_report(n_clicks, data):
@@ -5047,7 +4453,7 @@ def generate_eda_report(n_clicks, data):
 
     try:
         # Convert data to DataFrame
-        df = pd.DataFrame(data)
+        df = frame_from_store(data)
 
         if df.empty:
             return html.Div("No data available to analyze.")
@@ -5081,18 +4487,6 @@ def generate_eda_report(n_clicks, data):
             html.P(f"An error occurred: {str(e)}", style={"color": "var(--text-secondary)"})
         ])
 
-# Update plot type dropdown options
-@app.callback(
-    Output("plot-type-dropdown", "options"),
-    [Input("data-table", "data")]
-)
-def update_plot_type_dropdown(data):
-    return [
-        {"label": html.Span("Histogram", style={"color": "#FFFFFF"}), "value": "histogram"},
-        {"label": html.Span("Scatter Plot", style={"color": "#FFFFFF"}), "value": "scatter"},
-        {"label": html.Span("Bar Chart", style={"color": "#FFFFFF"}), "value": "bar"},
-    ]
-
 # Update axis dropdowns based on plot type
 @app.callback(
     [
@@ -5103,7 +4497,7 @@ def update_plot_type_dropdown(data):
     ],
     [
         Input("plot-type-dropdown", "value"),
-        Input("data-table", "data"),
+        Input("stored-data", "data"),
     ],
     prevent_initial_call=True
 )
@@ -5111,7 +4505,7 @@ def update_axis_dropdowns(plot_type, data):
     if not data:
         return [], [], True, "Select Y-axis"
 
-    df = pd.DataFrame(data)
+    df = frame_from_store(data)
 
     # Get column types for options
     numeric_cols = [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col])]
@@ -5156,7 +4550,7 @@ def update_axis_dropdowns(plot_type, data):
     ],
     [
         Input("test-type-dropdown", "value"),
-        Input("data-table", "data"),
+        Input("stored-data", "data"),
     ],
     prevent_initial_call=True
 )
@@ -5164,7 +4558,7 @@ def update_test_dropdowns(test_type, data):
     if not data or not test_type:
         return [], [], None, None
 
-    df = pd.DataFrame(data)
+    df = frame_from_store(data)
 
     # Reset dropdown values
     x_value = None
@@ -5175,8 +4569,8 @@ def update_test_dropdowns(test_type, data):
     numeric_cols = [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col])]
 
     # Format dropdown options
-    categorical_options = [{"label": html.Span(col, style={"color": "#FFFFFF"}), "value": col} for col in categorical_cols]
-    numeric_options = [{"label": html.Span(col, style={"color": "#FFFFFF"}), "value": col} for col in numeric_cols]
+    categorical_options = [{"label": col, "value": col} for col in categorical_cols]
+    numeric_options = [{"label": col, "value": col} for col in numeric_cols]
 
     # Select options based on test type
     if test_type == "chi2":
@@ -5187,45 +4581,24 @@ def update_test_dropdowns(test_type, data):
         return numeric_options, numeric_options, x_value, y_value
     else:
         # Default case
-        all_options = [{"label": html.Span(col, style={"color": "#FFFFFF"}), "value": col} for col in df.columns]
+        all_options = [{"label": col, "value": col} for col in df.columns]
         return all_options, all_options, x_value, y_value
 
-# Add a callback to handle the Apply Imputation button click
-@app.callback(
-    [
-        Output("imputation-success-toast", "is_open", allow_duplicate=True),
-        Output("imputation-warning-toast", "is_open", allow_duplicate=True),
-    ],
-    [Input("apply-imputation-button", "n_clicks")],
-    [State("imputation-columns", "value")],
-    prevent_initial_call=True
-)
-def handle_imputation_button(n_clicks, selected_columns):
-    if not n_clicks:
-        return False, False
-
-    # Show warning if no columns selected
-    if not selected_columns:
-        return False, True
-    else:
-        # Show success toast if columns were selected
-        return True, False
-
 # Update prediction dropdowns with column options
 @app.callback(
     [
         Output("prediction-target-dropdown", "options"),
         Output("prediction-features-dropdown", "options"),
     ],
-    [Input("data-table", "data")],
+    [Input("stored-data", "data")],
 )
 def update_prediction_dropdowns(data):
     if not data:
         return [], []
 
     try:
-        df = pd.DataFrame(data)
-        options = [{"label": html.Span(col, style={"color": "#FFFFFF"}), "value": col} for col in df.columns]
+        df = frame_from_store(data)
+        options = [{"label": col, "value": col} for col in df.columns]
         return options, options
     except Exception as e:
         print(f"Error updating prediction dropdowns: {str(e)}")
@@ -5262,12 +4635,11 @@ def create_manual_input_fields(selected_features, feature_info, model_info):
                         "marginBottom": "5px",
                         "display": "block"
                     }),
-                    dcc.Dropdown(
+                    dark_dropdown(
                         id={"type": "manual-input", "feature": feature},
-                        options=[{"label": html.Span(str(cat), style={"color": "#FFFFFF"}), "value": str(cat)} for cat in categories],
+                        options=[{"label": str(cat), "value": str(cat)} for cat in categories],
                         placeholder=f"Select {feature}",
-                        style={"marginBottom": "15px", **custom_css["dropdown"]},
-                        className='dropdown-dark custom-dropdown'
+                        style=dropdown_style(marginBottom="15px"),
                     )
                 ], style={"marginBottom": "15px"})
             )
@@ -5284,7 +4656,7 @@ def create_manual_input_fields(selected_features, feature_info, model_info):
                         id={"type": "manual-input", "feature": feature},
                         type="number",
                         placeholder=f"Enter value for {feature}",
-                        style={"marginBottom": "15px", **custom_css["dropdown"]}
+                        style=dropdown_style(marginBottom="15px")
                     )
                 ], style={"marginBottom": "15px"})
             )
@@ -5302,7 +4674,7 @@ def create_manual_input_fields(selected_features, feature_info, model_info):
     ],
     [Input("train-model-button", "n_clicks")],
     [
-        State("data-table", "data"),
+        State("stored-data", "data"),
         State("prediction-target-dropdown", "value"),
         State("prediction-features-dropdown", "value"),
         State("n-estimators-input", "value"),
@@ -5316,50 +4688,63 @@ def train_model(n_clicks, data, target, features, n_estimators, max_depth, test_
         return None, None, None, "", True
 
     try:
-        df = pd.DataFrame(data)
+        df = frame_from_store(data)
 
         # Handle missing values
         df = df.dropna(subset=[target] + features)
 
         if len(df) < 10:
             return None, None, None, html.Div([
-                html.I(className="fas fa-exclamation-circle mr-2", style={"color": "#ff6b6b"}),
+                html.I(className="icon icon-exclamation-circle mr-2", style={"color": "#ff6b6b"}),
                 "Not enough data after removing missing values. Need at least 10 rows."
             ], style={"color": "#ff6b6b"}), True
 
-        # Prepare feature information for encoding/preprocessing
+        # Prepare feature information for encoding/preprocessing; encoded columns are collected and framed once
         feature_info = {}
-        X_processed = pd.DataFrame()
+        encoded_columns = {}
+
+        # Standardize all numeric features in one vectorized pass (sample std, zero-variance columns left unscaled)
+        numeric_features = [feature for feature in features if pd.api.types.is_numeric_dtype(df[feature])]
+        numeric_index = {feature: i for i, feature in enumerate(numeric_features)}
+        if numeric_features:
+            values = df[numeric_features].to_numpy(dtype=float)
+            means = values.mean(axis=0)
+            stds = values.std(axis=0, ddof=1)
+            stds = np.where(stds > 0, stds, 1.0)
+            standardized = (values - means) / stds
 
         # Process each feature
         for feature in features:
-            if pd.api.types.is_numeric_dtype(df[feature]):
-                # For numeric features, just store type and use as is
+            if feature in numeric_index:
+                i = numeric_index[feature]
                 feature_info[feature] = {
                     "type": "numeric",
-                    "mean": float(df[feature].mean()),
-                    "std": float(df[feature].std()) if df[feature].std() > 0 else 1.0
+                    "mean": float(means[i]),
+                    "std": float(stds[i])
                 }
-                # Normalize numeric features
-                X_processed[feature] = (df[feature] - feature_info[feature]["mean"]) / feature_info[feature]["std"]
+                encoded_columns[feature] = standardized[:, i]
             else:
-                # For categorical features, store categories and one-hot encode
-                unique_values = df[feature].unique().tolist()
+                # For categorical features, store categories (in order of first appearance) and one-hot encode
+                codes, uniques = pd.factorize(df[feature])
+                unique_values = uniques.tolist()
                 feature_info[feature] = {
                     "type": "categorical",
                     "categories": unique_values
                 }
-                # One-hot encode categorical features
-                for category in unique_values:
-                    col_name = f"{feature}_{category}"
-                    X_processed[col_name] = (df[feature] == category).astype(int)
+                # One-hot encode from the integer codes in a single broadcast
+                one_hot = (codes[:, None] == np.arange(len(unique_values))).astype(int)
+                for j, category in enumerate(unique_values):
+                    encoded_columns[f"{feature}_{category}"] = one_hot[:, j]
+
+        X_processed = pd.DataFrame(encoded_columns, index=df.index)
 
         # Process target variable
         y = df[target]
-        if not pd.api.types.is_numeric_dtype(y) and len(y.unique()) <= 10:
-            # For categorical target, encode as numeric
-            target_mapping = {val: i for i, val in enumerate(y.unique())}
-            y_encoded = y.map(target_mapping)
+        if not pd.api.types.is_numeric_dtype(y) and y.nunique() <= 10:
+            # For categorical target, encode as numeric (codes in order of first appearance)
+            codes, uniques = pd.factorize(y)
+            target_mapping = {val: i for i, val in enumerate(uniques)}
+            y_encoded = pd.Series(codes, index=y.index)
             target_info = {
                 "type": "categorical",
                 "mapping": target_mapping,
@@ -5419,7 +4804,7 @@ def train_model(n_clicks, data, target, features, n_estimators, max_depth, test_
         # Create status message with metrics
         status = html.Div([
             html.Div([
-                html.I(className="fas fa-check-circle mr-2", style={"color": "#51cf66"}),
+                html.I(className="icon icon-check-circle mr-2", style={"color": "#51cf66"}),
                 "Model trained successfully!"
             ], style={"color": "#51cf66", "fontWeight": "bold", "marginBottom": "15px"}),
 
@@ -5446,7 +4831,7 @@ def train_model(n_clicks, data, target, features, n_estimators, max_depth, test_
         return model_info, feature_info, metrics, status, False
     except Exception as e:
         error_message = html.Div([
-            html.I(className="fas fa-exclamation-circle mr-2", style={"color": "#ff6b6b"}),
+            html.I(className="icon icon-exclamation-circle mr-2", style={"color": "#ff6b6b"}),
             f"Error training model: {str(e)}"
         ], style={"color": "#ff6b6b"})
 
@@ -5473,7 +4858,7 @@ def process_prediction_file(contents, filename, required_features):
 
     try:
         if "csv" in filename.lower():
-            df = pd.read_csv(StringIO(decoded.decode("utf-8")))
+            df = read_csv_bytes(decoded)
         elif "xls" in filename.lower():
             df = pd.read_excel(io.BytesIO(decoded))
         else:
@@ -5511,7 +4896,7 @@ def process_prediction_file(contents, filename, required_features):
 def make_predictions(manual_clicks, file_clicks, manual_values, manual_ids, file_data, model_info, feature_info):
     if not model_info or not feature_info:
         return html.Div([
-            html.I(className="fas fa-exclamation-circle mr-2", style={"color": "#ff6b6b"}),
+            html.I(className="icon icon-exclamation-circle mr-2", style={"color": "#ff6b6b"}),
             "Please train a model first"
         ], style={"color": "#ff6b6b"})
 
@@ -5531,7 +4916,7 @@ def make_predictions(manual_clicks, file_clicks, manual_values, manual_ids, file
             # Process manual input
             if not manual_values or not manual_ids:
                 return html.Div([
-                    html.I(className="fas fa-exclamation-circle mr-2", style={"color": "#ff6b6b"}),
+                    html.I(className="icon icon-exclamation-circle mr-2", style={"color": "#ff6b6b"}),
                     "Please fill all input fields"
                 ], style={"color": "#ff6b6b"})
 
@@ -5548,7 +4933,7 @@ def make_predictions(manual_clicks, file_clicks, manual_values, manual_ids, file
             # Process file input
             if not file_data:
                 return html.Div([
-                    html.I(className="fas fa-exclamation-circle mr-2", style={"color": "#ff6b6b"}),
+                    html.I(className="icon icon-exclamation-circle mr-2", style={"color": "#ff6b6b"}),
                     "Please upload a file for prediction"
                 ], style={"color": "#ff6b6b"})
 
@@ -5563,7 +4948,7 @@ def make_predictions(manual_clicks, file_clicks, manual_values, manual_ids, file
         for feature in features:
             if feature not in prediction_df.columns:
                 return html.Div([
-                    html.I(className="fas fa-exclamation-circle mr-2", style={"color": "#ff6b6b"}),
+                    html.I(className="icon icon-exclamation-circle mr-2", style={"color": "#ff6b6b"}),
                     f"Missing feature: {feature}"
                 ], style={"color": "#ff6b6b"})
 
@@ -5577,9 +4962,11 @@ def make_predictions(manual_clicks, file_clicks, manual_values, manual_ids, file
             else:
                 # One-hot encode categorical features
                 categories = feature_info[feature]["categories"]
-                for category in categories:
-                    col_name = f"{feature}_{category}"
-                    X_processed[col_name] = (prediction_df[feature].astype(str) == str(category)).astype(int)
+                # Compare against every category in one broadcast instead of re-casting the column per category
+                values = prediction_df[feature].astype(str).to_numpy()
+                one_hot = (values[:, None] == np.array([str(c) for c in categories], dtype=object)).astype(int)
+                for i, category in enumerate(categories):
+                    X_processed[f"{feature}_{category}"] = one_hot[:, i]
 
         # Check for missing columns that were in training data
         if button_id == "predict-button-file":
@@ -5608,27 +4995,16 @@ def make_predictions(manual_clicks, file_clicks, manual_values, manual_ids, file
             # Return results for file prediction
             results_table = dash_table.DataTable(
                 data=prediction_df.assign(Prediction=predictions).to_dict('records'),
-                columns=[{"name": col, "id": col} for col in prediction_df.columns] + [{"name": "Prediction", "id": "Prediction"}],
+                columns=table_columns(tuple(prediction_df.columns)) + [{"name": "Prediction", "id": "Prediction"}],
                 page_size=10,
-                style_table={"overflowX": "auto", **custom_css["table"]},
+                style_table=STYLES["table_scroll"],
                 style_header=custom_css["table_header"],
-                style_cell={
-                    "backgroundColor": "#16213e",
-                    "color": "#e6e6e6",
-                    "padding": "10px",
-                    "border": "1px solid #2a3a5e"
-                },
-                style_data_conditional=[
-                    {
-                        "if": {"row_index": "odd"},
-                        "backgroundColor": "#1a1a2e"
-                    }
-                ],
+                style_cell=custom_css["table_cell"],
             )
 
             return html.Div([
                 html.Div([
-                    html.I(className="fas fa-check-circle mr-2", style={"color": "#51cf66"}),
+                    html.I(className="icon icon-check-circle mr-2", style={"color": "#51cf66"}),
                     f"Predictions completed for {len(prediction_df)} rows"
                 ], style={"color": "#51cf66", "fontWeight": "bold", "marginBottom": "15px"}),
                 results_table
@@ -5656,7 +5032,7 @@ def make_predictions(manual_clicks, file_clicks, manual_values, manual_ids, file
 
                 result = html.Div([
                     html.Div([
-                        html.I(className="fas fa-magic mr-2", style={"color": "#1abc9c"}),
+                        html.I(className="icon icon-magic mr-2", style={"color": "#1abc9c"}),
                         "Prediction Result:"
                     ], style={"color": "#1abc9c", "fontWeight": "bold", "marginBottom": "15px", "fontSize": "18px"}),
 
@@ -5681,7 +5057,7 @@ def make_predictions(manual_clicks, file_clicks, manual_values, manual_ids, file
 
                 result = html.Div([
                     html.Div([
-                        html.I(className="fas fa-magic mr-2", style={"color": "#1abc9c"}),
+                        html.I(className="icon icon-magic mr-2", style={"color": "#1abc9c"}),
                         "Prediction Result:"
                     ], style={"color": "#1abc9c", "fontWeight": "bold", "marginBottom": "15px", "fontSize": "18px"}),
 
@@ -5702,69 +5078,27 @@ def make_predictions(manual_clicks, file_clicks, manual_values, manual_ids, file
 
     except Exception as e:
         return html.Div([
-            html.I(className="fas fa-exclamation-circle mr-2", style={"color": "#ff6b6b"}),
+            html.I(className="icon icon-exclamation-circle mr-2", style={"color": "#ff6b6b"}),
             f"Error making prediction: {str(e)}"
         ], style={"color": "#ff6b6b"})
 
-# Callback for downloading imputed data as CSV
-@app.callback(
-    Output("download-imputed-csv", "data"),
-    [Input("download-imputed-csv-button", "n_clicks")],
-    [State("imputed-table", "data")],
-    prevent_initial_call=True,
-)
-def download_imputed_csv(n_clicks, data):
-    if not data:
-        return None
-
-    df = pd.DataFrame(data)
-    return dcc.send_data_frame(df.to_csv, "imputed_data.csv", index=False)
-
-# Callback for downloading imputed data as JSON
-@app.callback(
-    Output("download-imputed-json", "data"),
-    [Input("download-imputed-json-button", "n_clicks")],
-    [State("imputed-table", "data")],
-    prevent_initial_call=True,
-)
-def download_imputed_json(n_clicks, data):
-    if not data:
-        return None
-
-    df = pd.DataFrame(data)
-    return dict(content=df.to_json(orient="records"), filename="imputed_data.json")
-
-# Callback for downloading imputed data as Excel
-@app.callback(
-    Output("download-imputed-exc el", "data"),
-    [Input("download-imputed-excel-button", "n_clicks")],
-    [State("imputed-table", "data")],
-    prevent_initial_call=True,
-)
-def download_imputed_excel(n_clicks, data):
-    if not data:
-        return None
-
-    df = pd.DataFrame(data)
-    return dcc.send_data_frame(df.to_excel, "imputed_data.xlsx", sheet_name="Imputed Data", index=False)
-
 # Populate encoding column dropdown with categorical columns
 @app.callback(
     Output("encoding_column_dropdown", "options"),
-    [Input("data-table", "data")],
+    [Input("stored-data", "data")],
 )
 def update_encoding_column_options(data):
     if not data:
         return []
     import pandas as pd
-    df = pd.DataFrame(data)
+    df = frame_from_store(data)
     categorical_cols = [col for col in df.columns if not pd.api.types.is_numeric_dtype(df[col])]
     return [{"label": col, "value": col} for col in categorical_cols]
 
 # Show/hide ordinal order input
 @app.callback(
     Output("encoding_ordinal_container", "children"),
-    [Input("encoding_method_dropdown", "value"), Input("encoding_column_dropdown", "value"), Input("data-table", "data")],
+    [Input("encoding_method_dropdown", "value"), Input("encoding_column_dropdown", "value"), Input("stored-data", "data")],
 )
 def show_ordinal_order_input(encoding_type, col, data):
     import pandas as pd
@@ -5773,38 +5107,35 @@ def show_ordinal_order_input(encoding_type, col, data):
     if encoding_type != "ordinal" or not col or not data:
         style["display"] = "none"
         # Still return the dropdown, but hidden
-        return dcc.Dropdown(
+        return dark_dropdown(
             id="encoding_ordinal_dropdown",
             options=[],
             value=[],
             multi=True,
             style=style,
-            className='dropdown-dark custom-dropdown'
         )
-    df = pd.DataFrame(data)
+    df = frame_from_store(data)
     if col not in df.columns:
         style["display"] = "none"
-        return dcc.Dropdown(
+        return dark_dropdown(
             id="encoding_ordinal_dropdown",
             options=[],
             value=[],
             multi=True,
             style=style,
-            className='dropdown-dark custom-dropdown'
         )
     unique_vals = list(map(str, sorted(df[col].dropna().unique(), key=str)))
     # Always show all unique values as options, and set value to all unique values (sorted)
     # Prevent removal by disabling options (Dash doesn't support reorder-only natively), so we add a note
     return [
         html.Label("Specify Order for Ordinal Encoding (all values required, drag to reorder):", style={"color": "#e6e6e6", "fontWeight": "bold", "marginBottom": "8px"}),
-        dcc.Dropdown(
+        dark_dropdown(
             id="encoding_ordinal_dropdown",
             options=[{"label": v, "value": v, "disabled": False} for v in unique_vals],
             value=unique_vals,
             multi=True,
             placeholder="Drag to reorder (top=lowest, bottom=highest)",
             style=style,
-            className='dropdown-dark custom-dropdown'
         ),
         html.Div("(All values must be present. Drag to reorder. If you remove a value, it will be restored.)", style={"color": "#aaa", "fontSize": "12px", "marginTop": "5px"})
     ]
@@ -5822,7 +5153,7 @@ def show_ordinal_order_input(encoding_type, col, data):
         Input("encoding_show_encoded_toggle", "value"),
     ],
     [
-        State("data-table", "data"),
+        State("stored-data", "data"),
         State("encoding_column_dropdown", "value"),
         State("encoding_method_dropdown", "value"),
         State("encoding_data_store", "data"),
@@ -5841,7 +5172,7 @@ def apply_encoding(n_clicks, show_encoded_only, data, column, encoding_type, sto
         if not column or not encoding_type:
             return [], [], html.Div("Please select a column and encoding method", style={"color": "red"}), None
 
-        df = pd.DataFrame(data)
+        df = frame_from_store(data)
 
         try:
             # Create a copy of the original dataframe
@@ -5850,13 +5181,13 @@ def apply_encoding(n_clicks, show_encoded_only, data, column, encoding_type, sto
 
             # Apply the selected encoding
             if encoding_type == "label":
-                # Label encoding
-                le = LabelEncoder()
-                encoded_df[f"{column}_encoded"] = le.fit_transform(df[column])
+                # Label encoding (sorted codes, same as sklearn's LabelEncoder: missing values are their own, last class)
+                codes, classes = pd.factorize(df[column], sort=True, use_na_sentinel=False)
+                encoded_df[f"{column}_encoded"] = codes
                 encoded_column = encoded_df[f"{column}_encoded"]
 
                 # Create a mapping dictionary for display
-                mapping = {i: label for i, label in enumerate(le.classes_)}
+                mapping = {i: label for i, label in enumerate(classes)}
                 mapping_str = ", ".join([f"{k}: {v}" for k, v in mapping.items()])
 
                 message = html.Div([
@@ -5866,7 +5197,7 @@ def apply_encoding(n_clicks, show_encoded_only, data, column, encoding_type, sto
 
                 # Store data for download
                 store_data = {
-                    "full_df": encoded_df.to_dict("records"),
+                    "full_df": df_to_store(encoded_df),
                     "column_name": column,
                     "encoded_column": {f"{column}_encoded": encoded_df[f"{column}_encoded"].tolist()},
                     "encoding_type": "label",
@@ -5893,7 +5224,7 @@ def apply_encoding(n_clicks, show_encoded_only, data, column, encoding_type, sto
 
                 # Store data for download
                 store_data = {
-                    "full_df": encoded_df.to_dict("records"),
+                    "full_df": df_to_store(encoded_df),
                     "column_name": column,
                     "encoded_column": dummies.to_dict("records"),
                     "encoding_type": "onehot",
@@ -5923,7 +5254,7 @@ def apply_encoding(n_clicks, show_encoded_only, data, column, encoding_type, sto
 
                 # Store data for download
                 store_data = {
-                    "full_df": encoded_df.to_dict("records"),
+                    "full_df": df_to_store(encoded_df),
                     "column_name": column,
                     "encoded_column": {f"{column}_ordinal": encoded_df[f"{column}_ordinal"].tolist()},
                     "encoding_type": "ordinal",
@@ -5933,7 +5264,7 @@ def apply_encoding(n_clicks, show_encoded_only, data, column, encoding_type, sto
             # Return based on show_encoded_only toggle
             if not show_encoded_only:
                 # Show full dataframe
-                columns = [{"name": col, "id": col} for col in encoded_df.columns]
+                columns = table_columns(tuple(encoded_df.columns))
                 return encoded_df.to_dict("records"), columns, message, store_data
             else:
                 # Show only encoded columns
@@ -5941,13 +5272,13 @@ def apply_encoding(n_clicks, show_encoded_only, data, column, encoding_type, sto
                     # For one-hot, show original column and all dummy columns
                     display_cols = [column] + list(dummies.columns)
                     display_df = encoded_df[display_cols]
-                    columns = [{"name": col, "id": col} for col in display_df.columns]
+                    columns = table_columns(tuple(display_df.columns))
                     return display_df.to_dict("records"), columns, message, store_data
                 else:
                     # For label and ordinal, show original and encoded column
                     encoded_col_name = f"{column}_encoded" if encoding_type == "label" else f"{column}_ordinal"
                     display_df = encoded_df[[column, encoded_col_name]]
-                    columns = [{"name": col, "id": col} for col in display_df.columns]
+                    columns = table_columns(tuple(display_df.columns))
                     return display_df.to_dict("records"), columns, message, store_data
 
         except Exception as e:
@@ -5955,13 +5286,13 @@ def apply_encoding(n_clicks, show_encoded_only, data, column, encoding_type, sto
 
     elif trigger_id == "encoding_show_encoded_toggle" and stored_encoded_df:
         # Toggle between showing all columns or only encoded columns
-        df = pd.DataFrame(stored_encoded_df["full_df"])
+        df = df_from_store(stored_encoded_df["full_df"])
         encoding_type = stored_encoded_df["encoding_type"]
         column_name = stored_encoded_df["column_name"]
 
         if not show_encoded_only:
             # Show full dataframe
-            columns = [{"name": col, "id": col} for col in df.columns]
+            columns = table_columns(tuple(df.columns))
             return df.to_dict("records"), columns, dash.no_update, stored_encoded_df
         else:
             # Show only encoded columns
@@ -5970,14 +5301,14 @@ def apply_encoding(n_clicks, show_encoded_only, data, column, encoding_type, sto
                 new_columns = stored_encoded_df.get("new_columns", [])
                 display_cols = [column_name] + new_columns
                 display_df = df[display_cols]
-                columns = [{"name": col, "id": col} for col in display_df.columns]
+                columns = table_columns(tuple(display_df.columns))
                 return display_df.to_dict("records"), columns, dash.no_update, stored_encoded_df
             else:
                 # For label and ordinal, show original and encoded column
                 encoded_col_name = f"{column_name}_encoded" if encoding_type == "label" else f"{column_name}_ordinal"
                 if encoded_col_name in df.columns:
                     display_df = df[[column_name, encoded_col_name]]
-                    columns = [{"name": col, "id": col} for col in display_df.columns]
+                    columns = table_columns(tuple(display_df.columns))
                     return display_df.to_dict("records"), columns, dash.no_update, stored_encoded_df
                 else:
                     return [], [], html.Div("Encoded column not found", style={"color": "red"}), stored_encoded_df
@@ -5995,7 +5326,7 @@ def download_encoded_csv(n_clicks, stored_data):
     if not stored_data:
         return None
 
-    df = pd.DataFrame(stored_data["full_df"])
+    df = df_from_store(stored_data["full_df"])
     return dcc.send_data_frame(df.to_csv, "encoded_data.csv", index=False)
 
 # Download encoded data as JSON
@@ -6009,7 +5340,7 @@ def download_encoded_json(n_clicks, stored_data):
     if not stored_data:
         return None
 
-    df = pd.DataFrame(stored_data["full_df"])
+    df = df_from_store(stored_data["full_df"])
     return dcc.send_data_frame(df.to_json, "encoded_data.json", orient="records", date_format="iso")
 
 # Download encoded data as Excel
@@ -6023,7 +5354,7 @@ def download_encoded_excel(n_clicks, stored_data):
     if not stored_data:
         return None
 
-    df = pd.DataFrame(stored_data["full_df"])
+    df = df_from_store(stored_data["full_df"])
     return dcc.send_data_frame(df.to_excel, "encoded_data.xlsx", sheet_name="Encoded Data", index=False)
 
 # Main entry point
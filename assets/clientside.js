@@ -0,0 +1,56 @@
+// Clientside callbacks (registered from app.py via ClientsideFunction)
+
+// id of the sidebar link that fired the callback, falling back to the first input (the welcome link)
+function triggeredNavId(ctx) {
+    if (ctx.triggered.length && ctx.triggered[0].prop_id !== ".") {
+        return ctx.triggered[0].prop_id.split(".")[0];
+    }
+    return ctx.inputs_list[0].id;
+}
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    nav: {
+        // Highlight the clicked sidebar link; returns the `active` flags followed by the classNames
+        highlight: function () {
+            const ctx = window.dash_clientside.callback_context;
+            const current = triggeredNavId(ctx);
+            const active = ctx.inputs_list.map(function (input) { return input.id === current; });
+            return active.concat(active.map(function (isActive) {
+                return isActive ? "nav-button active" : "nav-button";
+            }));
+        },
+        // Show the content section of the clicked sidebar link and hide the others
+        showSection: function () {
+            const ctx = window.dash_clientside.callback_context;
+            const current = triggeredNavId(ctx);
+            return ctx.inputs_list.map(function (input) {
+                return input.id === current
+                    ? {"display": "block", "opacity": "1", "animation": "fade-in 0.5s ease-out"}
+                    : {"display": "none", "opacity": "0"};
+            });
+        }
+    },
+    session: {
+        // Random id for this tab, kept in sessionStorage; left alone once set so the store doesn't re-fire
+        ensureId: function (timestamp, current) {
+            if (current) {
+                return window.dash_clientside.no_update;
+            }
+            if (window.crypto && window.crypto.randomUUID) {
+                return window.crypto.randomUUID();
+            }
+            return Date.now().toString(36) + Math.random().toString(36).slice(2);
+        }
+    },
+    plots: {
+        // Show the control blocks listed for the selected plot type in the visibility map; hide the rest
+        toggleControls: function (plotType, visibilityMap) {
+            const visible = (visibilityMap || {})[plotType] || [];
+            return window.dash_clientside.callback_context.outputs_list.map(function (output) {
+                return visible.indexOf(output.id) !== -1
+                    ? {"display": "block", "marginBottom": "25px"}
+                    : {"display": "none"};
+            });
+        }
+    }
+});